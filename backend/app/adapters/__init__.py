@@ -3,10 +3,28 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Tuple
 
+from app.metrics import instrument_adapter_method
+from app.scheduler import scheduled
+from app.tracing import traced
+
+# Adapter methods that are timed, scheduled and traced automatically in every subclass
+INSTRUMENTED_METHODS = (
+    "transcribe_audio", "summarize_text", "generate_bullets", "suggest_tags", "research_section",
+)
+
 
 class ModelAdapter(ABC):
     """Abstract base class for AI model adapters."""
     
+    def __init_subclass__(cls, **kwargs):
+        """Wrap the subclass's own adapter methods with call metrics, scheduling and spans."""
+        super().__init_subclass__(**kwargs)
+        for name in INSTRUMENTED_METHODS:
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "__isabstractmethod__", False):
+                method = scheduled(instrument_adapter_method(cls.__name__, name, method))
+                setattr(cls, name, traced(f"{cls.__name__}.{name}")(method))
+    
     @abstractmethod
     async def transcribe_audio(self, audio_path: Path) -> str:
         """Transcribe audio file to text.
@@ -54,3 +72,18 @@ class ModelAdapter(ABC):
             List of (tag, confidence) tuples
         """
         pass
+    
+    async def research_section(self, title: str, brief: str, text: str) -> str:
+        """Write one section of an idea's research report.
+        
+        Adapters without a dedicated prompt fall back to summarize_text.
+        
+        Args:
+            title: Section title (e.g. "Competitive Landscape")
+            brief: What the section should cover
+            text: Idea transcript, plus earlier sections for synthesis
+            
+        Returns:
+            Section text
+        """
+        return await self.summarize_text(f"{title}: {brief}\n\n{text}")
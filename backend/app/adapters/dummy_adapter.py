@@ -39,6 +39,10 @@ MOCK_TAGS = [
 class DummyAdapter(ModelAdapter):
     """Mock adapter for testing without API keys."""
     
+    def __init__(self, api_key: str | None = None):
+        """Accept (and ignore) an API key, like every adapter."""
+        pass
+    
     async def transcribe_audio(self, audio_path: Path) -> str:
         """Return a random mock transcript."""
         return random.choice(MOCK_TRANSCRIPTS)
@@ -66,3 +70,8 @@ class DummyAdapter(ModelAdapter):
         """Return random subset of mock tags."""
         num_tags = random.randint(3, 6)
         return random.sample(MOCK_TAGS, min(num_tags, len(MOCK_TAGS)))
+    
+    async def research_section(self, title: str, brief: str, text: str) -> str:
+        """Return a mock section built from the brief and the idea's opening."""
+        opening = text.replace("\n", " ").split(".")[0].strip()
+        return f"{title} (mock research). {brief} Based on: \"{opening[:120]}\"."
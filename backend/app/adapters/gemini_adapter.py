@@ -7,8 +7,43 @@ from langchain_core.messages import HumanMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from app.adapters import ModelAdapter
+from app.audio_formats import detect_mime
 from app.config import get_settings
-from app.logger import logger
+from app.logger import get_logger
+from app.tracing import start_span
+
+logger = get_logger(__name__)
+
+
+def parse_bullets(response: str) -> List[str]:
+    """Parse a bullet-list model response into at most 8 bullets."""
+    bullets = []
+    for line in response.strip().split("\n"):
+        line = line.strip()
+        if line.startswith("- "):
+            bullets.append(line[2:])
+        elif line.startswith("• "):
+            bullets.append(line[2:])
+        elif line and not line.startswith("#"):
+            bullets.append(line)
+    
+    return bullets[:8]  # Limit to 8
+
+
+def parse_tags(response: str) -> List[Tuple[str, float]]:
+    """Parse "TAG: CONFIDENCE" lines into at most 6 (tag, confidence) pairs."""
+    tags = []
+    for line in response.strip().split("\n"):
+        if ":" in line:
+            parts = line.split(":")
+            tag = parts[0].strip().strip("-•")
+            try:
+                confidence = float(parts[1].strip())
+                tags.append((tag, min(1.0, max(0.0, confidence))))
+            except (ValueError, IndexError):
+                tags.append((tag, 0.7))
+    
+    return tags[:6]
 
 
 class GeminiAdapter(ModelAdapter):
@@ -54,12 +89,19 @@ class GeminiAdapter(ModelAdapter):
         
         # Add audio if provided (as base64 for multimodal)
         if audio_path and audio_path.exists():
-            with open(audio_path, "rb") as f:
-                audio_data = base64.b64encode(f.read()).decode("utf-8")
+            with start_span("audio.read_base64") as span:
+                with open(audio_path, "rb") as f:
+                    raw_audio = f.read()
+                mime_type = detect_mime(raw_audio)
+                if mime_type == "application/octet-stream":
+                    mime_type = "audio/webm"  # the recorder's default
+                audio_data = base64.b64encode(raw_audio).decode("utf-8")
+                if span:
+                    span.set_attribute("audio.encoded_bytes", len(audio_data))
             
             content.append({
                 "type": "media",
-                "mime_type": "audio/mpeg",
+                "mime_type": mime_type,
                 "data": audio_data,
             })
         
@@ -69,7 +111,7 @@ class GeminiAdapter(ModelAdapter):
         # Create message and invoke
         message = HumanMessage(content=content)
         
-        logger.debug(f"Invoking LangChain Gemini with prompt: {prompt[:100]}...")
+        logger.debug("Invoking LangChain Gemini with prompt: %s...", prompt[:100])
         
         # Use ainvoke for async
         response = await self.llm.ainvoke([message])
@@ -82,7 +124,7 @@ class GeminiAdapter(ModelAdapter):
         Include all spoken words exactly as said.
         Do not add any commentary or formatting, just the raw transcription."""
         
-        logger.info(f"Transcribing audio: {audio_path}")
+        logger.info("Transcribing audio: %s", audio_path)
         return await self._invoke(prompt, audio_path)
     
     async def summarize_text(self, text: str) -> str:
@@ -107,19 +149,7 @@ Text:
 Bullet points:"""
         
         response = await self._invoke(prompt)
-        
-        # Parse bullet points
-        bullets = []
-        for line in response.strip().split("\n"):
-            line = line.strip()
-            if line.startswith("- "):
-                bullets.append(line[2:])
-            elif line.startswith("• "):
-                bullets.append(line[2:])
-            elif line and not line.startswith("#"):
-                bullets.append(line)
-        
-        return bullets[:8]  # Limit to 8
+        return parse_bullets(response)
     
     async def suggest_tags(self, text: str) -> List[Tuple[str, float]]:
         """Suggest tags using Gemini via LangChain."""
@@ -137,17 +167,21 @@ Text:
 Tags:"""
         
         response = await self._invoke(prompt)
+        return parse_tags(response)
+    
+    async def research_section(self, title: str, brief: str, text: str) -> str:
+        """Write a research report section using Gemini via LangChain."""
+        prompt = f"""You are a startup analyst writing one section of a research report on a product idea.
+
+Section: {title}
+Cover: {brief}
+
+Be specific and concise (150-300 words). Use short paragraphs or "- " bullets.
+Return ONLY the section body, without the section title.
+
+Idea:
+{text}
+
+Section:"""
         
-        # Parse tags
-        tags = []
-        for line in response.strip().split("\n"):
-            if ":" in line:
-                parts = line.split(":")
-                tag = parts[0].strip().strip("-•")
-                try:
-                    confidence = float(parts[1].strip())
-                    tags.append((tag, min(1.0, max(0.0, confidence))))
-                except (ValueError, IndexError):
-                    tags.append((tag, 0.7))
-        
-        return tags[:6]
+        return await self._invoke(prompt)
@@ -0,0 +1,90 @@
+"""Adapter Registry - resolves adapter names to classes on first use.
+
+Adapters are registered as "module:Class" references and only imported
+when first requested, so starting the app (or using only the dummy
+adapter) never loads LangChain. Third-party packages can add adapters
+through the ``idea_tracker.adapters`` entry point group::
+
+    [project.entry-points."idea_tracker.adapters"]
+    myadapter = "my_package.adapter:MyAdapter"
+"""
+import importlib
+import threading
+from importlib.metadata import entry_points
+from typing import Dict, List, Optional, Type
+
+from app.adapters import ModelAdapter
+
+ENTRY_POINT_GROUP = "idea_tracker.adapters"
+
+# Built-in adapters (imported lazily)
+BUILTIN_ADAPTERS: Dict[str, str] = {
+    "dummy": "app.adapters.dummy_adapter:DummyAdapter",
+    "gemini": "app.adapters.gemini_adapter:GeminiAdapter",
+    "replay": "app.adapters.replay_adapter:ReplayAdapter",
+}
+
+_references: Optional[Dict[str, str]] = None
+_classes: Dict[str, Type[ModelAdapter]] = {}
+_lock = threading.Lock()
+
+
+def _load_references() -> Dict[str, str]:
+    """Built-ins plus entry points (entry points are listed, not imported)."""
+    global _references
+    if _references is None:
+        references = dict(BUILTIN_ADAPTERS)
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            references.setdefault(entry_point.name, entry_point.value)
+        _references = references
+    return _references
+
+
+def register_adapter(name: str, reference: str) -> None:
+    """Register an adapter by "module:Class" reference.
+
+    Args:
+        name: Adapter name used in requests (e.g. "gemini")
+        reference: Import path of the adapter class
+    """
+    with _lock:
+        _load_references()[name] = reference
+        _classes.pop(name, None)
+
+
+def available_adapters() -> List[str]:
+    """List registered adapter names (without importing them)."""
+    return sorted(_load_references())
+
+
+def get_adapter_class(name: str) -> Type[ModelAdapter]:
+    """Import (once) and return the adapter class registered under name.
+
+    Raises:
+        ValueError: If no adapter is registered under name
+    """
+    cls = _classes.get(name)
+    if cls is not None:
+        return cls
+
+    with _lock:
+        reference = _load_references().get(name)
+        if reference is None:
+            raise ValueError(f"Unknown adapter '{name}' (available: {', '.join(available_adapters())})")
+        module_name, _, class_name = reference.partition(":")
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _classes[name] = cls
+    return cls
+
+
+def create_adapter(name: str = "dummy", api_key: str | None = None) -> ModelAdapter:
+    """Instantiate an adapter by name.
+
+    Args:
+        name: Registered adapter name
+        api_key: Optional API key override
+
+    Returns:
+        Model adapter instance
+    """
+    return get_adapter_class(name)(api_key=api_key)
@@ -0,0 +1,126 @@
+"""Replay Adapter - serves recorded model responses with recorded latency.
+
+Recordings ("cassettes") are JSON-lines files with one model call per
+line: the method, a SHA-256 key of its input (audio bytes or text), the
+response and how long the real model took. In replay mode calls are
+answered from the cassette after sleeping for the recorded latency, so
+load tests see realistic timing without contacting the provider. In
+record mode calls go to a real adapter (Gemini by default) and are
+appended to the cassette.
+
+Inputs that were never recorded get a recording of the same method
+chosen deterministically from the input hash, unless ``REPLAY_STRICT``
+is set.
+"""
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from app.adapters import ModelAdapter
+from app.config import get_settings
+
+_cassettes: Dict[Path, Dict[str, Dict[str, List[dict]]]] = {}
+_lock = threading.Lock()
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _file_key(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_cassette(path: Path) -> Dict[str, Dict[str, List[dict]]]:
+    """Load (once) a cassette as method -> input key -> recordings."""
+    with _lock:
+        cassette = _cassettes.get(path)
+        if cassette is None:
+            cassette = {}
+            if path.exists():
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            cassette.setdefault(record["method"], {}).setdefault(record["key"], []).append(record)
+            _cassettes[path] = cassette
+        return cassette
+
+
+class ReplayAdapter(ModelAdapter):
+    """Adapter that replays (or records) model calls from a cassette."""
+
+    def __init__(self, api_key: str | None = None):
+        settings = get_settings()
+        self.path = Path(settings.replay_cassette)
+        self.mode = settings.replay_mode
+        self.strict = settings.replay_strict
+        self.latency_scale = settings.replay_latency_scale
+        self.api_key = api_key
+        self._inner: ModelAdapter | None = None
+
+    def _recorder(self) -> ModelAdapter:
+        if self._inner is None:
+            from app.adapters.registry import create_adapter
+            self._inner = create_adapter(get_settings().replay_record_adapter, self.api_key)
+        return self._inner
+
+    def _append(self, record: dict) -> None:
+        with _lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+            cassette = _cassettes.get(self.path)
+            if cassette is not None:
+                cassette.setdefault(record["method"], {}).setdefault(record["key"], []).append(record)
+
+    async def _call(self, method: str, key: str, argument):
+        """Replay the recorded response for (method, key), or record it."""
+        if self.mode == "record":
+            started = time.perf_counter()
+            response = await getattr(self._recorder(), method)(argument)
+            self._append({
+                "method": method,
+                "key": key,
+                "response": response,
+                "latency_s": round(time.perf_counter() - started, 4),
+            })
+            return response
+
+        recorded = load_cassette(self.path).get(method, {})
+        records = recorded.get(key)
+        if not records:
+            if self.strict or not recorded:
+                raise ValueError(f"No recorded {method} response for input {key[:12]} in {self.path}")
+            keys = sorted(recorded)
+            records = recorded[keys[int(key, 16) % len(keys)]]
+
+        record = records[int(key, 16) % len(records)]
+        await asyncio.sleep(record["latency_s"] * self.latency_scale)
+        return record["response"]
+
+    async def transcribe_audio(self, audio_path: Path) -> str:
+        """Replay a recorded transcription."""
+        key = await asyncio.to_thread(_file_key, audio_path)
+        return await self._call("transcribe_audio", key, audio_path)
+
+    async def summarize_text(self, text: str) -> str:
+        """Replay a recorded summary."""
+        return await self._call("summarize_text", _text_key(text), text)
+
+    async def generate_bullets(self, text: str) -> List[str]:
+        """Replay recorded bullet points."""
+        return await self._call("generate_bullets", _text_key(text), text)
+
+    async def suggest_tags(self, text: str) -> List[Tuple[str, float]]:
+        """Replay recorded tags."""
+        tags = await self._call("suggest_tags", _text_key(text), text)
+        return [(tag, confidence) for tag, confidence in tags]
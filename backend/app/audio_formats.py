@@ -0,0 +1,48 @@
+"""Audio container detection from magic bytes.
+
+Shared by the transcription pipeline (pre-processing, temp file names) and
+the model adapters (the MIME type sent with inline audio).
+"""
+from typing import Tuple
+
+# (magic, offset, mime type), checked in order. WebM is a Matroska subset
+# with the same EBML magic; both are reported as audio/webm.
+_SIGNATURES: Tuple[Tuple[bytes, int, str], ...] = (
+    (b"\x1a\x45\xdf\xa3", 0, "audio/webm"),
+    (b"OggS", 0, "audio/ogg"),
+    (b"fLaC", 0, "audio/flac"),
+    (b"ID3", 0, "audio/mpeg"),
+    (b"ftyp", 4, "audio/mp4"),
+    (b"#!AMR", 0, "audio/amr"),
+)
+
+EXTENSIONS = {
+    "audio/webm": ".webm",
+    "audio/ogg": ".ogg",
+    "audio/wav": ".wav",
+    "audio/flac": ".flac",
+    "audio/mpeg": ".mp3",
+    "audio/mp4": ".m4a",
+    "audio/aac": ".aac",
+    "audio/amr": ".amr",
+}
+
+
+def detect_mime(data: bytes) -> str:
+    """Detect an audio container from its leading bytes.
+
+    Returns:
+        MIME type, "application/octet-stream" if unrecognized
+    """
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        return "audio/wav"
+    for magic, offset, mime in _SIGNATURES:
+        if data[offset:offset + len(magic)] == magic:
+            return mime
+    if len(data) > 1 and data[0] == 0xFF:
+        # MPEG audio frame sync; layer bits 00 mean ADTS AAC
+        if data[1] & 0xF6 == 0xF0:
+            return "audio/aac"
+        if data[1] & 0xE0 == 0xE0:
+            return "audio/mpeg"
+    return "application/octet-stream"
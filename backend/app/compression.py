@@ -0,0 +1,107 @@
+"""Response compression - brotli or gzip for large text/JSON responses.
+
+Complete (non-streaming) responses of at least ``COMPRESSION_MIN_BYTES``
+with a compressible content type are encoded with the best encoding the
+client accepts: brotli when the ``brotli`` package is installed, else
+gzip. Streaming responses (audio, profile downloads) pass through as is.
+"""
+import gzip
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app import metrics
+from app.config import get_settings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+compressed_bytes = metrics.counter(
+    "http_compression_bytes_total", "Response bytes before (stage=in) and after (stage=out) compression"
+)
+
+
+def _accepted(accept_encoding: str) -> set:
+    encodings = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = params.strip().replace(" ", "").removeprefix("q=")
+        try:
+            if quality and float(quality) == 0:
+                continue
+        except ValueError:
+            pass
+        encodings.add(name.strip())
+    return encodings
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the response encoding for an Accept-Encoding header."""
+    accepted = _accepted(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress body with the given encoding ("br" or "gzip")."""
+    settings = get_settings()
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.brotli_quality)
+    return gzip.compress(body, compresslevel=settings.gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing large text/JSON responses."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        min_bytes = get_settings().compression_min_bytes
+        start: dict = {}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+                return
+            if message["type"] != "http.response.body" or not start:
+                await send(message)
+                return
+
+            initial = dict(start)
+            start.clear()
+            body = message.get("body", b"")
+            headers = MutableHeaders(scope=initial)
+            compressible = (
+                not message.get("more_body", False)
+                and len(body) >= min_bytes
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            )
+            if compressible:
+                compressed = compress(body, encoding)
+                compressed_bytes.inc(len(body), stage="in", encoding=encoding)
+                compressed_bytes.inc(len(compressed), stage="out", encoding=encoding)
+                headers["content-encoding"] = encoding
+                headers["content-length"] = str(len(compressed))
+                headers.add_vary_header("Accept-Encoding")
+                message = {**message, "body": compressed}
+            await send(initial)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -17,6 +17,98 @@ class Settings(BaseSettings):
     google_search_api_key: str = ""
     google_search_cx: str = ""
     
+    # Replay adapter (recorded model responses for load tests)
+    replay_cassette: str = "./recordings/gemini.jsonl"
+    replay_mode: str = "replay"  # replay | record
+    replay_record_adapter: str = "gemini"  # adapter recorded in record mode
+    replay_strict: bool = False  # fail instead of substituting a recording on unknown input
+    replay_latency_scale: float = 1.0
+    
+    # Logging
+    log_level: str = ""  # default: DEBUG when debug, else INFO
+    log_levels: str = ""  # per-logger overrides, e.g. "idea_tracker.adapters=DEBUG,sqlalchemy.engine=WARNING"
+    log_format: str = "text"  # text | json
+    log_queue: bool = True  # write records from a background thread
+    
+    # Observability
+    metrics_enabled: bool = True
+    tracing_enabled: bool = True
+    trace_slow_threshold_ms: float = 1000.0  # export traces of requests at least this slow
+    trace_exporter: str = "console"  # console | file | none
+    trace_file: str = "./traces.jsonl"
+    
+    # Response compression (brotli if installed, else gzip)
+    compression_min_bytes: int = 1024
+    gzip_level: int = 6
+    brotli_quality: int = 5
+    
+    # Sampling profiler
+    profiler_mode: str = "off"  # off | header (any client can send X-Profile: 1) | always
+    profile_slow_threshold_ms: float = 500.0  # store profiles of requests at least this slow
+    profile_interval_ms: float = 5.0
+    profile_dir: str = "./profiles"
+    profile_max_stored: int = 50
+    
+    # Adapter call scheduler (interactive > pipeline > research > backfill)
+    scheduler_enabled: bool = True
+    scheduler_max_concurrent: int = 8  # model calls in flight across all callers
+    scheduler_reserved_interactive: int = 1  # slots research/backfill never take
+    scheduler_aging_s: float = 10.0  # waiting this long promotes a call one class
+    scheduler_tenant_weights: str = ""  # "tenant=weight,..." (tenant = API key fingerprint)
+    
+    # Eager processing: transcribe (and optionally analyze) right after upload
+    eager_transcription: bool = False
+    eager_analysis: bool = False  # also warm the bullets/tags analysis cache
+    eager_adapter: str = "dummy"  # /transcribe with another adapter ignores the eager result
+    eager_result_ttl_s: float = 3600.0  # unclaimed results are dropped after this
+    
+    # Push updates (GET /events SSE, /events/ws WebSocket)
+    event_heartbeat_s: float = 15.0  # SSE keep-alive comment interval
+    
+    # Resumable uploads (/ideas/{id}/audio/uploads), staged on disk until complete
+    upload_dir: str = "./uploads"
+    upload_max_bytes: int = 500 * 1024 * 1024
+    upload_session_ttl_s: float = 24 * 3600.0  # idle sessions are deleted after this
+    
+    # Audio storage tiering: old or transcribed audio moves to a colder tier
+    audio_tiering_enabled: bool = False  # run the migration job in the background
+    audio_tiering_interval_s: float = 3600.0
+    audio_tier_after_days: float = 30.0  # hot audio not uploaded again for this long is moved
+    audio_tier_transcribed: bool = True  # also move audio once every idea using it is transcribed
+    audio_cold_tier: str = "disk"  # disk (files in audio_cold_dir) | compressed (stays in the DB)
+    audio_cold_dir: str = "./audio_cold"
+    audio_compress_level: int = 6
+    audio_compress_min_saving: float = 0.05  # keep compressed bytes only if they save this fraction
+    audio_retention_days: float = 0.0  # delete audio not uploaded again for this long (0: keep forever)
+    
+    # Live transcription (WebSocket /ideas/{id}/live)
+    live_segment_s: float = 5.0  # transcribe the recording in segments of about this length
+    
+    # Audio pre-processing before transcription (silence trimming, mono, resampling)
+    audio_preprocess_enabled: bool = True
+    audio_preprocessors: str = "wav,ffmpeg"  # backends tried in order: wav (numpy), ffmpeg (if installed)
+    audio_preprocess_workers: int = 2  # process pool size; 0 runs pre-processing in a thread
+    audio_silence_threshold_db: float = -40.0  # quieter than this (dBFS) counts as silence
+    audio_max_silence_ms: int = 700  # longer pauses are shortened to this
+    audio_resample_hz: int = 16000  # 0 keeps the original sample rate
+    ffmpeg_path: str = "ffmpeg"
+    
+    # POST /ideas/{id}/analyze results cached per transcript text
+    analysis_cache_size: int = 512
+    
+    # Research reports (generated in the background on approval)
+    research_adapter: str = "dummy"  # adapter when the approval request names none
+    research_concurrency: int = 3  # sections generated in parallel per idea
+    
+    # Transcript cleaning
+    default_language: str = "en"
+    filler_dictionary_dir: str = ""  # extra <language>.txt dictionaries, searched first
+    
+    # Near-duplicate detection
+    similarity_index_dir: str = "./similarity_index"
+    similarity_dims: int = 512
+    duplicate_threshold: float = 0.85
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
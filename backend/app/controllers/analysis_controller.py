@@ -0,0 +1,147 @@
+"""Analysis Controller - runs model analyses on an idea's stored transcript.
+
+Reads ``Transcript.cleaned_text`` server-side and runs the requested
+analyses (bullets, summary, tags) concurrently on one shared adapter
+instance. Results are cached per (analysis, adapter, transcript text), so
+re-analyzing an unchanged transcript costs no model calls; editing the
+transcript changes the key.
+"""
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Dict, Hashable, Iterable, Literal, Optional, Tuple
+from uuid import UUID
+
+from sqlmodel import Session
+
+from app import metrics
+from app.config import get_settings
+from app.logger import get_logger
+from app.repos import idea_repo, search_repo, transcript_repo
+from app.services import summary_service, tagging_service
+from app.services.summary_service import get_adapter
+from app.tracing import traced
+
+logger = get_logger(__name__)
+
+AdapterType = Literal["gemini", "dummy", "replay"]
+Analysis = Literal["bullets", "summary", "tags"]
+
+ANALYSES: Tuple[str, ...] = ("bullets", "summary", "tags")
+
+CacheInfo = namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+
+class ResultCache:
+    """Thread-safe LRU of analysis results with lru_cache-style stats."""
+
+    def __init__(self, maxsize: Callable[[], int]):
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > max(0, self._maxsize()):
+                self._data.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize(), len(self._data))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+results_cache = ResultCache(lambda: get_settings().analysis_cache_size)
+
+
+@traced()
+async def analyze_idea(
+    session: Session,
+    idea_id: UUID,
+    analyses: Iterable[Analysis] = ("bullets", "tags"),
+    adapter_type: AdapterType = "dummy",
+    api_key: Optional[str] = None
+) -> dict:
+    """Run analyses on an idea's stored transcript.
+
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+        analyses: Which analyses to run ("bullets", "summary", "tags")
+        adapter_type: Which adapter to use
+        api_key: Optional API key
+
+    Returns:
+        Dict with the transcript id, one entry per requested analysis and
+        the analyses served from cache
+    """
+    if not idea_repo.get_idea_row(session, idea_id):
+        raise ValueError(f"Idea not found: {idea_id}")
+
+    transcript = transcript_repo.get_transcript_by_idea(session, idea_id)
+    if not transcript or not transcript.cleaned_text.strip():
+        raise ValueError(f"No transcript for idea: {idea_id}; transcribe it first")
+
+    text = transcript.cleaned_text
+    requested = [name for name in ANALYSES if name in set(analyses)]
+    logger.info("Analyzing idea %s (%s) using %s adapter", idea_id, ", ".join(requested), adapter_type)
+
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    results: Dict[str, Any] = {}
+    cached = []
+    for name in requested:
+        hit = results_cache.get((name, adapter_type, digest))
+        if hit is not None:
+            results[name] = hit
+            cached.append(name)
+
+    missing = [name for name in requested if name not in results]
+    if missing:
+        adapter = get_adapter(adapter_type, api_key)
+        runners = {
+            "bullets": lambda: summary_service.generate_bullets(text, adapter_type, adapter=adapter),
+            "summary": lambda: summary_service.generate_long_summary(text, adapter_type, adapter=adapter),
+            "tags": lambda: tagging_service.suggest_tags(text, adapter_type, adapter=adapter),
+        }
+
+        async def run(name: str) -> None:
+            with metrics.stage(f"analyze_{name}"):
+                results[name] = await runners[name]()
+            results_cache.put((name, adapter_type, digest), results[name])
+
+        await asyncio.gather(*(run(name) for name in missing))
+
+    if "summary" in missing:
+        search_repo.index_summary(session, idea_id, results["summary"])
+
+    response: Dict[str, Any] = {
+        "idea_id": str(idea_id),
+        "transcript_id": str(transcript.id),
+        "cached": cached,
+    }
+    if "bullets" in results:
+        response["bullets"] = results["bullets"]
+    if "summary" in results:
+        response["summary"] = results["summary"]
+    if "tags" in results:
+        response["tags"] = [{"name": name, "confidence": conf} for name, conf in results["tags"]]
+        response["categories"] = tagging_service.get_predefined_categories()
+    return response
@@ -0,0 +1,275 @@
+"""Audio Tiering - moves rarely replayed audio to cheaper storage.
+
+Most recordings are never played again once transcribed, yet they make up
+nearly all of the database. A migration pass:
+
+1. Moves legacy inline audio (``Idea.audio_blob``) into content-addressed
+   ``AudioBlob`` storage.
+2. Moves hot blobs not uploaded (by any idea) for ``AUDIO_TIER_AFTER_DAYS``
+   (and, with
+   ``AUDIO_TIER_TRANSCRIBED``, blobs whose ideas are all transcribed) to
+   ``AUDIO_COLD_TIER``: "compressed" keeps them in the database, zlib-
+   compressed where that helps; "disk" writes them to files in
+   ``AUDIO_COLD_DIR`` and drops them from the database.
+3. With ``AUDIO_RETENTION_DAYS`` set, deletes audio not uploaded for that
+   long from every idea using it (transcripts are kept).
+4. Removes cold files no blob points at any more.
+
+Reads stay transparent: ``audio_service.get_audio`` decodes any tier. The
+pass runs every ``AUDIO_TIERING_INTERVAL_S`` when ``AUDIO_TIERING_ENABLED``
+is on, and on demand via ``POST /admin/audio/storage/migrate``.
+"""
+import asyncio
+import contextvars
+import hashlib
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, exists, func, or_
+from sqlmodel import Session, select
+
+from app import metrics
+from app.config import get_settings
+from app.db import engine
+from app.logger import get_logger, request_id
+from app.models import AudioBlob, Idea, IdeaStatus
+from app.repos import audio_repo
+from app.services import audio_service
+
+logger = get_logger(__name__)
+
+TIERS = ("hot", "compressed", "disk")
+
+migrated_total = metrics.counter("audio_tier_migrated_total", "Audio blobs moved to a colder tier by tier")
+bytes_saved_total = metrics.counter("audio_tier_bytes_saved_total", "Database bytes freed by audio tiering")
+expired_total = metrics.counter("audio_retention_deleted_total", "Audio blobs deleted by the retention policy")
+
+_task: Optional[asyncio.Task] = None
+
+# One pass at a time: a concurrent _sweep would take another pass's cold
+# file for an orphan before its blob commits the path
+_pass_lock = threading.Lock()
+
+
+def _import_inline(session: Session) -> int:
+    """Move legacy inline audio into AudioBlob storage, one idea at a time."""
+    idea_ids = list(session.exec(select(Idea.id).where(Idea.audio_blob.is_not(None))))
+    for idea_id in idea_ids:
+        idea = session.get(Idea, idea_id)
+        data = idea.audio_blob
+        digest = hashlib.sha256(data).hexdigest()
+        # Age counts from the upload, not from this migration
+        blob, _ = audio_repo.acquire(session, digest, data, referenced_at=idea.updated_at)
+        idea.audio_sha256 = digest
+        idea.audio_blob = None
+        session.add_all([blob, idea])
+        session.commit()
+        session.expunge_all()
+    return len(idea_ids)
+
+
+def _eligible(session: Session, now: datetime) -> List[str]:
+    """Hot blobs the policy says should move to the cold tier."""
+    settings = get_settings()
+    conditions = [AudioBlob.last_referenced_at < now - timedelta(days=settings.audio_tier_after_days)]
+    if settings.audio_tier_transcribed:
+        used = exists().where(Idea.audio_sha256 == AudioBlob.sha256)
+        draft = exists().where(and_(Idea.audio_sha256 == AudioBlob.sha256, Idea.status == IdeaStatus.DRAFT))
+        conditions.append(and_(used, ~draft))
+    statement = select(AudioBlob.sha256).where(AudioBlob.tier == "hot", or_(*conditions))
+    return list(session.exec(statement))
+
+
+def _write_cold_file(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _remove_cold_file(path: Path) -> None:
+    path.unlink(missing_ok=True)
+    if path.parent.is_dir() and not any(path.parent.iterdir()):
+        path.parent.rmdir()
+
+
+def demote(session: Session, sha256: str, tier: str) -> int:
+    """Move one blob to a colder tier.
+
+    Args:
+        session: Database session
+        sha256: Blob digest
+        tier: "compressed" or "disk"
+
+    Returns:
+        Database bytes freed
+    """
+    if tier not in TIERS[1:]:
+        raise ValueError(f"Unknown audio tier '{tier}' (expected compressed or disk)")
+    blob = audio_repo.get_blob(session, sha256)
+    if blob is None or blob.tier != "hot":
+        return 0
+
+    db_bytes = len(blob.data or b"")
+    stored, codec = audio_service.encode_for_tier(audio_service.read_blob(blob))
+    if tier == "disk":
+        path = audio_service.cold_path(sha256)
+        _write_cold_file(path, stored)
+        blob.data, blob.path = None, str(path)
+    else:
+        blob.data = stored
+    blob.tier, blob.codec, blob.stored_size = tier, codec, len(stored)
+    session.add(blob)
+    session.commit()
+
+    saved = db_bytes - len(blob.data or b"")
+    migrated_total.inc(tier=tier)
+    bytes_saved_total.inc(saved)
+    return saved
+
+
+def _apply_retention(session: Session, now: datetime) -> int:
+    """Delete audio not uploaded for AUDIO_RETENTION_DAYS from every idea using it."""
+    days = get_settings().audio_retention_days
+    if days <= 0:
+        return 0
+    cutoff = now - timedelta(days=days)
+    expired = list(session.exec(select(AudioBlob.sha256).where(AudioBlob.last_referenced_at < cutoff)))
+    for sha256 in expired:
+        for idea in list(session.exec(select(Idea).where(Idea.audio_sha256 == sha256))):
+            idea.audio_sha256 = None
+            idea.audio_size = None
+            session.add(idea)
+        blob = audio_repo.get_blob(session, sha256)
+        session.delete(blob)
+        session.commit()
+        if blob.path:
+            _remove_cold_file(Path(blob.path))
+        expired_total.inc()
+    return len(expired)
+
+
+def _sweep(session: Session) -> int:
+    """Remove cold files that no disk-tier blob points at."""
+    root = Path(get_settings().audio_cold_dir)
+    if not root.is_dir():
+        return 0
+    removed = 0
+    for path in root.glob("*/*"):
+        sha256 = path.name.removesuffix(".tmp")
+        blob = audio_repo.get_blob(session, sha256)
+        if path.suffix == ".tmp" or blob is None or blob.path != str(path):
+            _remove_cold_file(path)
+            removed += 1
+    return removed
+
+
+def run_once(wait: bool = True) -> Optional[Dict[str, int]]:
+    """One migration pass (blocking; run it in a thread).
+
+    Args:
+        wait: Wait for a pass already running to finish (otherwise return None)
+
+    Returns:
+        Counts of imported, migrated and expired blobs, removed orphan
+        files, and database bytes freed; None if a pass was already
+        running and wait is False
+    """
+    if not _pass_lock.acquire(blocking=wait):
+        return None
+    try:
+        return _run_pass()
+    finally:
+        _pass_lock.release()
+
+
+def _run_pass() -> Dict[str, int]:
+    settings = get_settings()
+    now = datetime.utcnow()
+    summary = {"imported": 0, "migrated": 0, "bytes_saved": 0, "expired": 0, "orphans_removed": 0}
+    with Session(engine) as session:
+        summary["imported"] = _import_inline(session)
+        summary["expired"] = _apply_retention(session, now)
+        for sha256 in _eligible(session, now):
+            try:
+                summary["bytes_saved"] += demote(session, sha256, settings.audio_cold_tier)
+                summary["migrated"] += 1
+            except Exception:
+                # e.g. the blob was deleted meanwhile; the next pass retries the rest
+                session.rollback()
+                logger.exception("Moving audio %s to the %s tier failed", sha256[:12], settings.audio_cold_tier)
+        summary["orphans_removed"] = _sweep(session)
+    if any(summary.values()):
+        logger.info("Audio tiering: %s", summary)
+    return summary
+
+
+def stats(session: Session) -> dict:
+    """Stored audio by tier, and the bytes tiering and deduplication save."""
+    rows = session.exec(
+        select(
+            AudioBlob.tier,
+            func.count(),
+            func.coalesce(func.sum(AudioBlob.size), 0),
+            func.coalesce(func.sum(func.coalesce(AudioBlob.stored_size, AudioBlob.size)), 0),
+            func.coalesce(func.sum(AudioBlob.size * (AudioBlob.refcount - 1)), 0),
+        ).group_by(AudioBlob.tier)
+    ).all()
+    tiers = {tier: {"blobs": 0, "original_bytes": 0, "stored_bytes": 0} for tier in TIERS}
+    dedup_saved = 0
+    for tier, count, original, stored, shared in rows:
+        tiers[tier] = {"blobs": count, "original_bytes": original, "stored_bytes": stored}
+        dedup_saved += shared
+
+    inline_count, inline_bytes = session.exec(
+        select(func.count(), func.coalesce(func.sum(Idea.audio_size), 0)).where(Idea.audio_blob.is_not(None))
+    ).one()
+    database_bytes = (
+        tiers["hot"]["stored_bytes"] + tiers["compressed"]["stored_bytes"] + inline_bytes
+    )
+    return {
+        "tiers": tiers,
+        "inline": {"ideas": inline_count, "bytes": inline_bytes},
+        "database_bytes": database_bytes,
+        "disk_bytes": tiers["disk"]["stored_bytes"],
+        "bytes_saved_by_compression": sum(t["original_bytes"] - t["stored_bytes"] for t in tiers.values()),
+        "bytes_moved_to_disk": tiers["disk"]["stored_bytes"],
+        "bytes_saved_by_dedup": dedup_saved,
+    }
+
+
+async def _loop() -> None:
+    interval = get_settings().audio_tiering_interval_s
+    while True:
+        try:
+            await asyncio.to_thread(run_once)
+        except Exception:
+            logger.exception("Audio tiering pass failed")
+        await asyncio.sleep(interval)
+
+
+def start() -> bool:
+    """Start the background migration job if AUDIO_TIERING_ENABLED.
+
+    Returns:
+        True if the job was started
+    """
+    global _task
+    if not get_settings().audio_tiering_enabled or (_task and not _task.done()):
+        return False
+    context = contextvars.Context()
+    context.run(request_id.set, "audio-tiering")
+    _task = context.run(asyncio.create_task, _loop(), name="audio-tiering")
+    return True
+
+
+async def shutdown() -> None:
+    """Stop the background job (a pass in progress finishes in its thread)."""
+    global _task
+    if _task:
+        _task.cancel()
+        await asyncio.gather(_task, return_exceptions=True)
+        _task = None
@@ -0,0 +1,146 @@
+"""Eager Processing - starts transcription as soon as audio is uploaded.
+
+With ``EAGER_TRANSCRIPTION`` on, a successful upload starts transcription
+(and with ``EAGER_ANALYSIS`` also bullets and tags, which warms the
+analysis cache) in the background using ``EAGER_ADAPTER``. When the user
+then asks to transcribe or process, ``transcription_controller`` takes the
+job: a finished job's result is returned at once and a running job is
+awaited instead of starting a second model call.
+
+A new upload or an audio deletion replaces or cancels the idea's job. A
+request for a different adapter cancels it too, so a late eager result
+never overwrites the transcript the user asked for.
+
+Jobs publish ``eager.started``, ``eager.ready`` and ``eager.failed`` on the
+event bus.
+"""
+import asyncio
+import contextvars
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlmodel import Session
+
+from app import events, scheduler
+from app.config import get_settings
+from app.db import engine
+from app.logger import get_logger, request_id
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class EagerJob:
+    adapter: str
+    task: asyncio.Task
+    started: float = field(default_factory=time.monotonic)
+
+
+_jobs: Dict[UUID, EagerJob] = {}
+
+
+def enabled() -> bool:
+    return get_settings().eager_transcription
+
+
+def _prune() -> None:
+    """Drop finished jobs nobody claimed within EAGER_RESULT_TTL_S."""
+    cutoff = time.monotonic() - get_settings().eager_result_ttl_s
+    for idea_id, job in list(_jobs.items()):
+        if job.task.done() and job.started < cutoff:
+            del _jobs[idea_id]
+
+
+async def _run(idea_id: UUID, adapter: str) -> dict:
+    # Imported here: transcription_controller imports this module
+    from app.controllers import analysis_controller, transcription_controller
+
+    with Session(engine) as session:
+        try:
+            result = await transcription_controller.transcribe_and_clean(
+                session, idea_id, adapter, reuse_eager=False
+            )
+        except Exception as e:
+            events.publish("eager.failed", idea_id, adapter=adapter, error=str(e) or type(e).__name__)
+            raise
+        if get_settings().eager_analysis:
+            try:
+                await analysis_controller.analyze_idea(session, idea_id, ("bullets", "tags"), adapter)
+            except Exception:
+                logger.exception("Eager analysis failed for idea %s", idea_id)
+    logger.info("Eager transcription ready for idea %s", idea_id)
+    events.publish("eager.ready", idea_id, adapter=adapter)
+    return result
+
+
+def schedule(idea_id: UUID) -> bool:
+    """Start background transcription for freshly uploaded audio.
+
+    Must be called from a running event loop.
+
+    Returns:
+        True if a job was started (eager mode is on)
+    """
+    if not enabled():
+        return False
+    _prune()
+    discard(idea_id)
+
+    adapter = get_settings().eager_adapter
+    # Fresh context: not part of the upload request's trace; queued like /process
+    context = contextvars.Context()
+    context.run(request_id.set, f"eager-{idea_id.hex[:8]}")
+    context.run(scheduler.current_priority.set, "pipeline")
+    task = context.run(asyncio.create_task, _run(idea_id, adapter), name=f"eager-{idea_id}")
+    # Failures are reported to whoever claims the job; don't warn about them
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    _jobs[idea_id] = EagerJob(adapter, task)
+    events.publish("eager.started", idea_id, adapter=adapter)
+    logger.info("Eager transcription started for idea %s using %s adapter", idea_id, adapter)
+    return True
+
+
+def discard(idea_id: UUID) -> None:
+    """Forget (and cancel, if running) the idea's job."""
+    job = _jobs.pop(idea_id, None)
+    if job and not job.task.done():
+        job.task.cancel()
+
+
+async def claim(idea_id: UUID, adapter: str) -> Optional[dict]:
+    """Take the idea's eager result, waiting for it if still running.
+
+    Returns:
+        The transcription result, or None if there is no usable job (none
+        started, different adapter, cancelled or failed) and the caller
+        should transcribe itself
+    """
+    job = _jobs.pop(idea_id, None)
+    if job is None:
+        return None
+    if job.adapter != adapter:
+        if not job.task.done():
+            job.task.cancel()
+        return None
+
+    try:
+        # Shielded: a client disconnect must not cancel the shared job
+        return await asyncio.shield(job.task)
+    except asyncio.CancelledError:
+        if job.task.cancelled():
+            return None
+        raise
+    except Exception as e:
+        logger.warning("Eager transcription for idea %s failed (%s); transcribing again", idea_id, e)
+        return None
+
+
+async def shutdown() -> None:
+    """Cancel running jobs."""
+    tasks = [job.task for job in _jobs.values()]
+    _jobs.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -4,102 +4,155 @@ from uuid import UUID
 
 from sqlmodel import Session
 
-from app.controllers import transcription_controller
-from app.logger import logger
+from app import metrics
+from app.adapters.registry import get_adapter_class
+from app.config import get_settings
+from app.controllers import research_engine, transcription_controller
+from app.logger import get_logger
 from app.models import IdeaStatus
-from app.repos import idea_repo, transcript_repo
-from app.services import summary_service, tagging_service
+from app.repos import idea_repo, search_repo, transcript_repo
+from app.services import similarity_service, summary_service, tagging_service
+from app.tracing import traced
 
-AdapterType = Literal["gemini", "dummy"]
+logger = get_logger(__name__)
 
+AdapterType = Literal["gemini", "dummy", "replay"]
 
+
+@traced()
 async def process_transcription(
     session: Session,
     idea_id: UUID,
     adapter_type: AdapterType = "dummy",
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    check_duplicates: bool = False
 ) -> dict:
     """Process an idea: transcribe, clean, summarize, and tag.
     
+    With check_duplicates, the cleaned transcript is compared against the
+    similarity index first; if likely duplicates are found the summary and
+    tagging stages are skipped and the duplicates are returned instead.
+    
     Args:
         session: Database session
         idea_id: Idea UUID
         adapter_type: Which adapter to use
         api_key: Optional API key
+        check_duplicates: Stop before LLM stages if duplicates exist
         
     Returns:
         Dict with all processing results
     """
-    logger.info(f"Processing idea {idea_id}")
+    logger.info("Processing idea %s", idea_id)
     
     # Step 1: Transcribe and clean
-    transcription_result = await transcription_controller.transcribe_and_clean(
-        session, idea_id, adapter_type, api_key
-    )
+    with metrics.stage("transcription"):
+        transcription_result = await transcription_controller.transcribe_and_clean(
+            session, idea_id, adapter_type, api_key
+        )
     
     cleaned_text = transcription_result["transcription_clean"]
     
+    if check_duplicates:
+        with metrics.stage("duplicate_check"):
+            duplicates = similarity_service.find_duplicates(idea_id, cleaned_text)
+        if duplicates:
+            logger.info("Idea %s looks like a duplicate of %s idea(s)", idea_id, len(duplicates))
+            return {
+                **transcription_result,
+                "summary": "",
+                "bullets": [],
+                "tags": [],
+                "duplicates": [
+                    {"idea_id": str(other_id), "similarity": score}
+                    for other_id, score in duplicates
+                ]
+            }
+    
     # Step 2: Generate summary bullets
-    bullets = await summary_service.generate_bullets(
-        cleaned_text, adapter_type, api_key
-    )
+    with metrics.stage("bullets"):
+        bullets = await summary_service.generate_bullets(
+            cleaned_text, adapter_type, api_key
+        )
     
     # Step 3: Generate long summary
-    summary = await summary_service.generate_long_summary(
-        cleaned_text, adapter_type, api_key
-    )
+    with metrics.stage("summary"):
+        summary = await summary_service.generate_long_summary(
+            cleaned_text, adapter_type, api_key
+        )
+        search_repo.index_summary(session, idea_id, summary)
     
     # Step 4: Suggest tags
-    tags = await tagging_service.suggest_tags(
-        cleaned_text, adapter_type, api_key
-    )
+    with metrics.stage("tags"):
+        tags = await tagging_service.suggest_tags(
+            cleaned_text, adapter_type, api_key
+        )
     
-    logger.info(f"Processing complete for idea {idea_id}")
+    logger.info("Processing complete for idea %s", idea_id)
     
     return {
         **transcription_result,
         "summary": summary,
         "bullets": bullets,
-        "tags": [{"name": name, "confidence": conf} for name, conf in tags]
+        "tags": [{"name": name, "confidence": conf} for name, conf in tags],
+        "duplicates": []
     }
 
 
 async def approve_idea(
     session: Session,
-    idea_id: UUID
+    idea_id: UUID,
+    adapter_type: Optional[str] = None,
+    api_key: Optional[str] = None
 ) -> dict:
     """Approve an idea for research.
     
-    Transitions status to APPROVED and enqueues research job.
+    Transitions status to APPROVED and starts the research engine in the
+    background (which moves the idea through RESEARCHING to COMPLETED).
     
     Args:
         session: Database session
         idea_id: Idea UUID
+        adapter_type: Adapter for the research report (default: RESEARCH_ADAPTER)
+        api_key: Optional API key
         
     Returns:
         Dict with approval status
+        
+    Raises:
+        ValueError: If the idea or the adapter doesn't exist
     """
-    logger.info(f"Approving idea {idea_id}")
+    logger.info("Approving idea %s", idea_id)
     
     # Get idea
     idea = idea_repo.get_idea(session, idea_id)
     if not idea:
         raise ValueError(f"Idea not found: {idea_id}")
     
+    if research_engine.is_running(idea_id):
+        return {
+            "idea_id": str(idea_id),
+            "status": IdeaStatus.RESEARCHING.value,
+            "message": "Research is already in progress."
+        }
+    
+    # Fail now rather than in every section of the background run
+    get_adapter_class(adapter_type or get_settings().research_adapter)
+    
     # Validate status transition
     if idea.status not in [IdeaStatus.TRANSCRIBED, IdeaStatus.DRAFT]:
-        logger.warning(f"Idea {idea_id} status is {idea.status}, approving anyway")
+        logger.warning("Idea %s status is %s, approving anyway", idea_id, idea.status)
     
     # Update status to approved
     idea_repo.update_idea_status(session, idea_id, IdeaStatus.APPROVED)
     
-    # TODO: Enqueue research job (Phase 2)
-    # For now, just mark as approved
+    # Generate (or resume) the research report in the background
+    research_engine.start_research(idea_id, adapter_type, api_key)
     
-    logger.info(f"Idea {idea_id} approved for research")
+    logger.info("Idea %s approved for research", idea_id)
     
     return {
         "idea_id": str(idea_id),
         "status": IdeaStatus.APPROVED.value,
-        "message": "Idea approved for research. Research job will be queued."
+        "message": "Idea approved for research. Research has started."
     }
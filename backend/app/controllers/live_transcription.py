@@ -0,0 +1,228 @@
+"""Live Transcription - transcribes audio while it is still being recorded.
+
+A ``LiveTranscription`` receives the recorder's chunks in order and
+buffers the recording, which is stored on the idea once, when recording
+stops. Each segment is transcribed in the background as soon as it is
+closed, so by the time recording stops only the last few seconds are left
+to transcribe.
+
+Segments are cut at WebM Cluster boundaries (MediaRecorder's default
+container) and transcribed with the recording's header in front, so each
+one decodes on its own. A segment closes when ``LIVE_SEGMENT_S`` seconds
+have passed since the previous cut, or when the client asks for a cut
+(e.g. on a pause in speech). Other containers can't be split this way;
+they are transcribed in one piece once recording stops.
+
+Segment transcripts are cleaned with a ``StreamingCleaner`` in recording
+order, so the cleaned pieces join up to exactly what ``clean_transcript``
+gives for the whole raw text. If any segment fails, the finished
+recording is transcribed again in one piece.
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional
+from uuid import UUID
+
+from sqlmodel import Session
+
+from app import metrics
+from app.config import get_settings
+from app.controllers import eager_processing, transcription_controller
+from app.db import engine
+from app.logger import get_logger
+from app.repos import idea_repo
+from app.services import audio_service, cleaning_service, filler_dictionaries, transcription_service
+from app.services.transcription_service import get_adapter
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Segment:
+    index: int
+    size_bytes: int
+    task: asyncio.Task
+
+
+class LiveTranscription:
+    """One recording session for an idea."""
+
+    def __init__(
+        self,
+        idea_id: UUID,
+        adapter_type: str = "dummy",
+        api_key: Optional[str] = None,
+        language: Optional[str] = None
+    ):
+        self.idea_id = idea_id
+        self.adapter_type = adapter_type
+        self.api_key = api_key
+        self.language = filler_dictionaries.validate_language(language)
+        self.adapter = get_adapter(adapter_type, api_key)
+        self.failed = False
+        self._header: Optional[bytes] = None  # b"": not WebM
+        self._pending = bytearray()  # received, not yet part of a segment
+        self._recording = bytearray()  # closed segments, stored when recording ends
+        self._stored = False
+        self._segments: "asyncio.Queue[Optional[Segment]]" = asyncio.Queue()
+        self._count = 0
+        self._last_cut = time.monotonic()
+        self._raw: List[str] = []
+        self._cleaned: List[str] = []
+        self._cleaner: Optional[cleaning_service.StreamingCleaner] = None
+        self._closed = False
+
+    def begin(self) -> None:
+        """Check the idea and clear its stored audio for the new recording.
+
+        Raises:
+            ValueError: If the idea doesn't exist
+        """
+        with Session(engine) as session:
+            idea = idea_repo.get_idea(session, self.idea_id)
+            if not idea:
+                raise ValueError(f"Idea not found: {self.idea_id}")
+            self.language = self.language or idea.language
+            audio_service.delete_audio(session, self.idea_id)
+        eager_processing.discard(self.idea_id)
+        logger.info("Live transcription started for idea %s using %s adapter", self.idea_id, self.adapter_type)
+
+    @property
+    def incremental(self) -> Optional[bool]:
+        """Whether segments can be transcribed while recording (None: not known yet)."""
+        return None if self._header is None else bool(self._header)
+
+    async def add_chunk(self, chunk: bytes) -> Optional[int]:
+        """Take the next piece of the recording.
+
+        Returns:
+            Index of the segment this closed, if any
+        """
+        if self._closed:
+            raise ValueError("Recording already finished")
+        self._pending += chunk
+        if self._header is None:
+            self._header = audio_service.webm_header(bytes(self._pending))
+        if time.monotonic() - self._last_cut >= get_settings().live_segment_s:
+            return await self.cut()
+        return None
+
+    async def cut(self) -> Optional[int]:
+        """Close the current segment at the last complete Cluster.
+
+        Returns:
+            Index of the closed segment, or None if there is nothing to cut yet
+        """
+        if not self.incremental:
+            return None
+        # The first segment starts with the header and the first Cluster
+        after = len(self._header) if self._count == 0 else 0
+        boundary = audio_service.last_cluster_start(self._pending, after)
+        if boundary <= after:
+            return None
+        data = bytes(self._pending[:boundary])
+        del self._pending[:boundary]
+        return await self._close_segment(data)
+
+    async def _close_segment(self, data: bytes) -> int:
+        self._recording += data
+        # The first segment already starts with the header
+        playable = data if self._count == 0 or not self._header else self._header + data
+        index = self._count
+        self._count += 1
+        self._last_cut = time.monotonic()
+        task = asyncio.create_task(self._transcribe(playable), name=f"live-{self.idea_id}-{index}")
+        await self._segments.put(Segment(index, len(data), task))
+        return index
+
+    async def _transcribe(self, data: bytes) -> str:
+        with metrics.stage("live_segment"):
+            return await transcription_service.transcribe_audio_bytes(
+                data, self.adapter_type, self.api_key, adapter=self.adapter
+            )
+
+    async def _store(self) -> None:
+        """Save the recording (closed segments and anything pending) on the idea, once."""
+        if self._stored:
+            return
+        self._stored = True
+        recording = bytes(self._recording + self._pending)
+        if recording:
+            with Session(engine) as session:
+                await audio_service.save_audio(session, self.idea_id, recording)
+
+    async def finish(self) -> None:
+        """Close the last segment and store the recording; ``partials`` ends after it."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._pending:
+            data, self._pending = bytes(self._pending), bytearray()
+            await self._close_segment(data)
+        await self._segments.put(None)
+        await self._store()
+
+    async def partials(self) -> AsyncIterator[dict]:
+        """Yield each segment's transcript, in order, as it completes."""
+        while (segment := await self._segments.get()) is not None:
+            try:
+                raw = (await segment.task).strip()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Live segment %s of idea %s failed: %s", segment.index, self.idea_id, e)
+                self.failed = True
+                yield {"type": "error", "segment": segment.index, "detail": str(e) or type(e).__name__}
+                continue
+            if self.failed or not raw:
+                continue
+
+            if self._cleaner is None:
+                self.language = self.language or filler_dictionaries.detect_language(raw)
+                self._cleaner = cleaning_service.StreamingCleaner(cleaning_service.get_cleaner(self.language))
+            piece = self._cleaner.feed(raw if not self._raw else " " + raw)
+            self._raw.append(raw)
+            self._cleaned.append(piece)
+            yield {
+                "type": "partial",
+                "segment": segment.index,
+                "raw": raw,
+                "text": piece,
+                "transcript": "".join(self._cleaned),
+                "pending": self._cleaner.pending,
+            }
+
+    async def save(self) -> dict:
+        """Store the transcript once every segment is in.
+
+        Returns:
+            The same dict as ``transcribe_and_clean``
+        """
+        with Session(engine) as session:
+            if self.failed or not self._raw:
+                # Retranscribe the whole recording in one piece
+                return await transcription_controller.transcribe_and_clean(
+                    session, self.idea_id, self.adapter_type, self.api_key, reuse_eager=False
+                )
+            self._cleaned.append(self._cleaner.flush())
+            result = transcription_controller.save_transcript(
+                session, self.idea_id, " ".join(self._raw), "".join(self._cleaned), self.language
+            )
+        logger.info("Live transcription complete for idea %s (%s segment(s))", self.idea_id, self._count)
+        return result
+
+    async def abort(self) -> None:
+        """Cancel segment transcriptions still running, keeping the audio received."""
+        self._closed = True
+        try:
+            await self._store()
+        except Exception:
+            logger.exception("Storing the live recording of idea %s failed", self.idea_id)
+        tasks = []
+        while not self._segments.empty():
+            segment = self._segments.get_nowait()
+            if segment is not None:
+                segment.task.cancel()
+                tasks.append(segment.task)
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,180 @@
+"""Research Engine - generates research reports in the background.
+
+Approving an idea starts a research run: the idea moves to RESEARCHING,
+sections A-J are generated concurrently (at most ``RESEARCH_CONCURRENCY``
+model calls at a time), each one is saved to the report as soon as it
+finishes, and the synthesis section K is written last from the others.
+When every section is done the idea moves to COMPLETED.
+
+Runs pick up where the saved report left off: completed sections are never
+regenerated, so a run interrupted by a crash or shutdown is resumed at
+startup (``resume_incomplete``) and a run with failed sections can be
+retried with ``start_research``.
+
+Progress is published on the event bus: ``research.section`` after each
+section is saved and ``research.completed`` when a run ends.
+"""
+import asyncio
+import contextvars
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlmodel import Session, select
+
+from app import events, metrics, scheduler
+from app.config import get_settings
+from app.db import engine
+from app.logger import get_logger, request_id
+from app.models import Idea, IdeaStatus
+from app.repos import idea_repo, research_repo, transcript_repo
+from app.services import research_service
+from app.services.research_service import SECTIONS, SYNTHESIS_SECTION
+
+logger = get_logger(__name__)
+
+_running: Dict[UUID, asyncio.Task] = {}
+
+
+def is_running(idea_id: UUID) -> bool:
+    """Whether a research run for the idea is in progress."""
+    task = _running.get(idea_id)
+    return task is not None and not task.done()
+
+
+def start_research(idea_id: UUID, adapter_type: Optional[str] = None, api_key: Optional[str] = None) -> bool:
+    """Start (or resume) research for an idea in the background.
+
+    Must be called from a running event loop.
+
+    Args:
+        idea_id: Idea UUID
+        adapter_type: Adapter for new reports (default: RESEARCH_ADAPTER);
+            resumed reports keep the adapter they were started with
+        api_key: Optional API key
+
+    Returns:
+        False if a run for the idea is already in progress
+    """
+    if is_running(idea_id):
+        return False
+
+    # A fresh context keeps the run out of the approving request's trace;
+    # its model calls are scheduled behind interactive and pipeline work
+    context = contextvars.Context()
+    context.run(request_id.set, f"research-{idea_id.hex[:8]}")
+    context.run(scheduler.current_priority.set, "research")
+    # (context.run rather than create_task(context=...), which needs 3.11)
+    task = context.run(
+        asyncio.create_task, run_research(idea_id, adapter_type, api_key), name=f"research-{idea_id}"
+    )
+    _running[idea_id] = task
+    task.add_done_callback(lambda _: _running.pop(idea_id, None))
+    return True
+
+
+async def run_research(idea_id: UUID, adapter_type: Optional[str] = None, api_key: Optional[str] = None) -> bool:
+    """Generate the missing sections of an idea's report.
+
+    Args:
+        idea_id: Idea UUID
+        adapter_type: Adapter for new reports (default: RESEARCH_ADAPTER)
+        api_key: Optional API key
+
+    Returns:
+        True if the report is complete
+    """
+    settings = get_settings()
+
+    with Session(engine) as session:
+        idea = idea_repo.get_idea(session, idea_id)
+        if not idea:
+            logger.warning("Research skipped: idea %s not found", idea_id)
+            return False
+        transcript = transcript_repo.get_transcript_by_idea(session, idea_id)
+        text = (transcript.cleaned_text if transcript else "") or idea.title or ""
+        if not text.strip():
+            logger.warning("Research skipped: idea %s has no transcript or title", idea_id)
+            return False
+
+        report = research_repo.get_or_create_report(session, idea_id, adapter_type or settings.research_adapter)
+        data = research_repo.report_data(report)
+        adapter_type = data.get("adapter") or adapter_type or settings.research_adapter
+        completed = {
+            key: section["content"]
+            for key, section in data["sections"].items()
+            if section.get("status") == "completed"
+        }
+        idea_repo.update_idea_status(session, idea_id, IdeaStatus.RESEARCHING)
+
+    pending = [key for key in SECTIONS if key not in completed and key != SYNTHESIS_SECTION]
+    logger.info(
+        "Researching idea %s with %s adapter: %s section(s) done, %s to go",
+        idea_id, adapter_type, len(completed), len(SECTIONS) - len(completed)
+    )
+
+    semaphore = asyncio.Semaphore(max(1, settings.research_concurrency))
+
+    async def generate(key: str) -> None:
+        title = SECTIONS[key][0]
+        async with semaphore:
+            try:
+                with metrics.stage("research_section"):
+                    content = await research_service.generate_section(
+                        key, text, adapter_type, api_key, completed=dict(completed)
+                    )
+            except Exception as e:
+                logger.exception("Research section %s failed for idea %s", key, idea_id)
+                content, error = None, str(e) or type(e).__name__
+            else:
+                error = None
+        with Session(engine) as session:
+            research_repo.save_section(session, idea_id, key, title, content=content, error=error)
+        if error is None:
+            completed[key] = content
+        events.publish(
+            "research.section", idea_id, section=key, title=title,
+            status="failed" if error else "completed", completed=len(completed), total=len(SECTIONS)
+        )
+
+    await asyncio.gather(*(generate(key) for key in pending))
+
+    # The synthesis section needs every other section
+    if SYNTHESIS_SECTION not in completed and len(completed) == len(SECTIONS) - 1:
+        await generate(SYNTHESIS_SECTION)
+
+    if len(completed) < len(SECTIONS):
+        logger.warning(
+            "Research for idea %s incomplete (%s/%s sections); retry to resume",
+            idea_id, len(completed), len(SECTIONS)
+        )
+        events.publish("research.completed", idea_id, complete=False, completed=len(completed), total=len(SECTIONS))
+        return False
+
+    with Session(engine) as session:
+        research_repo.set_summary(session, idea_id, completed[SYNTHESIS_SECTION])
+        idea_repo.update_idea_status(session, idea_id, IdeaStatus.COMPLETED)
+    logger.info("Research complete for idea %s", idea_id)
+    events.publish("research.completed", idea_id, complete=True, completed=len(completed), total=len(SECTIONS))
+    return True
+
+
+def resume_incomplete() -> int:
+    """Resume research for ideas left RESEARCHING (e.g. by a crash).
+
+    Returns:
+        Number of runs started
+    """
+    with Session(engine) as session:
+        idea_ids = list(session.exec(select(Idea.id).where(Idea.status == IdeaStatus.RESEARCHING)))
+    started = sum(start_research(idea_id) for idea_id in idea_ids)
+    if started:
+        logger.info("Resumed research for %s idea(s)", started)
+    return started
+
+
+async def shutdown() -> None:
+    """Cancel runs in progress; saved sections are kept for resumption."""
+    tasks = list(_running.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
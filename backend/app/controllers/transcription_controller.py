@@ -4,51 +4,117 @@ from uuid import UUID
 
 from sqlmodel import Session
 
-from app.logger import logger
+from app import metrics
+from app.controllers import eager_processing
+from app.logger import get_logger
 from app.models import IdeaStatus
-from app.repos import idea_repo, transcript_repo
-from app.services import audio_service, cleaning_service, transcription_service
+from app.repos import audio_repo, idea_repo, transcript_repo
+from app.services import (
+    audio_service,
+    cleaning_service,
+    filler_dictionaries,
+    similarity_service,
+    transcription_service,
+)
+from app.tracing import traced
 
-AdapterType = Literal["gemini", "dummy"]
+logger = get_logger(__name__)
 
+transcription_reuse = metrics.counter(
+    "transcription_reuse_total", "Transcriptions by whether identical audio had already been transcribed"
+)
 
+AdapterType = Literal["gemini", "dummy", "replay"]
+
+
+@traced()
 async def transcribe_and_clean(
     session: Session,
     idea_id: UUID,
     adapter_type: AdapterType = "dummy",
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    reuse_eager: bool = True
 ) -> dict:
     """Full transcription workflow: transcribe audio and clean text.
     
+    If eager processing already transcribed (or is transcribing) the
+    uploaded audio with the same adapter, that result is returned instead.
+    Audio identical (by SHA-256) to audio the adapter has transcribed
+    before reuses that raw text without calling the adapter.
+    
     Args:
         session: Database session
         idea_id: Idea UUID
         adapter_type: Which adapter to use
         api_key: Optional API key
+        reuse_eager: Use a background transcription started on upload
         
     Returns:
         Dict with raw and cleaned transcription
     """
-    logger.info(f"Starting transcription workflow for idea {idea_id}")
+    if reuse_eager:
+        result = await eager_processing.claim(idea_id, adapter_type)
+        if result is not None:
+            logger.info("Using eager transcription for idea %s", idea_id)
+            return result
+    
+    logger.info("Starting transcription workflow for idea %s", idea_id)
     
     # Get idea and validate
     idea = idea_repo.get_idea(session, idea_id)
     if not idea:
         raise ValueError(f"Idea not found: {idea_id}")
     
-    if not idea.audio_blob:
+    audio_bytes = audio_service.get_audio(session, idea_id)
+    if not audio_bytes:
         raise ValueError(f"No audio uploaded for idea: {idea_id}")
     
-    # Transcribe audio
-    raw_text = await transcription_service.transcribe_audio_bytes(
-        audio_bytes=idea.audio_blob,
-        adapter_type=adapter_type,
-        api_key=api_key
-    )
+    # Identical audio already transcribed by this adapter: reuse the text
+    raw_text = None
+    if idea.audio_sha256:
+        raw_text = audio_repo.get_transcription(session, idea.audio_sha256, adapter_type)
+    transcription_reuse.inc(result="hit" if raw_text is not None else "miss")
+    
+    if raw_text is not None:
+        logger.info("Reusing transcription of identical audio %s for idea %s", idea.audio_sha256[:12], idea_id)
+    else:
+        # Transcribe audio
+        with metrics.stage("transcribe"):
+            raw_text = await transcription_service.transcribe_audio_bytes(
+                audio_bytes=audio_bytes,
+                adapter_type=adapter_type,
+                api_key=api_key
+            )
+        if idea.audio_sha256:
+            audio_repo.save_transcription(session, idea.audio_sha256, adapter_type, raw_text)
+    
+    # Clean transcript with the idea's language (auto-detected if unset)
+    with metrics.stage("clean"):
+        language = idea.language or filler_dictionaries.detect_language(raw_text)
+        cleaned_text = cleaning_service.clean_transcript(raw_text, language)
     
-    # Clean transcript
-    cleaned_text = cleaning_service.clean_transcript(raw_text)
+    return save_transcript(session, idea_id, raw_text, cleaned_text, language)
+
+
+def save_transcript(
+    session: Session,
+    idea_id: UUID,
+    raw_text: str,
+    cleaned_text: str,
+    language: str
+) -> dict:
+    """Store a finished transcription and mark the idea transcribed.
     
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+        raw_text: Transcription as returned by the adapter
+        cleaned_text: Cleaned transcription
+        language: Language used for cleaning
+        
+    Returns:
+        Dict with raw and cleaned transcription
+    """
     # Check if transcript exists
     existing = transcript_repo.get_transcript_by_idea(session, idea_id)
     
@@ -69,13 +135,17 @@ async def transcribe_and_clean(
             cleaned_text=cleaned_text
         )
     
+    # Keep near-duplicate index current
+    similarity_service.index_transcript(idea_id, cleaned_text)
+    
     # Update idea status
     idea_repo.update_idea_status(session, idea_id, IdeaStatus.TRANSCRIBED)
     
-    logger.info(f"Transcription complete for idea {idea_id}")
+    logger.info("Transcription complete for idea %s", idea_id)
     
     return {
         "transcript_id": str(transcript.id),
         "transcription_raw": raw_text,
-        "transcription_clean": cleaned_text
+        "transcription_clean": cleaned_text,
+        "language": language
     }
@@ -1,23 +1,63 @@
 """Database configuration and session management."""
 from typing import Generator
 
+from sqlalchemy import inspect, text
 from sqlmodel import Session, SQLModel, create_engine
 
+from app import events, http_cache, metrics, tracing
 from app.config import get_settings
 
 settings = get_settings()
 
-# Create engine
+# Create engine (SQL is logged via the "sqlalchemy.engine" logger, see app.logger)
 engine = create_engine(
     settings.database_url,
-    echo=settings.debug,
     connect_args={"check_same_thread": False}  # SQLite specific
 )
+metrics.instrument_engine(engine)
+tracing.instrument_engine(engine)
+http_cache.instrument_sessions(Session)
+events.instrument_sessions(Session)
+
+
+# Columns added to tables after their first release: (table, column, SQL type,
+# indexed, SQL expression filling existing rows or None). create_all only
+# creates missing tables, so existing databases get these here.
+ADDED_COLUMNS = [
+    ("idea", "language", "VARCHAR", False, None),
+    ("idea", "audio_sha256", "VARCHAR", True, None),
+    ("audioblob", "last_referenced_at", "DATETIME", False, "created_at"),
+]
+
+
+def _upgrade_schema() -> None:
+    """Add columns that tables created by older versions are missing."""
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    with engine.begin() as conn:
+        for table, column, sql_type, indexed, fill in ADDED_COLUMNS:
+            if table not in tables:
+                continue
+            if column not in {c["name"] for c in inspector.get_columns(table)}:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {sql_type}"))
+                if fill:
+                    conn.execute(text(f"UPDATE {table} SET {column} = {fill}"))
+            if indexed:
+                # Same name create_all gives the index of a Field(index=True)
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_{column} ON {table} ({column})"))
 
 
 def init_db() -> None:
     """Initialize database tables."""
     SQLModel.metadata.create_all(engine)
+    _upgrade_schema()
+
+    # Full-text search index (SQLite FTS5), backfilled on first creation
+    from app.repos import search_repo
+
+    with Session(engine) as session:
+        if search_repo.is_supported(session) and search_repo.create_index(session):
+            search_repo.rebuild_index(session)
 
 
 def get_session() -> Generator[Session, None, None]:
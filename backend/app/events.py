@@ -0,0 +1,226 @@
+"""Event Bus - in-process publish/subscribe for idea state changes.
+
+Committed database changes are turned into events by session hooks (the
+same approach as ``http_cache`` change counters), so every code path that
+creates an idea, changes its status, stores audio or writes a transcript
+publishes without calling the bus itself:
+
+- ``idea.created``, ``idea.deleted``
+- ``idea.status`` - ``{"status": ..., "previous": ...}``
+- ``audio.updated`` - ``{"has_audio": ..., "size_bytes": ...}``
+- ``transcript.updated`` - ``{"transcript_id": ..., "chars": ...}``
+
+Background jobs publish progress directly with ``publish`` (for example
+``research.section``).
+
+Subscribers get a bounded queue per connection, either for one idea or for
+all ideas. A subscriber that falls behind loses its oldest events and
+receives a ``stream.lagged`` event instead of slowing publishers down.
+Recent events are kept in a ring buffer so reconnecting SSE clients can
+resume from ``Last-Event-ID``.
+"""
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import event as sa_event
+from sqlalchemy import inspect
+
+from app import metrics
+
+QUEUE_SIZE = 256
+HISTORY_SIZE = 1000
+
+events_published = metrics.counter("events_published_total", "Events published by type")
+subscribers_gauge = metrics.gauge("event_subscribers", "Open event subscriptions")
+
+
+@dataclass
+class Event:
+    type: str
+    idea_id: Optional[str]
+    data: Dict[str, Any] = field(default_factory=dict)
+    id: int = 0
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "idea_id": self.idea_id,
+            "data": self.data,
+            "timestamp": self.timestamp,
+        }
+
+
+class Subscription:
+    """One subscriber's queue, filtered to an idea (or all ideas if None)."""
+
+    def __init__(self, bus: "EventBus", idea_id: Optional[str], loop: asyncio.AbstractEventLoop):
+        self.bus = bus
+        self.idea_id = idea_id
+        self.loop = loop
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.dropped = 0
+
+    def wants(self, event: Event) -> bool:
+        return self.idea_id is None or event.idea_id == self.idea_id
+
+    def _offer(self, event: Event) -> None:
+        """Enqueue, dropping the oldest event if the subscriber is behind."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """Next event (None on timeout). Reports lost events as stream.lagged."""
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            return Event("stream.lagged", self.idea_id, {"dropped": dropped})
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.bus.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EventBus:
+    """Fan-out of events to subscriptions on any event loop, from any thread."""
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        self._subscriptions: Set[Subscription] = set()
+        self._history: Deque[Event] = deque(maxlen=history_size)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def subscribe(self, idea_id: Optional[str] = None, last_event_id: Optional[int] = None) -> Subscription:
+        """Open a subscription on the running loop.
+
+        Args:
+            idea_id: Only deliver this idea's events (None: all ideas)
+            last_event_id: Replay buffered events newer than this id
+        """
+        subscription = Subscription(self, idea_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions.add(subscription)
+            if last_event_id is not None:
+                for past in self._history:
+                    if past.id > last_event_id and subscription.wants(past):
+                        subscription._offer(past)
+        subscribers_gauge.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            self._subscriptions.discard(subscription)
+        subscribers_gauge.dec()
+
+    def publish(self, type: str, idea_id: Optional[UUID | str] = None, **data: Any) -> Event:
+        """Publish an event to matching subscribers (non-blocking)."""
+        with self._lock:
+            event = Event(type, str(idea_id) if idea_id else None, data, next(self._ids))
+            self._history.append(event)
+            targets: List[Subscription] = [s for s in self._subscriptions if s.wants(event)]
+        events_published.inc(type=type)
+
+        for subscription in targets:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is subscription.loop:
+                subscription._offer(event)
+            elif not subscription.loop.is_closed():
+                subscription.loop.call_soon_threadsafe(subscription._offer, event)
+        return event
+
+    def history(self) -> List[Event]:
+        with self._lock:
+            return list(self._history)
+
+
+bus = EventBus()
+
+
+def publish(type: str, idea_id: Optional[UUID | str] = None, **data: Any) -> Event:
+    """Publish on the process-wide bus."""
+    return bus.publish(type, idea_id, **data)
+
+
+def _pending(session) -> List[tuple]:
+    return session.info.setdefault("pending_events", [])
+
+
+def _changed(obj, attribute: str) -> bool:
+    return inspect(obj).attrs[attribute].history.has_changes()
+
+
+def _transcript_event(transcript) -> tuple:
+    return ("transcript.updated", transcript.idea_id, {
+        "transcript_id": str(transcript.id),
+        "chars": len(transcript.cleaned_text or ""),
+    })
+
+
+def _collect(session) -> None:
+    """Turn flushed ORM changes into events (published after commit)."""
+    pending = _pending(session)
+    for obj in session.new:
+        table = getattr(obj, "__tablename__", None)
+        if table == "idea":
+            pending.append(("idea.created", obj.id, {"status": obj.status.value}))
+        elif table == "transcript":
+            pending.append(_transcript_event(obj))
+    for obj in session.dirty:
+        table = getattr(obj, "__tablename__", None)
+        if table == "idea":
+            if _changed(obj, "status"):
+                previous = inspect(obj).attrs.status.history.deleted
+                pending.append(("idea.status", obj.id, {
+                    "status": obj.status.value,
+                    "previous": previous[0].value if previous else None,
+                }))
+            if _changed(obj, "audio_sha256") or _changed(obj, "audio_blob"):
+                pending.append(("audio.updated", obj.id, {
+                    "has_audio": obj.audio_sha256 is not None or obj.audio_blob is not None,
+                    "size_bytes": obj.audio_size,
+                }))
+        elif table == "transcript" and (_changed(obj, "cleaned_text") or _changed(obj, "raw_text")):
+            pending.append(_transcript_event(obj))
+    for obj in session.deleted:
+        if getattr(obj, "__tablename__", None) == "idea":
+            pending.append(("idea.deleted", obj.id, {}))
+
+
+def instrument_sessions(session_class) -> None:
+    """Publish events for changes committed by sessions of session_class."""
+
+    # before_flush sees attribute history before it is reset by the flush
+    @sa_event.listens_for(session_class, "before_flush")
+    def _before_flush(session, flush_context, instances):
+        _collect(session)
+
+    @sa_event.listens_for(session_class, "after_commit")
+    def _after_commit(session):
+        for type, idea_id, data in session.info.pop("pending_events", []):
+            publish(type, idea_id, **data)
+
+    @sa_event.listens_for(session_class, "after_rollback")
+    def _after_rollback(session):
+        session.info.pop("pending_events", None)
@@ -0,0 +1,131 @@
+"""HTTP caching - weak ETags from table versions and Cache-Control policies.
+
+Every flush that inserts, updates or deletes rows replaces the
+``TableVersion`` row of each affected table with a fresh random version,
+in the same transaction. Read endpoints declare the tables they depend on
+and a Cache-Control policy::
+
+    @router.get("", dependencies=[Depends(http_cache.cached("idea"))])
+
+The dependency builds a weak ETag from those versions (one small query)
+and answers a matching ``If-None-Match`` with 304 before the endpoint
+loads any data. Otherwise the ETag and Cache-Control headers are stashed
+in the request state and added to the 200 response by
+``HttpCacheMiddleware``.
+
+Versions live in the database, so every worker process sees every commit,
+a rolled-back change never bumps them, and random versions mean a
+recreated database can't reproduce an ETag issued before.
+"""
+import uuid
+from typing import Callable, Dict, Iterable
+
+from fastapi import HTTPException, Request
+from sqlalchemy import event, select
+from sqlalchemy.dialects.sqlite import insert
+from starlette.datastructures import MutableHeaders
+
+from app.models import TableVersion
+
+# Cache-Control policies
+REVALIDATE = "private, no-cache"  # always revalidate; unchanged data costs a 304
+STATIC = "public, max-age=86400"  # fixed for the life of the process
+
+_STATE_KEY = "cache_headers"
+_PROCESS_TOKEN = uuid.uuid4().hex[:8]  # ETag of routes that depend on no table
+_TABLE = TableVersion.__table__
+
+
+def table_versions(tables: Iterable[str]) -> Dict[str, str]:
+    """Current versions of tables ("0" for tables never changed)."""
+    from app.db import engine  # app.db instruments sessions with this module
+
+    tables = list(tables)
+    with engine.connect() as conn:
+        rows = dict(conn.execute(select(_TABLE.c.name, _TABLE.c.version).where(_TABLE.c.name.in_(tables))).all())
+    return {table: rows.get(table, "0") for table in tables}
+
+
+def bump(connection, tables: Iterable[str]) -> None:
+    """Give tables new versions, in the transaction of connection."""
+    rows = [{"name": table, "version": uuid.uuid4().hex[:12]} for table in tables]
+    if rows:
+        statement = insert(_TABLE).values(rows)
+        connection.execute(statement.on_conflict_do_update(
+            index_elements=[_TABLE.c.name], set_={"version": statement.excluded.version}
+        ))
+
+
+def instrument_sessions(session_class) -> None:
+    """Bump table versions whenever sessions of session_class flush changes."""
+
+    @event.listens_for(session_class, "after_flush")
+    def _after_flush(session, flush_context):
+        changed = {
+            table
+            for obj in (*session.new, *session.dirty, *session.deleted)
+            if (table := getattr(obj, "__tablename__", None)) and table != _TABLE.name
+        }
+        bump(session.connection(), sorted(changed))
+
+
+def make_etag(*tables: str) -> str:
+    """Weak ETag for the current versions of tables."""
+    if not tables:
+        return f'W/"{_PROCESS_TOKEN}"'
+    return f'W/"{".".join(table_versions(tables).values())}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cached(*tables: str, cache_control: str = REVALIDATE) -> Callable[[Request], None]:
+    """Dependency adding conditional GET support to a route.
+
+    Args:
+        tables: Tables whose changes invalidate the response (none: the
+            response only changes on restart)
+        cache_control: Cache-Control header value
+
+    Raises:
+        HTTPException: 304 if the client's copy is current
+    """
+    def dependency(request: Request) -> None:
+        headers = {"ETag": make_etag(*tables), "Cache-Control": cache_control}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+            raise HTTPException(status_code=304, headers=headers)
+        request.scope.setdefault("state", {})[_STATE_KEY] = headers
+
+    return dependency
+
+
+class HttpCacheMiddleware:
+    """ASGI middleware adding the validators chosen by ``cached`` to 200 responses."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                cache_headers = scope.get("state", {}).get(_STATE_KEY)
+                if cache_headers:
+                    headers = MutableHeaders(scope=message)
+                    for name, value in cache_headers.items():
+                        headers.setdefault(name, value)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,35 +1,195 @@
-"""Logging configuration."""
+"""Logging configuration.
+
+Records are handed to a ``QueueHandler`` and written by a
+``QueueListener`` thread, so stream I/O never blocks the event loop
+(``LOG_QUEUE=false`` writes synchronously instead). Output is plain text
+or one JSON object per line (``LOG_FORMAT=json``), and every record
+carries the id of the request it was logged under.
+
+Modules log through ``get_logger(__name__)``, which returns a child of
+the ``idea_tracker`` logger, so levels can be set per module with
+``LOG_LEVELS`` (e.g. ``idea_tracker.adapters=DEBUG,sqlalchemy.engine=WARNING``).
+Log with %-style arguments (``logger.info("Saved %s", x)``) so messages
+below the active level are never formatted.
+"""
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Dict, Optional
 
 from app.config import get_settings
 
+ROOT_LOGGER = "idea_tracker"
 
-def setup_logger(name: str = "idea_tracker") -> logging.Logger:
-    """Create and configure a logger instance."""
-    settings = get_settings()
-    
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
-    
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
-    
-    # Console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(logging.DEBUG if settings.debug else logging.INFO)
-    
-    # Format
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+# SQL statements (formerly engine echo) are logged here when debug is on
+SQL_LOGGER = "sqlalchemy.engine"
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+request_id: ContextVar[str] = ContextVar("request_id", default="-")
+
+_listener: Optional[QueueListener] = None
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp records with the current request id."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(QueueHandler):
+    """QueueHandler that keeps the traceback out of the message.
+
+    The stock ``prepare`` folds the formatted traceback into ``msg``; this
+    keeps it in ``exc_text`` so the listener's formatter can place it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _parse_levels(spec: str) -> Dict[str, str]:
+    """Parse "logger=LEVEL,logger=LEVEL" into a dict."""
+    levels = {}
+    for item in spec.split(","):
+        name, sep, level = item.partition("=")
+        if sep and name.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def _build_formatter(fmt: str) -> logging.Formatter:
+    if fmt == "json":
+        return JsonFormatter()
+    return logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     )
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-    
-    return logger
 
 
+def configure_logging(stream: Optional[IO[str]] = None) -> None:
+    """(Re)configure the app and SQL loggers from settings.
+
+    Args:
+        stream: Output stream (stdout if omitted)
+    """
+    global _listener
+    settings = get_settings()
+    stop_logging()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(_build_formatter(settings.log_format))
+
+    if settings.log_queue:
+        handler: logging.Handler = _QueueHandler(queue.SimpleQueue())
+        _listener = QueueListener(handler.queue, output)
+        _listener.start()
+    else:
+        handler = output
+    handler.addFilter(RequestIdFilter())
+
+    level = settings.log_level.upper() or ("DEBUG" if settings.debug else "INFO")
+    levels = {ROOT_LOGGER: level, SQL_LOGGER: "INFO" if settings.debug else "WARNING"}
+    levels.update(_parse_levels(settings.log_levels))
+
+    for name in (ROOT_LOGGER, SQL_LOGGER):
+        target = logging.getLogger(name)
+        target.handlers.clear()
+        target.addHandler(handler)
+        target.propagate = False
+    for name, name_level in levels.items():
+        logging.getLogger(name).setLevel(name_level)
+
+
+def stop_logging() -> None:
+    """Flush and stop the queue listener, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a module logger under the app logger.
+
+    Args:
+        name: Module name, usually __name__ ("app.services.x" becomes
+            "idea_tracker.services.x")
+    """
+    if name.startswith("app."):
+        name = name[len("app."):]
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class RequestIdMiddleware:
+    """ASGI middleware binding a request id for log records.
+
+    Reuses the client's X-Request-Id header when present and echoes the id
+    on the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rid = None
+        for name, value in scope.get("headers", ()):
+            if name == REQUEST_ID_HEADER:
+                rid = value.decode("latin-1")[:64]
+                break
+        rid = rid or os.urandom(8).hex()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER, rid.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = request_id.set(rid)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id.reset(token)
+
+
+configure_logging()
+atexit.register(stop_logging)
+
 # Default logger instance
-logger = setup_logger()
+logger = logging.getLogger(ROOT_LOGGER)
@@ -3,11 +3,17 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlmodel import Session
 
+from app import compression, http_cache, metrics, profiling, tracing
 from app.config import get_settings
-from app.db import init_db
-from app.logger import logger
+from app.controllers import analysis_controller, audio_tiering, eager_processing, research_engine
+from app.db import engine, init_db
+from app.logger import RequestIdMiddleware, get_logger
 from app.routers import api_router
+from app.services import audio_preprocessing, cleaning_service, filler_dictionaries, similarity_service, upload_service
+
+logger = get_logger(__name__)
 
 
 @asynccontextmanager
@@ -17,9 +23,18 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Idea Tracker API...")
     init_db()
     logger.info("Database initialized.")
+    similarity_service.init_index()
+    with Session(engine) as session:
+        upload_service.cleanup_expired(session)
+    research_engine.resume_incomplete()
+    audio_tiering.start()
     yield
     # Shutdown
     logger.info("Shutting down Idea Tracker API...")
+    await research_engine.shutdown()
+    await eager_processing.shutdown()
+    await audio_tiering.shutdown()
+    audio_preprocessing.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -42,6 +57,28 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Brotli/gzip for large JSON and text responses
+    app.add_middleware(compression.CompressionMiddleware)
+    
+    # ETag/Cache-Control headers for routes declaring http_cache.cached(...)
+    app.add_middleware(http_cache.HttpCacheMiddleware)
+    
+    # Per-route latency, status and in-flight metrics
+    app.add_middleware(metrics.MetricsMiddleware)
+    metrics.track_cache("settings", get_settings)
+    metrics.track_cache("cleaner", cleaning_service.get_cleaner)
+    metrics.track_cache("filler_dictionary", filler_dictionaries.load_dictionary)
+    metrics.track_cache("analysis", analysis_controller.results_cache)
+    
+    # Request-scoped span tree, Server-Timing header and slow-request dumps
+    app.add_middleware(tracing.TracingMiddleware)
+    
+    # Sampling profiler for requests that opt in (X-Profile header or PROFILER_MODE)
+    app.add_middleware(profiling.ProfilerMiddleware)
+    
+    # Request id for log records (outermost, so every layer logs with it)
+    app.add_middleware(RequestIdMiddleware)
+    
     # Include routers
     app.include_router(api_router)
     
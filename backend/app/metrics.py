@@ -0,0 +1,324 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+Counters, gauges and histograms are plain dicts guarded by one lock, so
+recording a sample costs a dict lookup and a bisect - cheap enough to
+leave on in production. ``render()`` produces the Prometheus text format
+served by ``GET /metrics``.
+"""
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+
+# Latency buckets in seconds: sub-ms SQLite queries up to multi-second model calls
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+_lock = threading.Lock()
+
+
+def _key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in key) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, LabelKey, float]]:
+        return [(self.name, key, value) for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    """Value that can go up and down (e.g. requests in flight)."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with _lock:
+            self._values[_key(labels)] = value
+
+    @contextmanager
+    def track(self, **labels: str) -> Iterator[None]:
+        """Increment for the duration of a block."""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelKey, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _key(labels)
+        index = bisect_left(self.buckets, value)
+        with _lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall-clock duration of a block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        series = self._values.get(_key(labels))
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> List[Tuple[str, LabelKey, float]]:
+        samples = []
+        for key, series in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                samples.append((f"{self.name}_bucket", key + (("le", _format_value(bound)),), cumulative))
+            samples.append((f"{self.name}_sum", key, series[-1]))
+            samples.append((f"{self.name}_count", key, cumulative))
+        return samples
+
+
+class Registry:
+    """Holds metrics and scrape-time collectors."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric):
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run a callback before each scrape (to refresh gauges)."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format (0.0.4)."""
+        for collector in self._collectors:
+            collector()
+
+        lines = []
+        with _lock:
+            for metric in self._metrics.values():
+                lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+                for name, key, value in metric.samples():
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def counter(name: str, help_text: str) -> Counter:
+    return registry.register(Counter(name, help_text))
+
+
+def gauge(name: str, help_text: str) -> Gauge:
+    return registry.register(Gauge(name, help_text))
+
+
+def histogram(name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    return registry.register(Histogram(name, help_text, buckets))
+
+
+# Application metrics
+http_requests = counter("http_requests_total", "HTTP requests by route, method and status")
+http_latency = histogram("http_request_duration_seconds", "HTTP request latency by route")
+http_in_flight = gauge("http_requests_in_flight", "HTTP requests currently being served")
+pipeline_stage_latency = histogram("pipeline_stage_duration_seconds", "Idea pipeline stage latency")
+adapter_latency = histogram("adapter_call_duration_seconds", "Model adapter call latency")
+adapter_errors = counter("adapter_call_errors_total", "Model adapter calls that raised")
+adapter_in_flight = gauge("adapter_calls_in_flight", "Model adapter calls in progress")
+db_query_latency = histogram("db_query_duration_seconds", "Database query latency")
+db_queries_per_request = histogram(
+    "db_queries_per_request", "Database queries issued per HTTP request", COUNT_BUCKETS
+)
+db_time_per_request = histogram(
+    "db_time_per_request_seconds", "Total database time per HTTP request"
+)
+cache_hits = gauge("cache_hits", "Cache hits by cache since process start")
+cache_misses = gauge("cache_misses", "Cache misses by cache since process start")
+cache_hit_ratio = gauge("cache_hit_ratio", "Cache hit ratio by cache")
+
+# Per-request DB tally: [query count, total seconds], set by the middleware
+_request_db: ContextVar[Optional[List[float]]] = ContextVar("request_db", default=None)
+
+
+def enabled() -> bool:
+    return get_settings().metrics_enabled
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time one idea-pipeline stage."""
+    if not enabled():
+        yield
+        return
+    with pipeline_stage_latency.time(stage=name):
+        yield
+
+
+def instrument_adapter_method(adapter_name: str, method_name: str, func: Callable) -> Callable:
+    """Wrap an async adapter method with latency, error and in-flight metrics."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not enabled():
+            return await func(*args, **kwargs)
+        labels = {"adapter": adapter_name, "method": method_name}
+        started = time.perf_counter()
+        adapter_in_flight.inc(**labels)
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            adapter_errors.inc(**labels)
+            raise
+        finally:
+            adapter_in_flight.dec(**labels)
+            adapter_latency.observe(time.perf_counter() - started, **labels)
+
+    return wrapper
+
+
+def track_cache(name: str, cached_function) -> None:
+    """Report a functools.lru_cache's hit/miss counts at scrape time."""
+
+    def collect() -> None:
+        info = cached_function.cache_info()
+        total = info.hits + info.misses
+        cache_hits.set(info.hits, cache=name)
+        cache_misses.set(info.misses, cache=name)
+        cache_hit_ratio.set(info.hits / total if total else 0.0, cache=name)
+
+    registry.add_collector(collect)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every SQL statement and tally them per request."""
+
+    # The start time lives on the statement's execution context, so a
+    # statement that raises (no after_cursor_execute) leaves nothing behind
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_metrics_started", None)
+        if started is None or not enabled():
+            return
+        elapsed = time.perf_counter() - started
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else "OTHER"
+        db_query_latency.observe(elapsed, operation=operation)
+        tally = _request_db.get()
+        if tally is not None:
+            tally[0] += 1
+            tally[1] += elapsed
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording per-route latency, status and in-flight gauges."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not enabled():
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        tally = [0, 0.0]
+        token = _request_db.set(tally)
+        started = time.perf_counter()
+        http_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_in_flight.dec()
+            _request_db.reset(token)
+
+            route = scope.get("route")
+            # Unmatched paths share one label so 404 scans can't explode cardinality
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            http_requests.inc(route=path, method=method, status=str(status["code"]))
+            http_latency.observe(elapsed, route=path, method=method)
+            db_queries_per_request.observe(tally[0], route=path)
+            db_time_per_request.observe(tally[1], route=path)
@@ -22,13 +22,37 @@ class Idea(SQLModel, table=True):
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     title: Optional[str] = None
     status: IdeaStatus = IdeaStatus.DRAFT
-    audio_path: Optional[str] = None  # Deprecated, use audio_blob
-    audio_blob: Optional[bytes] = Field(default=None, sa_type=LargeBinary)
+    audio_path: Optional[str] = None  # Deprecated, use audio_sha256
+    audio_blob: Optional[bytes] = Field(default=None, sa_type=LargeBinary)  # Legacy inline audio
     audio_size: Optional[int] = None
+    audio_sha256: Optional[str] = Field(default=None, index=True)  # AudioBlob holding the audio
+    language: Optional[str] = None  # Transcript language; auto-detected if unset
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class AudioBlob(SQLModel, table=True):
+    """Audio content stored once per SHA-256, shared by every idea using it."""
+    sha256: str = Field(primary_key=True)
+    data: Optional[bytes] = Field(default=None, sa_type=LargeBinary)  # None when on disk
+    size: int  # original size
+    refcount: int = 0  # ideas referencing this audio
+    tier: str = "hot"  # hot | compressed (in the DB) | disk (file in AUDIO_COLD_DIR)
+    codec: str = "none"  # none | zlib, how the stored bytes are encoded
+    stored_size: Optional[int] = None  # bytes actually stored
+    path: Optional[str] = None  # file of the disk tier
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    last_referenced_at: datetime = Field(default_factory=datetime.utcnow)  # last upload of this audio
+
+
+class AudioTranscription(SQLModel, table=True):
+    """Raw transcription of an audio blob by one adapter, reused for identical audio."""
+    sha256: str = Field(primary_key=True)
+    adapter: str = Field(primary_key=True)
+    raw_text: str
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class Transcript(SQLModel, table=True):
     """Transcription of an idea's audio."""
     id: UUID = Field(default_factory=uuid4, primary_key=True)
@@ -59,3 +83,20 @@ class ResearchReport(SQLModel, table=True):
     report_json: str = "{}"  # JSON string for structured sections A-K
     summary: str = ""
     created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class AudioUpload(SQLModel, table=True):
+    """Resumable audio upload in progress (bytes are staged on disk)."""
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    idea_id: UUID = Field(foreign_key="idea.id", index=True)
+    size: int  # total bytes the client will send
+    sha256: Optional[str] = None  # expected digest of the whole file, if given
+    filename: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class TableVersion(SQLModel, table=True):
+    """Opaque version of a table's contents, replaced on every committed change (HTTP ETags)."""
+    name: str = Field(primary_key=True)
+    version: str
@@ -0,0 +1,193 @@
+"""On-demand sampling profiler for slow requests.
+
+A background thread snapshots every thread's Python stack with
+``sys._current_frames()`` at a fixed interval while a profiled request is
+running. Samples are aggregated into the "collapsed stack" format
+(``frame;frame;frame count`` per line) understood by flamegraph.pl,
+speedscope and inferno, and stored only when the request turns out to be
+slower than ``profile_slow_threshold_ms``.
+
+Requests are profiled when ``PROFILER_MODE=always``, or with
+``PROFILER_MODE=header`` when they carry ``X-Profile: 1``. The default is
+``off``: header mode lets any client turn sampling on, so operators opt in.
+With the profiler off, or no header, the middleware adds one header lookup.
+"""
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+
+from app.config import get_settings
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+
+# Leaf frames of threads parked waiting for work (dropped from samples)
+IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("handlers.py", "_monitor"),
+}
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+class Sampler:
+    """Samples all thread stacks on a background thread."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            if len(names) != len(frames):
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                stack = self._collapse(frame)
+                if stack:
+                    self.stacks[f"{names.get(thread_id, thread_id)};{stack}"] += 1
+            self.samples += 1
+
+    @staticmethod
+    def _collapse(frame) -> Optional[str]:
+        code = frame.f_code
+        if (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+            return None
+        parts = []
+        while frame is not None:
+            code = frame.f_code
+            parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        return ";".join(reversed(parts))
+
+    def collapsed(self) -> str:
+        """Render samples as collapsed stacks, heaviest first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfileStore:
+    """Keeps the most recent profiles on disk with their metadata."""
+
+    def __init__(self, directory: Path, max_profiles: int):
+        self.directory = directory
+        self._profiles: Deque[dict] = deque()
+        self._max = max_profiles
+        self._lock = threading.Lock()
+
+    def save(self, method: str, path: str, duration_ms: float, sampler: Sampler) -> dict:
+        created = time.time()
+        slug = _SLUG_RE.sub("-", path).strip("-") or "root"
+        profile_id = f"{int(created * 1000)}-{method.lower()}-{slug}"[:120]
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"{profile_id}.collapsed").write_text(sampler.collapsed(), encoding="utf-8")
+
+        info = {
+            "id": profile_id,
+            "method": method,
+            "path": path,
+            "duration_ms": round(duration_ms, 2),
+            "samples": sampler.samples,
+            "created_at": created,
+        }
+        with self._lock:
+            self._profiles.appendleft(info)
+            while len(self._profiles) > self._max:
+                stale = self._profiles.pop()
+                (self.directory / f"{stale['id']}.collapsed").unlink(missing_ok=True)
+        return info
+
+    def list(self) -> List[dict]:
+        with self._lock:
+            return list(self._profiles)
+
+    def path(self, profile_id: str) -> Optional[Path]:
+        """Get a stored profile's file, if it is still kept."""
+        with self._lock:
+            if not any(info["id"] == profile_id for info in self._profiles):
+                return None
+        return self.directory / f"{profile_id}.collapsed"
+
+
+_store: Optional[ProfileStore] = None
+
+
+def get_store() -> ProfileStore:
+    global _store
+    if _store is None:
+        settings = get_settings()
+        _store = ProfileStore(Path(settings.profile_dir), settings.profile_max_stored)
+    return _store
+
+
+class ProfilerMiddleware:
+    """ASGI middleware profiling requests that opt in.
+
+    Only one request is profiled at a time; samples cover every thread, so
+    concurrent work shows up under its own thread and frames.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._busy = threading.Lock()
+
+    def _wanted(self, scope) -> bool:
+        mode = get_settings().profiler_mode
+        headers = dict(scope.get("headers", ()))
+        # Event streams stay open; profiling one would hold the profiler until it closes
+        if b"text/event-stream" in headers.get(b"accept", b""):
+            return False
+        if mode == "always":
+            return True
+        if mode != "header":
+            return False
+        value = headers.get(PROFILE_HEADER)
+        return value is not None and value.strip() in (b"1", b"true")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wanted(scope) or not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        settings = get_settings()
+        sampler = Sampler(settings.profile_interval_ms / 1000)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            sampler.stop()
+            self._busy.release()
+            duration_ms = (time.perf_counter() - started) * 1000
+            if duration_ms >= settings.profile_slow_threshold_ms and sampler.samples:
+                route = scope.get("route")
+                path = getattr(route, "path", None) or scope["path"]
+                try:
+                    info = get_store().save(scope["method"], path, duration_ms, sampler)
+                    logger.info("Stored profile %s (%.0fms)", info["id"], duration_ms)
+                except OSError as e:
+                    logger.error("Failed to store profile: %s", e)
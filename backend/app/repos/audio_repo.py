@@ -0,0 +1,98 @@
+"""Audio Repository - content-addressed audio storage.
+
+Audio is stored once per SHA-256 in ``AudioBlob`` and shared by every idea
+whose ``audio_sha256`` points at it. ``refcount`` counts those ideas; a
+blob is deleted when the last one lets go. Raw transcriptions are keyed by
+(hash, adapter) so identical audio is never transcribed twice with the
+same adapter. They are small and outlive their blob, so audio that is
+deleted and uploaded again is still recognized.
+
+Blobs move between storage tiers (see ``controllers/audio_tiering``); use
+``audio_service.read_blob`` rather than ``AudioBlob.data`` to read them.
+"""
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlmodel import Session
+
+from app.models import AudioBlob, AudioTranscription
+
+
+def get_blob(session: Session, sha256: str) -> Optional[AudioBlob]:
+    """Get stored audio by its SHA-256."""
+    return session.get(AudioBlob, sha256)
+
+
+def acquire(
+    session: Session,
+    sha256: str,
+    data: bytes,
+    referenced_at: Optional[datetime] = None
+) -> Tuple[AudioBlob, bool]:
+    """Add a reference to audio, storing it if it is new.
+
+    Changes are flushed, not committed; the caller commits along with the
+    idea that now points at the blob.
+
+    Args:
+        session: Database session
+        sha256: Digest of data (hex)
+        data: Audio bytes
+        referenced_at: When the reference was made (default now); tiering
+            and retention count a blob's age from its latest reference
+
+    Returns:
+        The blob and whether it already existed
+    """
+    referenced_at = referenced_at or datetime.utcnow()
+    blob = get_blob(session, sha256)
+    existed = blob is not None
+    if blob is None:
+        blob = AudioBlob(
+            sha256=sha256, data=data, size=len(data), stored_size=len(data),
+            created_at=referenced_at, last_referenced_at=referenced_at,
+        )
+    else:
+        blob.last_referenced_at = max(blob.last_referenced_at, referenced_at)
+    blob.refcount += 1
+    session.add(blob)
+    session.flush()
+    return blob, existed
+
+
+def release(session: Session, sha256: Optional[str]) -> bool:
+    """Drop a reference to audio, deleting it with the last one.
+
+    Like ``acquire`` this flushes without committing.
+
+    Returns:
+        True if the blob was deleted
+    """
+    blob = get_blob(session, sha256) if sha256 else None
+    if blob is None:
+        return False
+    blob.refcount -= 1
+    if blob.refcount <= 0:
+        session.delete(blob)
+        session.flush()
+        return True
+    session.add(blob)
+    session.flush()
+    return False
+
+
+def get_transcription(session: Session, sha256: str, adapter: str) -> Optional[str]:
+    """Raw text of an earlier transcription of this audio by this adapter."""
+    row = session.get(AudioTranscription, (sha256, adapter))
+    return row.raw_text if row else None
+
+
+def save_transcription(session: Session, sha256: str, adapter: str, raw_text: str) -> None:
+    """Remember a raw transcription for identical audio (committed)."""
+    row = session.get(AudioTranscription, (sha256, adapter))
+    if row is None:
+        row = AudioTranscription(sha256=sha256, adapter=adapter, raw_text=raw_text)
+    else:
+        row.raw_text = raw_text
+    session.add(row)
+    session.commit()
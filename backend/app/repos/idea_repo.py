@@ -1,25 +1,32 @@
 """Idea Repository - CRUD operations for ideas."""
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from sqlmodel import Session, select
 
 from app.db import get_session
 from app.models import Idea, IdeaStatus
+from app.repos import audio_repo, search_repo
 
 
-def create_idea(session: Session, title: Optional[str] = None) -> Idea:
+def create_idea(
+    session: Session,
+    title: Optional[str] = None,
+    language: Optional[str] = None
+) -> Idea:
     """Create a new idea.
     
     Args:
         session: Database session
         title: Optional title
+        language: Optional transcript language code
         
     Returns:
         Created idea
     """
-    idea = Idea(title=title)
+    idea = Idea(title=title, language=language)
     session.add(idea)
+    search_repo.index_idea(session, idea.id, title=title or "")
     session.commit()
     session.refresh(idea)
     return idea
@@ -52,6 +59,59 @@ def get_all_ideas(session: Session) -> List[Idea]:
     return list(results.all())
 
 
+# Columns served by the list/detail endpoints (audio_blob is never loaded)
+IDEA_ROW_COLUMNS = (
+    Idea.id, Idea.title, Idea.status, Idea.audio_path,
+    Idea.language, Idea.created_at, Idea.updated_at,
+)
+
+
+def get_all_idea_rows(session: Session) -> List[dict]:
+    """Get all ideas as plain dicts of the response columns.
+
+    Skips ORM object construction, which matters for large listings.
+
+    Args:
+        session: Database session
+
+    Returns:
+        List of dicts keyed by column name, newest first
+    """
+    statement = select(*IDEA_ROW_COLUMNS).order_by(Idea.created_at.desc())
+    return [dict(row) for row in session.exec(statement).mappings()]
+
+
+def get_idea_row(session: Session, idea_id: UUID) -> Optional[dict]:
+    """Get one idea as a plain dict of the response columns.
+
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+
+    Returns:
+        Dict keyed by column name if found, None otherwise
+    """
+    statement = select(*IDEA_ROW_COLUMNS).where(Idea.id == idea_id)
+    row = session.exec(statement).mappings().first()
+    return dict(row) if row else None
+
+
+def get_ideas_by_ids(session: Session, idea_ids: List[UUID]) -> Dict[UUID, Idea]:
+    """Get several ideas in one query.
+    
+    Args:
+        session: Database session
+        idea_ids: Idea UUIDs
+        
+    Returns:
+        Dict of idea UUID to idea, missing IDs omitted
+    """
+    if not idea_ids:
+        return {}
+    statement = select(Idea).where(Idea.id.in_(idea_ids))
+    return {idea.id: idea for idea in session.exec(statement).all()}
+
+
 def update_idea_status(
     session: Session,
     idea_id: UUID,
@@ -112,7 +172,9 @@ def delete_idea(session: Session, idea_id: UUID) -> bool:
     """
     idea = get_idea(session, idea_id)
     if idea:
+        audio_repo.release(session, idea.audio_sha256)
         session.delete(idea)
+        search_repo.remove_idea(session, idea_id)
         session.commit()
         return True
     return False
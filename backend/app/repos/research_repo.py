@@ -0,0 +1,126 @@
+"""Research Repository - persistence for research reports.
+
+``ResearchReport.report_json`` holds::
+
+    {"adapter": "gemini",
+     "sections": {"A": {"title": ..., "status": "completed", "content": ..., "completed_at": ...},
+                  "B": {"title": ..., "status": "failed", "error": ...}}}
+
+Sections are saved one at a time as they finish, so a partially written
+report is readable and a crashed run can resume from it.
+"""
+import json
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlmodel import Session, select
+
+from app.models import ResearchReport
+
+
+def get_report_by_idea(session: Session, idea_id: UUID) -> Optional[ResearchReport]:
+    """Get the research report for an idea.
+
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+
+    Returns:
+        Report if found
+    """
+    statement = select(ResearchReport).where(ResearchReport.idea_id == idea_id)
+    return session.exec(statement).first()
+
+
+def get_or_create_report(session: Session, idea_id: UUID, adapter: str) -> ResearchReport:
+    """Get an idea's report, creating an empty one if needed.
+
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+        adapter: Adapter name recorded for new reports
+
+    Returns:
+        Existing or created report
+    """
+    report = get_report_by_idea(session, idea_id)
+    if report is None:
+        report = ResearchReport(
+            idea_id=idea_id,
+            report_json=json.dumps({"adapter": adapter, "sections": {}})
+        )
+        session.add(report)
+        session.commit()
+        session.refresh(report)
+    return report
+
+
+def report_data(report: ResearchReport) -> dict:
+    """Decode a report's JSON, tolerating the legacy empty "{}"."""
+    data = json.loads(report.report_json or "{}")
+    data.setdefault("sections", {})
+    return data
+
+
+def save_section(
+    session: Session,
+    idea_id: UUID,
+    key: str,
+    title: str,
+    content: Optional[str] = None,
+    error: Optional[str] = None
+) -> Optional[ResearchReport]:
+    """Store one section's result (content, or the error that stopped it).
+
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+        key: Section key
+        title: Section title
+        content: Section text if generated
+        error: Error message if generation failed
+
+    Returns:
+        Updated report, None if the report no longer exists
+    """
+    report = get_report_by_idea(session, idea_id)
+    if report is None:
+        return None
+
+    data = report_data(report)
+    if error is None:
+        data["sections"][key] = {
+            "title": title,
+            "status": "completed",
+            "content": content,
+            "completed_at": datetime.utcnow().isoformat(),
+        }
+    else:
+        data["sections"][key] = {"title": title, "status": "failed", "error": error}
+
+    report.report_json = json.dumps(data)
+    session.add(report)
+    session.commit()
+    session.refresh(report)
+    return report
+
+
+def set_summary(session: Session, idea_id: UUID, summary: str) -> Optional[ResearchReport]:
+    """Set the report's summary.
+
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+        summary: Summary text
+
+    Returns:
+        Updated report if found
+    """
+    report = get_report_by_idea(session, idea_id)
+    if report:
+        report.summary = summary
+        session.add(report)
+        session.commit()
+        session.refresh(report)
+    return report
@@ -0,0 +1,242 @@
+"""Search Repository - SQLite FTS5 index over idea titles, transcripts and summaries."""
+import re
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.models import Idea, Transcript
+
+SEARCH_TABLE = "idea_search"
+
+# Column weights for bm25(): title, transcript, summary (idea_id is unindexed)
+BM25_WEIGHTS = (0.0, 10.0, 1.0, 3.0)
+
+SNIPPET_TOKENS = 16
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_CREATE_SQL = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+    idea_id UNINDEXED,
+    title,
+    transcript,
+    summary,
+    tokenize = 'porter unicode61'
+)
+"""
+
+
+def _rowid(idea_id: UUID) -> int:
+    """Derive a stable FTS rowid from an idea UUID.
+
+    Ideas are keyed by UUID, so the index uses the low 63 bits of the UUID
+    as its rowid. This keeps updates and deletes on the rowid b-tree
+    (no scan over the unindexed idea_id column) and survives VACUUM.
+    """
+    return idea_id.int & 0x7FFFFFFFFFFFFFFF
+
+
+def is_supported(session: Session) -> bool:
+    """Check whether the bound database supports the FTS5 index."""
+    return session.get_bind().dialect.name == "sqlite"
+
+
+def create_index(session: Session) -> bool:
+    """Create the FTS5 table if missing.
+
+    Args:
+        session: Database session
+
+    Returns:
+        True if the table was newly created (and needs a rebuild)
+    """
+    exists = session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": SEARCH_TABLE}
+    ).first()
+    if exists:
+        return False
+    session.execute(text(_CREATE_SQL))
+    session.commit()
+    return True
+
+
+def rebuild_index(session: Session) -> int:
+    """Repopulate the index from the idea and transcript tables.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Number of ideas indexed
+    """
+    session.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+
+    transcripts = {
+        t.idea_id: t.cleaned_text
+        for t in session.exec(select(Transcript)).all()
+    }
+
+    count = 0
+    for idea in session.exec(select(Idea)).all():
+        session.execute(
+            text(
+                f"INSERT INTO {SEARCH_TABLE}(rowid, idea_id, title, transcript, summary) "
+                "VALUES (:rowid, :idea_id, :title, :transcript, '')"
+            ),
+            {
+                "rowid": _rowid(idea.id),
+                "idea_id": str(idea.id),
+                "title": idea.title or "",
+                "transcript": transcripts.get(idea.id, ""),
+            }
+        )
+        count += 1
+
+    session.commit()
+    return count
+
+
+def index_idea(
+    session: Session,
+    idea_id: UUID,
+    title: Optional[str] = None,
+    transcript: Optional[str] = None,
+    summary: Optional[str] = None
+) -> None:
+    """Insert or update the indexed fields of an idea.
+
+    Only the fields that are not None are written. Does not commit, so the
+    caller's repo write and the index update share one transaction.
+
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+        title: New title (optional)
+        transcript: New cleaned transcript text (optional)
+        summary: New summary text (optional)
+    """
+    if not is_supported(session):
+        return
+
+    fields = {
+        name: value
+        for name, value in (("title", title), ("transcript", transcript), ("summary", summary))
+        if value is not None
+    }
+    params = {"rowid": _rowid(idea_id), "idea_id": str(idea_id), **fields}
+
+    if fields:
+        assignments = ", ".join(f"{name} = :{name}" for name in fields)
+        result = session.execute(
+            text(f"UPDATE {SEARCH_TABLE} SET {assignments} WHERE rowid = :rowid"),
+            params
+        )
+        if result.rowcount:
+            return
+
+    session.execute(
+        text(
+            f"INSERT OR IGNORE INTO {SEARCH_TABLE}(rowid, idea_id, title, transcript, summary) "
+            "VALUES (:rowid, :idea_id, :title, :transcript, :summary)"
+        ),
+        {
+            "title": "",
+            "transcript": "",
+            "summary": "",
+            **params,
+        }
+    )
+
+
+def index_summary(session: Session, idea_id: UUID, summary: str) -> None:
+    """Store a generated summary in the index and commit.
+
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+        summary: Summary text
+    """
+    index_idea(session, idea_id, summary=summary)
+    session.commit()
+
+
+def remove_idea(session: Session, idea_id: UUID) -> None:
+    """Remove an idea from the index. Does not commit.
+
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+    """
+    if not is_supported(session):
+        return
+
+    session.execute(
+        text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :rowid"),
+        {"rowid": _rowid(idea_id)}
+    )
+
+
+def build_match_query(query: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted (so FTS5 operators in user input are inert) and
+    the terms are ANDed. The last word is a prefix match so partially
+    typed queries still hit.
+
+    Args:
+        query: User search text
+
+    Returns:
+        FTS5 query string, empty if the input has no searchable words
+    """
+    tokens = _TOKEN_RE.findall(query)
+    if not tokens:
+        return ""
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def search(
+    session: Session,
+    query: str,
+    limit: int = 20,
+    offset: int = 0
+) -> Tuple[int, List[Tuple[UUID, float, str]]]:
+    """Run a ranked full-text search.
+
+    Args:
+        session: Database session
+        query: User search text
+        limit: Max hits to return
+        offset: Number of hits to skip
+
+    Returns:
+        Tuple of (total hit count, list of (idea_id, score, snippet)),
+        highest score first
+    """
+    match = build_match_query(query)
+    if not match or not is_supported(session):
+        return 0, []
+
+    total = session.execute(
+        text(f"SELECT count(*) FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :match"),
+        {"match": match}
+    ).scalar_one()
+
+    weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+    rows = session.execute(
+        text(
+            f"SELECT idea_id, bm25({SEARCH_TABLE}, {weights}) AS rank, "
+            f"snippet({SEARCH_TABLE}, -1, '<mark>', '</mark>', '…', {SNIPPET_TOKENS}) "
+            f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :match "
+            "ORDER BY rank LIMIT :limit OFFSET :offset"
+        ),
+        {"match": match, "limit": limit, "offset": offset}
+    ).all()
+
+    # bm25() is "lower is better"; flip it so callers get a positive score
+    return total, [(UUID(row[0]), -row[1], row[2]) for row in rows]
@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlmodel import Session, select
 
 from app.models import Transcript
+from app.repos import search_repo
 
 
 def create_transcript(
@@ -30,6 +31,7 @@ def create_transcript(
         cleaned_text=cleaned_text
     )
     session.add(transcript)
+    search_repo.index_idea(session, idea_id, transcript=cleaned_text)
     session.commit()
     session.refresh(transcript)
     return transcript
@@ -63,6 +65,28 @@ def get_transcript_by_idea(session: Session, idea_id: UUID) -> Optional[Transcri
     return results.first()
 
 
+def get_transcript_row(session: Session, idea_id: UUID) -> Optional[dict]:
+    """Get an idea's transcript as a plain dict shaped like the API response.
+
+    Args:
+        session: Database session
+        idea_id: Idea UUID
+
+    Returns:
+        Dict with transcript_id, idea_id, raw_text, cleaned_text and
+        created_at if found
+    """
+    statement = select(
+        Transcript.id.label("transcript_id"),
+        Transcript.idea_id,
+        Transcript.raw_text,
+        Transcript.cleaned_text,
+        Transcript.created_at,
+    ).where(Transcript.idea_id == idea_id)
+    row = session.exec(statement).mappings().first()
+    return dict(row) if row else None
+
+
 def update_transcript(
     session: Session,
     transcript_id: UUID,
@@ -86,6 +110,7 @@ def update_transcript(
             transcript.raw_text = raw_text
         if cleaned_text is not None:
             transcript.cleaned_text = cleaned_text
+            search_repo.index_idea(session, transcript.idea_id, transcript=cleaned_text)
         session.add(transcript)
         session.commit()
         session.refresh(transcript)
@@ -105,6 +130,7 @@ def delete_transcript(session: Session, transcript_id: UUID) -> bool:
     transcript = get_transcript(session, transcript_id)
     if transcript:
         session.delete(transcript)
+        search_repo.index_idea(session, transcript.idea_id, transcript="")
         session.commit()
         return True
     return False
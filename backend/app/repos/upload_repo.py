@@ -0,0 +1,58 @@
+"""Upload Repository - bookkeeping for resumable audio uploads."""
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sqlmodel import Session, select
+
+from app.models import AudioUpload
+
+
+def create_upload(
+    session: Session,
+    idea_id: UUID,
+    size: int,
+    sha256: Optional[str] = None,
+    filename: Optional[str] = None
+) -> AudioUpload:
+    """Create an upload session.
+
+    Args:
+        session: Database session
+        idea_id: Idea the audio is for
+        size: Total size the client will send
+        sha256: Expected digest of the whole file (hex), if known
+        filename: Original filename
+
+    Returns:
+        Created upload
+    """
+    upload = AudioUpload(idea_id=idea_id, size=size, sha256=sha256, filename=filename)
+    session.add(upload)
+    session.commit()
+    session.refresh(upload)
+    return upload
+
+
+def get_upload(session: Session, upload_id: UUID) -> Optional[AudioUpload]:
+    """Get an upload session by id."""
+    return session.get(AudioUpload, upload_id)
+
+
+def touch_upload(session: Session, upload: AudioUpload) -> None:
+    """Mark an upload as active (postpones its expiry)."""
+    upload.updated_at = datetime.utcnow()
+    session.add(upload)
+    session.commit()
+
+
+def delete_upload(session: Session, upload: AudioUpload) -> None:
+    """Delete an upload session."""
+    session.delete(upload)
+    session.commit()
+
+
+def get_stale_uploads(session: Session, before: datetime) -> List[AudioUpload]:
+    """Upload sessions with no activity since ``before``."""
+    statement = select(AudioUpload).where(AudioUpload.updated_at < before)
+    return list(session.exec(statement).all())
@@ -0,0 +1,48 @@
+"""Fast JSON responses for high-volume read endpoints.
+
+Routes that return ``FastJSONResponse`` skip FastAPI's response_model
+validation and serialization: the content (plain dicts, typically rows
+projected straight from the database) is encoded in one pass with orjson.
+UUIDs, datetimes and enums are encoded natively, producing the same JSON as
+``str(uuid)``, ``datetime.isoformat()`` and ``enum.value``.
+
+If orjson is not installed the standard library encoder is used with the
+same conversions.
+"""
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson handles natively (stdlib fallback)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson (no response_model re-validation)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
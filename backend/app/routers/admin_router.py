@@ -0,0 +1,54 @@
+"""Admin endpoints - profiler output and audio storage."""
+import asyncio
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from app.controllers import audio_tiering
+from app.db import get_session
+from app.profiling import get_store
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+class ProfileInfo(BaseModel):
+    """Stored request profile."""
+    id: str
+    method: str
+    path: str
+    duration_ms: float
+    samples: int
+    created_at: float
+
+
+@router.get("/profiles", response_model=List[ProfileInfo])
+async def list_profiles():
+    """List recent slow-request profiles, newest first."""
+    return get_store().list()
+
+
+@router.get("/profiles/{profile_id}")
+async def download_profile(profile_id: str):
+    """Download a profile as collapsed stacks (flamegraph.pl / speedscope input)."""
+    path = get_store().path(profile_id)
+    if path is None or not path.exists():
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="text/plain", filename=path.name)
+
+
+@router.get("/audio/storage")
+async def audio_storage(session: Session = Depends(get_session)):
+    """Stored audio by tier and the bytes tiering and deduplication save."""
+    return audio_tiering.stats(session)
+
+
+@router.post("/audio/storage/migrate")
+async def migrate_audio_storage():
+    """Run an audio tiering pass now (moves, retention, orphan cleanup); 409 if one is running."""
+    summary = await asyncio.to_thread(audio_tiering.run_once, False)
+    if summary is None:
+        raise HTTPException(status_code=409, detail="An audio tiering pass is already running")
+    return summary
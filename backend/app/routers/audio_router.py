@@ -1,16 +1,45 @@
 """Audio Router - audio upload/download endpoints via DB."""
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Request, Response, UploadFile
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field
 from sqlmodel import Session
+from starlette.requests import ClientDisconnect
 
+from app.controllers import eager_processing
 from app.db import get_session
-from app.repos import idea_repo
-from app.services import audio_service
+from app.models import AudioUpload
+from app.repos import idea_repo, upload_repo
+from app.services import audio_service, upload_service
 
 router = APIRouter(prefix="/ideas", tags=["audio"])
 
 
+class UploadCreateRequest(BaseModel):
+    size: int = Field(gt=0, description="Total bytes that will be sent")
+    sha256: Optional[str] = Field(None, pattern="^[0-9a-fA-F]{64}$", description="SHA-256 of the whole file")
+    filename: Optional[str] = None
+
+
+def _upload_state(upload: AudioUpload, offset: int) -> dict:
+    return {
+        "upload_id": str(upload.id),
+        "idea_id": str(upload.idea_id),
+        "offset": offset,
+        "size": upload.size,
+        "complete": offset == upload.size,
+    }
+
+
+def _get_upload(session: Session, idea_id: UUID, upload_id: UUID) -> AudioUpload:
+    upload = upload_repo.get_upload(session, upload_id)
+    if not upload or upload.idea_id != idea_id:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return upload
+
+
 @router.post("/{idea_id}/audio")
 async def upload_audio(
     idea_id: UUID,
@@ -32,10 +61,15 @@ async def upload_audio(
     # Save audio to DB
     size = await audio_service.save_audio(session, idea_id, audio_bytes)
     
+    # Opt-in: start transcribing now so /transcribe can return instantly
+    eager = eager_processing.schedule(idea_id)
+    
     return {
         "idea_id": str(idea_id),
         "size_bytes": size,
+        "sha256": idea.audio_sha256,
         "filename": file.filename,
+        "eager_processing": eager,
         "message": "Audio saved to database"
     }
 
@@ -45,7 +79,11 @@ async def download_audio(
     idea_id: UUID,
     session: Session = Depends(get_session)
 ):
-    """Download/stream audio file from DB."""
+    """Download/stream audio file from DB (or the cold tier on disk)."""
+    path = audio_service.get_audio_file(session, idea_id)
+    if path is not None and path.exists():
+        return FileResponse(path, media_type="audio/webm")
+    
     audio_bytes = audio_service.get_audio(session, idea_id)
     
     if not audio_bytes:
@@ -78,6 +116,7 @@ async def delete_audio(
 ):
     """Delete audio file for an idea."""
     deleted = audio_service.delete_audio(session, idea_id)
+    eager_processing.discard(idea_id)
     
     if not deleted:
         raise HTTPException(status_code=404, detail="Audio not found")
@@ -86,3 +125,118 @@ async def delete_audio(
         "idea_id": str(idea_id),
         "deleted": deleted
     }
+
+
+# Resumable uploads: create a session, PATCH chunks at their offset (after a
+# failure, GET the session for the offset to resume from), then complete.
+
+@router.post("/{idea_id}/audio/uploads", status_code=201)
+async def create_upload(
+    idea_id: UUID,
+    data: UploadCreateRequest,
+    session: Session = Depends(get_session)
+):
+    """Start a resumable audio upload."""
+    if not idea_repo.get_idea_row(session, idea_id):
+        raise HTTPException(status_code=404, detail="Idea not found")
+    
+    try:
+        upload = upload_service.create_upload(session, idea_id, data.size, data.sha256, data.filename)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return _upload_state(upload, 0)
+
+
+@router.get("/{idea_id}/audio/uploads/{upload_id}")
+async def get_upload(
+    idea_id: UUID,
+    upload_id: UUID,
+    response: Response,
+    session: Session = Depends(get_session)
+):
+    """Get an upload's offset (where the next chunk must start)."""
+    upload = _get_upload(session, idea_id, upload_id)
+    offset = upload_service.current_offset(upload)
+    response.headers["Upload-Offset"] = str(offset)
+    response.headers["Cache-Control"] = "no-store"
+    return _upload_state(upload, offset)
+
+
+@router.patch("/{idea_id}/audio/uploads/{upload_id}")
+async def upload_chunk(
+    idea_id: UUID,
+    upload_id: UUID,
+    request: Request,
+    response: Response,
+    upload_offset: int = Header(..., description="Offset this chunk starts at"),
+    x_chunk_sha256: Optional[str] = Header(None, description="SHA-256 of this chunk, verified before it is stored"),
+    session: Session = Depends(get_session)
+):
+    """Append a chunk (raw bytes in the request body) to an upload."""
+    upload = _get_upload(session, idea_id, upload_id)
+    
+    offset = upload_service.current_offset(upload)
+    if upload_service.is_busy(upload_id):
+        raise HTTPException(status_code=409, detail="Another chunk is being received", headers={"Upload-Offset": str(offset)})
+    if upload_offset != offset:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Offset mismatch: upload is at {offset}",
+            headers={"Upload-Offset": str(offset)}
+        )
+    
+    try:
+        offset = await upload_service.append_chunk(session, upload, request.stream(), x_chunk_sha256)
+    except ClientDisconnect:
+        # Whatever arrived is kept; the client resumes from GET's offset
+        return Response(status_code=400)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e), headers={"Upload-Offset": str(upload_service.current_offset(upload))})
+    
+    response.headers["Upload-Offset"] = str(offset)
+    return _upload_state(upload, offset)
+
+
+@router.post("/{idea_id}/audio/uploads/{upload_id}/complete")
+async def complete_upload(
+    idea_id: UUID,
+    upload_id: UUID,
+    session: Session = Depends(get_session)
+):
+    """Verify a fully sent upload and store it as the idea's audio."""
+    upload = _get_upload(session, idea_id, upload_id)
+    if upload_service.is_busy(upload_id):
+        raise HTTPException(status_code=409, detail="A chunk is being received; retry when it ends")
+    filename = upload.filename
+    
+    try:
+        audio_bytes, digest = upload_service.complete_upload(session, upload)
+        size = await audio_service.save_audio(session, idea_id, audio_bytes)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    eager = eager_processing.schedule(idea_id)
+    
+    return {
+        "idea_id": str(idea_id),
+        "size_bytes": size,
+        "sha256": digest,
+        "filename": filename,
+        "eager_processing": eager,
+        "message": "Audio saved to database"
+    }
+
+
+@router.delete("/{idea_id}/audio/uploads/{upload_id}")
+async def abort_upload(
+    idea_id: UUID,
+    upload_id: UUID,
+    session: Session = Depends(get_session)
+):
+    """Abort an upload and discard the bytes received so far."""
+    upload = _get_upload(session, idea_id, upload_id)
+    if upload_service.is_busy(upload_id):
+        raise HTTPException(status_code=409, detail="A chunk is being received; retry when it ends")
+    upload_service.delete_upload(session, upload)
+    return {"upload_id": str(upload_id), "deleted": True}
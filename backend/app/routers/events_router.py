@@ -0,0 +1,78 @@
+"""Events Router - push idea updates over Server-Sent Events or WebSocket."""
+import asyncio
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Header, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.config import get_settings
+from app.events import Event, Subscription, bus
+from app.responses import dumps
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+def _sse(event: Event) -> bytes:
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event.id, event.type.encode(), dumps(event.to_dict()))
+
+
+async def _stream(subscription: Subscription) -> AsyncIterator[bytes]:
+    heartbeat = get_settings().event_heartbeat_s
+    try:
+        # Sent at once so proxies and the browser see the stream open
+        yield b"retry: 3000\n: connected\n\n"
+        while True:
+            event = await subscription.get(timeout=heartbeat)
+            yield _sse(event) if event else b": ping\n\n"
+    finally:
+        subscription.close()
+
+
+@router.get("")
+async def stream_events(
+    idea_id: Optional[UUID] = Query(None, description="Only this idea's events (default: all ideas)"),
+    last_event_id: Optional[int] = Header(None, description="Resume after this event id"),
+):
+    """Subscribe to idea events as a Server-Sent Events stream.
+
+    Events: idea.created, idea.status, idea.deleted, audio.updated,
+    transcript.updated and job progress such as research.section.
+    """
+    subscription = bus.subscribe(str(idea_id) if idea_id else None, last_event_id)
+    return StreamingResponse(
+        _stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def events_websocket(
+    websocket: WebSocket,
+    idea_id: Optional[UUID] = Query(None),
+    last_event_id: Optional[int] = Query(None),
+):
+    """Subscribe to idea events over a WebSocket (one JSON object per message)."""
+    await websocket.accept()
+    subscription = bus.subscribe(str(idea_id) if idea_id else None, last_event_id)
+
+    async def drain_client() -> None:
+        # Clients don't send anything we act on; this only notices disconnects
+        while True:
+            await websocket.receive_text()
+
+    receiver = asyncio.create_task(drain_client())
+    try:
+        while not receiver.done():
+            next_event = asyncio.create_task(subscription.get())
+            done, _ = await asyncio.wait({next_event, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if next_event not in done:
+                next_event.cancel()
+                break
+            await websocket.send_text(dumps(next_event.result().to_dict()).decode())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        subscription.close()
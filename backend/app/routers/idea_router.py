@@ -1,15 +1,18 @@
 """Idea Router - CRUD and lifecycle endpoints for ideas."""
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlmodel import Session
 
-from app.controllers import idea_pipeline
+from app import http_cache, scheduler
+from app.controllers import analysis_controller, idea_pipeline
 from app.db import get_session
 from app.models import Idea, IdeaStatus
-from app.repos import idea_repo
+from app.repos import idea_repo, search_repo
+from app.responses import FastJSONResponse
+from app.services import filler_dictionaries, similarity_service
 
 router = APIRouter(prefix="/ideas", tags=["ideas"])
 
@@ -17,6 +20,7 @@ router = APIRouter(prefix="/ideas", tags=["ideas"])
 # Request/Response models
 class IdeaCreate(BaseModel):
     title: Optional[str] = None
+    language: Optional[str] = None
 
 
 class IdeaResponse(BaseModel):
@@ -24,6 +28,7 @@ class IdeaResponse(BaseModel):
     title: Optional[str]
     status: str
     audio_path: Optional[str]
+    language: Optional[str] = None
     created_at: str
     updated_at: str
 
@@ -31,6 +36,33 @@ class IdeaResponse(BaseModel):
 class ProcessRequest(BaseModel):
     adapter: str = "dummy"
     api_key: Optional[str] = None
+    check_duplicates: bool = False
+
+
+class AnalyzeRequest(BaseModel):
+    analyses: List[Literal["bullets", "summary", "tags"]] = ["bullets", "tags"]
+    adapter: str = "dummy"
+    api_key: Optional[str] = None
+
+
+class TagSuggestion(BaseModel):
+    name: str
+    confidence: float
+
+
+class AnalyzeResponse(BaseModel):
+    idea_id: str
+    transcript_id: str
+    bullets: Optional[List[str]] = None
+    summary: Optional[str] = None
+    tags: Optional[List[TagSuggestion]] = None
+    categories: Optional[List[str]] = None
+    cached: List[str]
+
+
+class ApproveRequest(BaseModel):
+    adapter: Optional[str] = None  # research adapter, default RESEARCH_ADAPTER
+    api_key: Optional[str] = None
 
 
 class ApprovalResponse(BaseModel):
@@ -39,6 +71,30 @@ class ApprovalResponse(BaseModel):
     message: str
 
 
+class SearchHit(BaseModel):
+    idea: IdeaResponse
+    score: float
+    snippet: str
+
+
+class SearchResponse(BaseModel):
+    query: str
+    total: int
+    limit: int
+    offset: int
+    results: List[SearchHit]
+
+
+class SimilarIdea(BaseModel):
+    idea: IdeaResponse
+    similarity: float
+
+
+class SimilarResponse(BaseModel):
+    idea_id: str
+    results: List[SimilarIdea]
+
+
 def _idea_to_response(idea: Idea) -> IdeaResponse:
     """Convert Idea model to response."""
     return IdeaResponse(
@@ -46,16 +102,20 @@ def _idea_to_response(idea: Idea) -> IdeaResponse:
         title=idea.title,
         status=idea.status.value,
         audio_path=idea.audio_path,
+        language=idea.language,
         created_at=idea.created_at.isoformat(),
         updated_at=idea.updated_at.isoformat()
     )
 
 
-@router.get("", response_model=List[IdeaResponse])
+@router.get("", response_model=List[IdeaResponse], dependencies=[Depends(http_cache.cached("idea"))])
 async def list_ideas(session: Session = Depends(get_session)):
-    """List all ideas."""
-    ideas = idea_repo.get_all_ideas(session)
-    return [_idea_to_response(idea) for idea in ideas]
+    """List all ideas.
+    
+    Rows are projected straight from the database and encoded with orjson,
+    bypassing per-row model construction and response_model validation.
+    """
+    return FastJSONResponse(idea_repo.get_all_idea_rows(session))
 
 
 @router.post("", response_model=IdeaResponse)
@@ -65,20 +125,49 @@ async def create_idea(
 ):
     """Create a new idea."""
     title = data.title if data else None
-    idea = idea_repo.create_idea(session, title=title)
+    try:
+        language = filler_dictionaries.validate_language(data.language if data else None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    idea = idea_repo.create_idea(session, title=title, language=language)
     return _idea_to_response(idea)
 
 
+@router.get("/search", response_model=SearchResponse)
+async def search_ideas(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    session: Session = Depends(get_session)
+):
+    """Full-text search over idea titles, transcripts and summaries.
+    
+    Results are ranked by BM25 and include a highlighted snippet.
+    """
+    total, hits = search_repo.search(session, q, limit=limit, offset=offset)
+    ideas = idea_repo.get_ideas_by_ids(session, [idea_id for idea_id, _, _ in hits])
+    
+    results = [
+        SearchHit(idea=_idea_to_response(ideas[idea_id]), score=score, snippet=snippet)
+        for idea_id, score, snippet in hits
+        if idea_id in ideas
+    ]
+    
+    return SearchResponse(
+        query=q, total=total, limit=limit, offset=offset, results=results
+    )
+
+
 @router.get("/{idea_id}", response_model=IdeaResponse)
 async def get_idea(
     idea_id: UUID,
     session: Session = Depends(get_session)
 ):
     """Get an idea by ID."""
-    idea = idea_repo.get_idea(session, idea_id)
-    if not idea:
+    row = idea_repo.get_idea_row(session, idea_id)
+    if not row:
         raise HTTPException(status_code=404, detail="Idea not found")
-    return _idea_to_response(idea)
+    return FastJSONResponse(row)
 
 
 @router.delete("/{idea_id}")
@@ -90,9 +179,34 @@ async def delete_idea(
     deleted = idea_repo.delete_idea(session, idea_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Idea not found")
+    similarity_service.remove_idea(idea_id)
     return {"deleted": True}
 
 
+@router.get("/{idea_id}/similar", response_model=SimilarResponse)
+async def similar_ideas(
+    idea_id: UUID,
+    k: int = Query(5, ge=1, le=50),
+    session: Session = Depends(get_session)
+):
+    """Find the ideas whose transcripts are most similar to this one."""
+    try:
+        neighbors = similarity_service.find_similar(idea_id, k)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    ideas = idea_repo.get_ideas_by_ids(session, [other_id for other_id, _ in neighbors])
+    
+    return SimilarResponse(
+        idea_id=str(idea_id),
+        results=[
+            SimilarIdea(idea=_idea_to_response(ideas[other_id]), similarity=score)
+            for other_id, score in neighbors
+            if other_id in ideas
+        ]
+    )
+
+
 @router.post("/{idea_id}/process")
 async def process_idea(
     idea_id: UUID,
@@ -102,24 +216,48 @@ async def process_idea(
     """Full processing: transcribe, clean, summarize, tag."""
     adapter = data.adapter if data else "dummy"
     api_key = data.api_key if data else None
+    check_duplicates = data.check_duplicates if data else False
     
     try:
-        result = await idea_pipeline.process_transcription(
-            session, idea_id, adapter, api_key
-        )
+        # Full processing queues behind interactive model calls, ahead of research
+        with scheduler.priority("pipeline"):
+            result = await idea_pipeline.process_transcription(
+                session, idea_id, adapter, api_key, check_duplicates=check_duplicates
+            )
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/{idea_id}/analyze", response_model=AnalyzeResponse, response_model_exclude_none=True)
+async def analyze_idea(
+    idea_id: UUID,
+    data: AnalyzeRequest = None,
+    session: Session = Depends(get_session)
+):
+    """Run bullets/summary/tags on the idea's stored transcript in one call."""
+    data = data or AnalyzeRequest()
+    
+    try:
+        return await analysis_controller.analyze_idea(
+            session, idea_id, data.analyses, data.adapter, data.api_key
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.post("/{idea_id}/approve", response_model=ApprovalResponse)
 async def approve_idea(
     idea_id: UUID,
+    data: ApproveRequest = None,
     session: Session = Depends(get_session)
 ):
-    """Approve idea for research."""
+    """Approve idea for research (the report is generated in the background)."""
+    adapter = data.adapter if data else None
+    api_key = data.api_key if data else None
+    
     try:
-        result = await idea_pipeline.approve_idea(session, idea_id)
+        result = await idea_pipeline.approve_idea(session, idea_id, adapter, api_key)
         return ApprovalResponse(**result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,85 @@
+"""Research Router - research report endpoints."""
+from typing import Dict, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from app.controllers import research_engine
+from app.db import get_session
+from app.repos import idea_repo, research_repo
+from app.services.research_service import SECTIONS
+
+router = APIRouter(prefix="/ideas", tags=["research"])
+
+
+class ResumeRequest(BaseModel):
+    api_key: Optional[str] = None
+
+
+class ReportSection(BaseModel):
+    title: str
+    status: str  # pending | completed | failed
+    content: Optional[str] = None
+    error: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
+class ReportResponse(BaseModel):
+    idea_id: str
+    status: str
+    running: bool
+    adapter: Optional[str]
+    completed_sections: int
+    total_sections: int
+    summary: str
+    sections: Dict[str, ReportSection]
+
+
+@router.get("/{idea_id}/research", response_model=ReportResponse)
+async def get_report(
+    idea_id: UUID,
+    session: Session = Depends(get_session)
+):
+    """Get an idea's research report, including partially generated ones."""
+    idea = idea_repo.get_idea_row(session, idea_id)
+    if not idea:
+        raise HTTPException(status_code=404, detail="Idea not found")
+
+    report = research_repo.get_report_by_idea(session, idea_id)
+    if not report:
+        raise HTTPException(status_code=404, detail="No research report found")
+
+    data = research_repo.report_data(report)
+    sections = {
+        key: ReportSection(**data["sections"].get(key, {"title": title, "status": "pending"}))
+        for key, (title, _) in SECTIONS.items()
+    }
+
+    return ReportResponse(
+        idea_id=str(idea_id),
+        status=idea["status"].value,
+        running=research_engine.is_running(idea_id),
+        adapter=data.get("adapter"),
+        completed_sections=sum(section.status == "completed" for section in sections.values()),
+        total_sections=len(SECTIONS),
+        summary=report.summary,
+        sections=sections
+    )
+
+
+@router.post("/{idea_id}/research/resume")
+async def resume_research(
+    idea_id: UUID,
+    data: ResumeRequest = None,
+    session: Session = Depends(get_session)
+):
+    """Retry failed or missing sections of an idea's research report."""
+    if not idea_repo.get_idea_row(session, idea_id):
+        raise HTTPException(status_code=404, detail="Idea not found")
+    if not research_repo.get_report_by_idea(session, idea_id):
+        raise HTTPException(status_code=404, detail="No research report found; approve the idea first")
+
+    started = research_engine.start_research(idea_id, api_key=data.api_key if data else None)
+    return {"idea_id": str(idea_id), "started": started}
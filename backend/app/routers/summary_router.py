@@ -29,9 +29,12 @@ async def generate_bullets(data: SummaryRequest):
     if not data.text.strip():
         raise HTTPException(status_code=400, detail="Text is required")
     
-    bullets = await summary_service.generate_bullets(
-        data.text, data.adapter, data.api_key
-    )
+    try:
+        bullets = await summary_service.generate_bullets(
+            data.text, data.adapter, data.api_key
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return BulletsResponse(bullets=bullets)
 
@@ -42,8 +45,11 @@ async def generate_long_summary(data: SummaryRequest):
     if not data.text.strip():
         raise HTTPException(status_code=400, detail="Text is required")
     
-    summary = await summary_service.generate_long_summary(
-        data.text, data.adapter, data.api_key
-    )
+    try:
+        summary = await summary_service.generate_long_summary(
+            data.text, data.adapter, data.api_key
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return SummaryResponse(summary=summary)
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlmodel import Session
 
+from app import http_cache
 from app.db import get_session
 from app.repos import tag_repo
 from app.services import tagging_service
@@ -40,9 +41,12 @@ async def suggest_tags(data: SuggestRequest):
     if not data.text.strip():
         raise HTTPException(status_code=400, detail="Text is required")
     
-    tags = await tagging_service.suggest_tags(
-        data.text, data.adapter, data.api_key
-    )
+    try:
+        tags = await tagging_service.suggest_tags(
+            data.text, data.adapter, data.api_key
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     # Get predefined categories
     all_categories = tagging_service.get_predefined_categories()
@@ -53,7 +57,7 @@ async def suggest_tags(data: SuggestRequest):
     )
 
 
-@router.get("", response_model=List[TagResponse])
+@router.get("", response_model=List[TagResponse], dependencies=[Depends(http_cache.cached("tag"))])
 async def list_tags(session: Session = Depends(get_session)):
     """List all saved tags."""
     tags = tag_repo.get_all_tags(session)
@@ -63,7 +67,7 @@ async def list_tags(session: Session = Depends(get_session)):
     ]
 
 
-@router.get("/categories")
+@router.get("/categories", dependencies=[Depends(http_cache.cached(cache_control=http_cache.STATIC))])
 async def list_categories():
     """List predefined categories."""
     return {"categories": tagging_service.get_predefined_categories()}
@@ -1,14 +1,20 @@
 """Transcription Router - transcription endpoints."""
-from typing import Optional
+import asyncio
+import json
+from typing import Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, WebSocket
+from pydantic import BaseModel, ValidationError
 from sqlmodel import Session
 
+from app import http_cache
 from app.controllers import transcription_controller
+from app.controllers.live_transcription import LiveTranscription
 from app.db import get_session
 from app.repos import idea_repo, transcript_repo
+from app.responses import FastJSONResponse
+from app.services import similarity_service
 
 router = APIRouter(prefix="/ideas", tags=["transcription"])
 
@@ -22,12 +28,20 @@ class TranscriptResponse(BaseModel):
     transcript_id: str
     transcription_raw: str
     transcription_clean: str
+    language: Optional[str] = None
 
 
 class TranscriptUpdateRequest(BaseModel):
     text: str
 
 
+class LiveStartRequest(BaseModel):
+    type: Literal["start"] = "start"
+    adapter: str = "dummy"
+    api_key: Optional[str] = None
+    language: Optional[str] = None
+
+
 @router.post("/{idea_id}/transcribe", response_model=TranscriptResponse)
 async def transcribe_idea(
     idea_id: UUID,
@@ -53,27 +67,20 @@ async def transcribe_idea(
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.get("/{idea_id}/transcript")
+@router.get("/{idea_id}/transcript", dependencies=[Depends(http_cache.cached("idea", "transcript"))])
 async def get_transcript(
     idea_id: UUID,
     session: Session = Depends(get_session)
 ):
     """Get transcript for an idea."""
-    idea = idea_repo.get_idea(session, idea_id)
-    if not idea:
+    if not idea_repo.get_idea_row(session, idea_id):
         raise HTTPException(status_code=404, detail="Idea not found")
     
-    transcript = transcript_repo.get_transcript_by_idea(session, idea_id)
+    transcript = transcript_repo.get_transcript_row(session, idea_id)
     if not transcript:
         raise HTTPException(status_code=404, detail="No transcript found")
     
-    return {
-        "transcript_id": str(transcript.id),
-        "idea_id": str(idea_id),
-        "raw_text": transcript.raw_text,
-        "cleaned_text": transcript.cleaned_text,
-        "created_at": transcript.created_at.isoformat()
-    }
+    return FastJSONResponse(transcript)
 
 
 @router.put("/transcripts/{transcript_id}")
@@ -90,8 +97,88 @@ async def update_transcript(
     if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not found")
     
+    similarity_service.index_transcript(transcript.idea_id, transcript.cleaned_text)
+    
     return {
         "transcript_id": str(transcript.id),
         "cleaned_text": transcript.cleaned_text,
         "updated": True
     }
+
+
+@router.websocket("/{idea_id}/live")
+async def live_transcription(websocket: WebSocket, idea_id: UUID):
+    """Transcribe audio while it is being recorded.
+    
+    Protocol (JSON text messages, audio as binary messages):
+    
+    1. Client sends ``{"type": "start", "adapter": ..., "api_key": ..., "language": ...}``;
+       the server clears the idea's audio and answers ``{"type": "ready"}``
+    2. Client sends recorder chunks as binary messages, optionally
+       ``{"type": "segment"}`` to cut a segment early (e.g. on a pause)
+    3. Server sends ``{"type": "partial", "text": ..., "transcript": ...}``
+       as segments are transcribed (``text`` is the newly cleaned part)
+    4. Client sends ``{"type": "stop"}``; the server answers with
+       ``{"type": "final", ...}`` (same fields as /transcribe) and closes
+    
+    If the client disconnects early, the audio received so far is still
+    transcribed and stored.
+    """
+    await websocket.accept()
+    try:
+        start = LiveStartRequest.model_validate_json(await websocket.receive_text())
+        live = LiveTranscription(idea_id, start.adapter, start.api_key, start.language)
+        live.begin()
+    except (ValidationError, ValueError) as e:
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1008)
+        return
+    await websocket.send_json({"type": "ready"})
+    
+    connected = True
+    
+    async def send(message: dict) -> None:
+        nonlocal connected
+        if connected:
+            try:
+                await websocket.send_json(message)
+            except Exception:
+                connected = False
+    
+    async def push_partials() -> None:
+        async for message in live.partials():
+            await send(message)
+    
+    pusher = asyncio.create_task(push_partials())
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                connected = False
+                break
+            if message.get("bytes"):
+                await live.add_chunk(message["bytes"])
+            elif message.get("text"):
+                try:
+                    kind = json.loads(message["text"]).get("type")
+                except (ValueError, AttributeError):
+                    kind = None
+                if kind == "stop":
+                    break
+                if kind == "segment":
+                    await live.cut()
+        
+        await live.finish()
+        await pusher
+        try:
+            result = await live.save()
+        except ValueError as e:
+            await send({"type": "error", "detail": str(e)})
+        else:
+            await send({"type": "final", **result})
+        if connected:
+            await websocket.close()
+    finally:
+        if not pusher.done():
+            pusher.cancel()
+            await live.abort()
@@ -0,0 +1,229 @@
+"""Adapter call scheduler - priority classes, fair sharing and aging.
+
+Every model adapter call waits for one of ``SCHEDULER_MAX_CONCURRENT``
+slots. When a slot frees up, the waiting call that goes next is chosen by:
+
+1. Priority class: interactive > pipeline > research > backfill. A waiting
+   call moves up one class for every ``SCHEDULER_AGING_S`` seconds it has
+   waited, so bulk work cannot starve.
+2. Weighted fair share between tenants (API keys) within a class: each
+   dispatch advances the tenant's virtual time by 1/weight, and the tenant
+   with the lowest virtual time goes first.
+3. Arrival order.
+
+Research and backfill calls never occupy the last
+``SCHEDULER_RESERVED_INTERACTIVE`` slots, so an interactive call never waits
+behind a batch of slow bulk calls.
+
+The class comes from the ``current_priority`` context variable (default
+interactive). Callers set it for a block with ``priority("research")``.
+Nested adapter calls (an adapter delegating to another one) reuse the
+caller's slot.
+"""
+import asyncio
+import functools
+import hashlib
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional
+
+from app import metrics
+from app.config import get_settings
+from app.tracing import start_span
+
+# Priority classes, most urgent first
+PRIORITIES = ("interactive", "pipeline", "research", "backfill")
+BULK_PRIORITIES = ("research", "backfill")
+
+current_priority: ContextVar[str] = ContextVar("scheduler_priority", default="interactive")
+_holding_slot: ContextVar[bool] = ContextVar("scheduler_holding_slot", default=False)
+
+queue_depth = metrics.gauge("scheduler_queue_depth", "Adapter calls waiting for a slot by priority")
+slots_in_use = metrics.gauge("scheduler_slots_in_use", "Adapter call slots in use by priority")
+wait_time = metrics.histogram("scheduler_wait_seconds", "Time adapter calls waited for a slot by priority")
+dispatched = metrics.counter("scheduler_dispatched_total", "Adapter calls dispatched by priority and tenant")
+
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """Run adapter calls in the block with the given priority class."""
+    if name not in PRIORITIES:
+        raise ValueError(f"Unknown priority '{name}' (expected one of {', '.join(PRIORITIES)})")
+    token = current_priority.set(name)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+def tenant_for(api_key: Optional[str]) -> str:
+    """Tenant id for an API key: a short fingerprint, never the key itself."""
+    if not api_key:
+        return "default"
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:8]
+
+
+def _parse_weights(spec: str) -> Dict[str, float]:
+    """Parse "tenant=weight,..." (tenants as printed by tenant_for)."""
+    weights = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        tenant, _, weight = item.partition("=")
+        weights[tenant.strip()] = float(weight)
+    return weights
+
+
+@dataclass
+class _Waiter:
+    priority: str
+    tenant: str
+    seq: int
+    enqueued: float = field(default_factory=time.monotonic)
+    future: Optional[asyncio.Future] = None
+
+
+class Scheduler:
+    """Slot-based scheduler for adapter calls."""
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        reserved_interactive: int = 1,
+        aging_s: float = 10.0,
+        weights: Optional[Dict[str, float]] = None
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        # Bulk work always gets at least one slot
+        self.bulk_limit = max(1, self.max_concurrent - max(0, reserved_interactive))
+        self.aging_s = aging_s
+        self.weights = weights or {}
+        self.in_use: Dict[str, int] = {name: 0 for name in PRIORITIES}
+        self._waiters: List[_Waiter] = []
+        self._vtime: Dict[str, float] = {}
+        self._seq = itertools.count()
+
+    @property
+    def busy(self) -> int:
+        return sum(self.in_use.values())
+
+    def _allowed(self, priority: str) -> bool:
+        if self.busy >= self.max_concurrent:
+            return False
+        if priority in BULK_PRIORITIES:
+            return sum(self.in_use[name] for name in BULK_PRIORITIES) < self.bulk_limit
+        return True
+
+    def _rank(self, waiter: _Waiter, now: float) -> int:
+        rank = PRIORITIES.index(waiter.priority)
+        if self.aging_s > 0:
+            rank -= int((now - waiter.enqueued) / self.aging_s)
+        return max(0, rank)
+
+    def _take(self, priority: str, tenant: str) -> None:
+        self.in_use[priority] += 1
+        self._vtime[tenant] = self._vtime.get(tenant, 0.0) + 1.0 / self.weights.get(tenant, 1.0)
+        slots_in_use.set(self.in_use[priority], priority=priority)
+        dispatched.inc(priority=priority, tenant=tenant)
+
+    def _dispatch(self) -> None:
+        """Hand free slots to the best eligible waiters."""
+        while self._waiters:
+            now = time.monotonic()
+            eligible = [w for w in self._waiters if self._allowed(w.priority)]
+            if not eligible:
+                return
+            waiter = min(
+                eligible,
+                key=lambda w: (self._rank(w, now), self._vtime.get(w.tenant, 0.0), w.seq)
+            )
+            self._waiters.remove(waiter)
+            queue_depth.dec(priority=waiter.priority)
+            self._take(waiter.priority, waiter.tenant)
+            waiter.future.set_result(None)
+
+    async def acquire(self, priority: str, tenant: str) -> float:
+        """Wait for a slot. Returns the seconds spent waiting."""
+        if not self._waiters and self._allowed(priority):
+            self._take(priority, tenant)
+            wait_time.observe(0.0, priority=priority)
+            return 0.0
+
+        # A tenant joining the queue starts level with the waiting tenants, so
+        # credit saved up while idle can't be spent starving them
+        waiting = {w.tenant for w in self._waiters}
+        if waiting and tenant not in waiting:
+            floor = min(self._vtime.get(other, 0.0) for other in waiting)
+            self._vtime[tenant] = max(self._vtime.get(tenant, 0.0), floor)
+
+        waiter = _Waiter(priority, tenant, next(self._seq))
+        waiter.future = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        queue_depth.inc(priority=priority)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                queue_depth.dec(priority=priority)
+            elif waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as we were cancelled: give the slot back
+                self.release(priority)
+            raise
+        waited = time.monotonic() - waiter.enqueued
+        wait_time.observe(waited, priority=priority)
+        return waited
+
+    def release(self, priority: str) -> None:
+        """Free a slot and dispatch waiting calls."""
+        self.in_use[priority] -= 1
+        slots_in_use.set(self.in_use[priority], priority=priority)
+        self._dispatch()
+
+    def queued(self) -> Dict[str, int]:
+        """Waiting calls by priority class."""
+        counts = {name: 0 for name in PRIORITIES}
+        for waiter in self._waiters:
+            counts[waiter.priority] += 1
+        return counts
+
+
+@lru_cache
+def get_scheduler() -> Scheduler:
+    """Process-wide scheduler configured from settings."""
+    settings = get_settings()
+    return Scheduler(
+        settings.scheduler_max_concurrent,
+        reserved_interactive=settings.scheduler_reserved_interactive,
+        aging_s=settings.scheduler_aging_s,
+        weights=_parse_weights(settings.scheduler_tenant_weights),
+    )
+
+
+def scheduled(func: Callable) -> Callable:
+    """Wrap an async adapter method so each call waits for a scheduler slot."""
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if _holding_slot.get() or not get_settings().scheduler_enabled:
+            return await func(self, *args, **kwargs)
+
+        scheduler = get_scheduler()
+        name = current_priority.get()
+        tenant = tenant_for(getattr(self, "api_key", None))
+        with start_span("scheduler.wait", priority=name, tenant=tenant) as span:
+            waited = await scheduler.acquire(name, tenant)
+            if span:
+                span.set_attribute("scheduler.wait_ms", round(waited * 1000, 2))
+
+        token = _holding_slot.set(True)
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            _holding_slot.reset(token)
+            scheduler.release(name)
+
+    return wrapper
@@ -0,0 +1,304 @@
+"""Audio Pre-processing - shrinks audio before it is sent to a model.
+
+Uploads are sent to the transcription adapter as recorded, long pauses
+included. Before transcription, ``preprocess``:
+
+1. Detects the real container from the bytes
+   (``audio_formats.detect_mime``), so adapters can label the payload
+   correctly.
+2. Runs the first configured backend that handles that type
+   (``AUDIO_PREPROCESSORS``, in order). A backend trims leading and
+   trailing silence, shortens pauses longer than ``AUDIO_MAX_SILENCE_MS``,
+   downmixes to mono and resamples to ``AUDIO_RESAMPLE_HZ``:
+
+   - ``wav``: PCM WAV, with numpy
+   - ``ffmpeg``: any container, if an ffmpeg binary is available; the
+     output is Opus in Ogg
+
+   More backends can be added with ``register_preprocessor``.
+3. Keeps the original whenever processing fails or doesn't make it
+   smaller, so pre-processing can never break a transcription.
+
+The work runs in a process pool (``AUDIO_PREPROCESS_WORKERS``) so decoding
+and filtering don't block the event loop. Bytes in and out are recorded on
+each request's ``audio.preprocess`` span and in
+``audio_preprocess_bytes_total``.
+"""
+import asyncio
+import io
+import shutil
+import subprocess
+import wave
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app import metrics
+from app.audio_formats import detect_mime
+from app.config import get_settings
+from app.logger import get_logger
+from app.tracing import start_span
+
+logger = get_logger(__name__)
+
+bytes_total = metrics.counter("audio_preprocess_bytes_total", "Audio bytes before (in) and after (out) pre-processing")
+
+
+@dataclass
+class PreprocessResult:
+    data: bytes
+    mime_type: str
+    bytes_in: int
+    steps: List[str] = field(default_factory=list)
+
+    @property
+    def bytes_out(self) -> int:
+        return len(self.data)
+
+
+# --- backends (run in worker processes: module-level and picklable) ---
+
+def _speech_mask(energy_db, threshold_db: float, max_silence_frames: int, pad_frames: int):
+    """Frames to keep: speech, short pauses and the ends of long ones."""
+    import numpy as np
+
+    voiced = energy_db > threshold_db
+    if not voiced.any():
+        keep = np.zeros(len(voiced), dtype=bool)
+        keep[:max_silence_frames] = True
+        return keep
+
+    # Pad speech so word onsets and tails aren't clipped
+    kernel = np.ones(2 * pad_frames + 1, dtype=bool)
+    keep = np.convolve(voiced, kernel, mode="same") > 0
+
+    # Shorten interior pauses to max_silence_frames (half from each side)
+    first, last = np.flatnonzero(keep)[[0, -1]]
+    index = first
+    while index <= last:
+        if keep[index]:
+            index += 1
+            continue
+        end = index
+        while end <= last and not keep[end]:
+            end += 1
+        if end - index > max_silence_frames:
+            half = max_silence_frames // 2
+            keep[index:index + half] = True
+            keep[end - (max_silence_frames - half):end] = True
+        else:
+            keep[index:end] = True
+        index = end
+    keep[:first] = False
+    keep[last + 1:] = False
+    return keep
+
+
+def _resample(samples, rate: int, target: int):
+    """Low-pass (windowed sinc) and linearly resample to a lower rate."""
+    import numpy as np
+
+    cutoff = 0.5 * target / rate
+    taps = np.arange(-32, 33)
+    kernel = 2 * cutoff * np.sinc(2 * cutoff * taps) * np.hamming(len(taps))
+    filtered = np.convolve(samples, kernel / kernel.sum(), mode="same")
+    count = int(len(samples) * target / rate)
+    positions = np.arange(count) * (rate / target)
+    return np.interp(positions, np.arange(len(samples)), filtered)
+
+
+def process_wav(data: bytes, options: dict) -> Optional[Tuple[bytes, str, List[str]]]:
+    """Trim silence, downmix and resample PCM WAV."""
+    import numpy as np
+
+    with wave.open(io.BytesIO(data)) as reader:
+        channels, width, rate = reader.getnchannels(), reader.getsampwidth(), reader.getframerate()
+        raw = reader.readframes(reader.getnframes())
+    dtypes = {1: np.uint8, 2: np.int16, 4: np.int32}
+    if width not in dtypes or not raw:
+        return None
+
+    samples = np.frombuffer(raw[:len(raw) - len(raw) % (width * channels)], dtype=dtypes[width]).astype(np.float64)
+    if width == 1:
+        samples -= 128
+    samples = samples.reshape(-1, channels).mean(axis=1) / float(2 ** (8 * width - 1))
+    steps = ["downmix"] if channels > 1 else []
+
+    frame = max(1, rate // 50)  # 20ms frames
+    usable = len(samples) - len(samples) % frame
+    frames = samples[:usable].reshape(-1, frame)
+    energy_db = 20 * np.log10(np.sqrt((frames ** 2).mean(axis=1)) + 1e-12)
+    keep = _speech_mask(
+        energy_db,
+        options["silence_threshold_db"],
+        max(1, options["max_silence_ms"] // 20),
+        pad_frames=5,
+    )
+    trimmed = np.concatenate([frames[keep].ravel(), samples[usable:] if keep[-1:].all() else samples[:0]])
+    if len(trimmed) < len(samples):
+        steps.append("trim_silence")
+
+    target = options["resample_hz"]
+    if target and target < rate:
+        trimmed = _resample(trimmed, rate, target)
+        rate = target
+        steps.append(f"resample_{target}")
+
+    pcm = (np.clip(trimmed, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+    out = io.BytesIO()
+    with wave.open(out, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(rate)
+        writer.writeframes(pcm)
+    return out.getvalue(), "audio/wav", steps
+
+
+def process_ffmpeg(data: bytes, options: dict) -> Optional[Tuple[bytes, str, List[str]]]:
+    """Trim silence and re-encode as mono Opus with ffmpeg."""
+    binary = shutil.which(options["ffmpeg_path"])
+    if binary is None:
+        return None
+    threshold = f"{options['silence_threshold_db']}dB"
+    silence = (
+        f"silenceremove=start_periods=1:start_threshold={threshold}"
+        f":stop_periods=-1:stop_duration={options['max_silence_ms'] / 1000}:stop_threshold={threshold}"
+    )
+    command = [binary, "-hide_banner", "-loglevel", "error", "-i", "pipe:0", "-vn", "-af", silence, "-ac", "1"]
+    if options["resample_hz"]:
+        command += ["-ar", str(options["resample_hz"])]
+    command += ["-c:a", "libopus", "-b:a", "24k", "-bitexact", "-f", "ogg", "pipe:1"]
+    completed = subprocess.run(command, input=data, capture_output=True, timeout=options["timeout_s"])
+    if completed.returncode != 0 or not completed.stdout:
+        return None
+    steps = ["trim_silence", "downmix"] + ([f"resample_{options['resample_hz']}"] if options["resample_hz"] else [])
+    return completed.stdout, "audio/ogg", steps
+
+
+def _ffmpeg_available() -> bool:
+    return shutil.which(get_settings().ffmpeg_path) is not None
+
+
+# name -> (MIME types handled or None for any, function, availability check or None)
+_PREPROCESSORS: Dict[str, Tuple[Optional[Tuple[str, ...]], Callable, Optional[Callable[[], bool]]]] = {
+    "wav": (("audio/wav",), process_wav, None),
+    "ffmpeg": (None, process_ffmpeg, _ffmpeg_available),
+}
+
+
+def register_preprocessor(
+    name: str,
+    func: Callable,
+    mime_types: Optional[Tuple[str, ...]] = None,
+    available: Optional[Callable[[], bool]] = None
+) -> None:
+    """Add a backend usable in AUDIO_PREPROCESSORS.
+
+    Args:
+        name: Name to list in AUDIO_PREPROCESSORS
+        func: Module-level ``func(data, options) -> (data, mime_type, steps) | None``
+            (it runs in a worker process, so it must be importable)
+        mime_types: Types it handles (None: any)
+        available: Checked before each use; the backend is skipped while it
+            returns False (e.g. a missing binary)
+    """
+    _PREPROCESSORS[name] = (mime_types, func, available)
+
+
+def _backends(mime: str) -> List[Callable]:
+    """Usable backends for a MIME type, in AUDIO_PREPROCESSORS order."""
+    backends = []
+    for name in get_settings().audio_preprocessors.split(","):
+        entry = _PREPROCESSORS.get(name.strip())
+        if entry is None:
+            continue
+        mime_types, func, available = entry
+        if (mime_types is None or mime in mime_types) and (available is None or available()):
+            backends.append(func)
+    return backends
+
+
+def _run(data: bytes, mime: str, backends: List[Callable], options: dict) -> Tuple[bytes, str, List[str]]:
+    """Try backends in order; the first that makes the audio smaller wins."""
+    for func in backends:
+        result = func(data, options)
+        if result is not None and len(result[0]) < len(data):
+            return result
+    return data, mime, []
+
+
+_pool: Optional[Executor] = None
+
+
+def _get_pool() -> Optional[Executor]:
+    global _pool
+    workers = get_settings().audio_preprocess_workers
+    if workers <= 0:
+        return None
+    if _pool is None:
+        # spawn: forking a process with running threads isn't safe
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+    return _pool
+
+
+def _options() -> dict:
+    settings = get_settings()
+    return {
+        "silence_threshold_db": settings.audio_silence_threshold_db,
+        "max_silence_ms": settings.audio_max_silence_ms,
+        "resample_hz": settings.audio_resample_hz,
+        "ffmpeg_path": settings.ffmpeg_path,
+        "timeout_s": 120,
+    }
+
+
+async def preprocess(data: bytes) -> PreprocessResult:
+    """Shrink audio for transcription (see module docstring).
+
+    Args:
+        data: Audio as uploaded
+
+    Returns:
+        The audio to send (the original if nothing helped) and what was done
+    """
+    settings = get_settings()
+    mime = detect_mime(data)
+    result = PreprocessResult(data, mime, len(data))
+    with start_span("audio.preprocess", **{"audio.mime_type": mime, "audio.bytes_in": len(data)}) as span:
+        backends = _backends(mime) if settings.audio_preprocess_enabled else []
+        if backends:
+            try:
+                pool = _get_pool()
+                if pool is None:
+                    processed = await asyncio.to_thread(_run, data, mime, backends, _options())
+                else:
+                    loop = asyncio.get_running_loop()
+                    processed = await loop.run_in_executor(pool, _run, data, mime, backends, _options())
+                result.data, result.mime_type, result.steps = processed
+            except BrokenProcessPool as e:
+                logger.warning("Audio pre-processing worker died (%s); sending the original", e)
+                shutdown()  # the next request starts a fresh pool
+            except Exception as e:
+                logger.warning("Audio pre-processing failed (%s); sending the original", e)
+        if span:
+            span.set_attribute("audio.bytes_out", result.bytes_out)
+            span.set_attribute("audio.steps", ",".join(result.steps))
+
+    bytes_total.inc(result.bytes_in, stage="in")
+    bytes_total.inc(result.bytes_out, stage="out")
+    if result.steps:
+        logger.info(
+            "Pre-processed %s audio: %s -> %s bytes (%s)",
+            mime, result.bytes_in, result.bytes_out, ", ".join(result.steps)
+        )
+    return result
+
+
+def shutdown() -> None:
+    """Stop the worker processes."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
@@ -1,16 +1,34 @@
 """Audio Service - handles audio file storage and retrieval via DB."""
+import hashlib
+import zlib
+from pathlib import Path
 from uuid import UUID
 
 from sqlmodel import Session
 
-from app.logger import logger
-from app.models import Idea
-from app.repos import idea_repo
+from app import metrics
+from app.config import get_settings
+from app.logger import get_logger
+from app.models import AudioBlob
+from app.repos import audio_repo, idea_repo
+
+logger = get_logger(__name__)
+
+dedup_total = metrics.counter("audio_dedup_total", "Audio saves by whether the content was already stored")
+dedup_bytes_saved = metrics.counter("audio_dedup_bytes_saved_total", "Audio bytes not stored again thanks to deduplication")
+
+# Matroska/WebM element ids (MediaRecorder's default container)
+EBML_MAGIC = b"\x1a\x45\xdf\xa3"
+CLUSTER_ID = b"\x1f\x43\xb6\x75"
 
 
 async def save_audio(session: Session, idea_id: UUID, audio_bytes: bytes) -> int:
     """Save audio bytes to database.
     
+    Audio is stored once per SHA-256: uploading bytes that are already
+    stored (a retried upload, one memo attached to two ideas) only adds a
+    reference to the existing copy.
+    
     Args:
         session: DB session
         idea_id: The idea UUID
@@ -23,7 +41,19 @@ async def save_audio(session: Session, idea_id: UUID, audio_bytes: bytes) -> int
     if not idea:
         raise ValueError(f"Idea not found: {idea_id}")
     
-    idea.audio_blob = audio_bytes
+    digest = hashlib.sha256(audio_bytes).hexdigest()
+    if idea.audio_sha256 == digest:
+        logger.info("Audio for idea %s unchanged (%s)", idea_id, digest[:12])
+        return len(audio_bytes)
+    
+    audio_repo.release(session, idea.audio_sha256)
+    _, existed = audio_repo.acquire(session, digest, audio_bytes)
+    dedup_total.inc(result="hit" if existed else "miss")
+    if existed:
+        dedup_bytes_saved.inc(len(audio_bytes))
+    
+    idea.audio_sha256 = digest
+    idea.audio_blob = None
     idea.audio_size = len(audio_bytes)
     # Clear old path if exists
     idea.audio_path = None
@@ -32,12 +62,78 @@ async def save_audio(session: Session, idea_id: UUID, audio_bytes: bytes) -> int
     session.commit()
     session.refresh(idea)
     
-    logger.info(f"Saved audio for idea {idea_id}: {len(audio_bytes)} bytes")
+    logger.info(
+        "Saved audio for idea %s: %s bytes (%s%s)",
+        idea_id, len(audio_bytes), digest[:12], ", already stored" if existed else ""
+    )
     return len(audio_bytes)
 
 
+def webm_header(audio_bytes: bytes) -> bytes | None:
+    """The WebM header (everything before the first Cluster) of a recording.
+    
+    Prefixing it to a run of whole clusters from the same recording gives
+    a file that decodes on its own.
+    
+    Returns:
+        The header, b"" if the bytes are not WebM, or None if they are
+        WebM but the first Cluster has not arrived yet
+    """
+    if not audio_bytes.startswith(EBML_MAGIC):
+        return b"" if len(audio_bytes) >= len(EBML_MAGIC) else None
+    end = audio_bytes.find(CLUSTER_ID)
+    return audio_bytes[:end] if end > 0 else None
+
+
+def last_cluster_start(audio_bytes: bytes | bytearray, after: int = 0) -> int:
+    """Offset of the last WebM Cluster starting after ``after`` (-1 if none)."""
+    return audio_bytes.rfind(CLUSTER_ID, after + 1)
+
+
+def read_blob(blob: AudioBlob) -> bytes:
+    """Original audio bytes of a blob, whatever tier it is stored in."""
+    if blob.tier == "disk":
+        stored = Path(blob.path).read_bytes()
+    else:
+        stored = blob.data or b""
+    return zlib.decompress(stored) if blob.codec == "zlib" else stored
+
+
+def encode_for_tier(data: bytes) -> tuple[bytes, str]:
+    """Compress audio for colder storage if that actually saves space.
+    
+    Recorder formats (Opus, AAC, MP3) are already compressed and rarely
+    shrink; those are stored as they are.
+    
+    Returns:
+        The bytes to store and their codec ("zlib" or "none")
+    """
+    settings = get_settings()
+    compressed = zlib.compress(data, settings.audio_compress_level)
+    if len(compressed) <= len(data) * (1 - settings.audio_compress_min_saving):
+        return compressed, "zlib"
+    return data, "none"
+
+
+def cold_path(sha256: str) -> Path:
+    """File of a blob in the disk tier."""
+    return Path(get_settings().audio_cold_dir) / sha256[:2] / sha256
+
+
+def get_audio_file(session: Session, idea_id: UUID) -> Path | None:
+    """Path of an idea's audio if it is an uncompressed file in the disk tier.
+    
+    Lets downloads stream cold audio from disk instead of loading it.
+    """
+    idea = idea_repo.get_idea(session, idea_id)
+    blob = audio_repo.get_blob(session, idea.audio_sha256) if idea and idea.audio_sha256 else None
+    if blob and blob.tier == "disk" and blob.codec == "none":
+        return Path(blob.path)
+    return None
+
+
 def get_audio(session: Session, idea_id: UUID) -> bytes | None:
-    """Get audio bytes from database.
+    """Get audio bytes from database (decompressed / read from disk as needed).
     
     Args:
         session: DB session
@@ -47,28 +143,34 @@ def get_audio(session: Session, idea_id: UUID) -> bytes | None:
         Audio bytes if found, None otherwise
     """
     idea = idea_repo.get_idea(session, idea_id)
-    if not idea or not idea.audio_blob:
+    if not idea:
         return None
-    
-    return idea.audio_blob
+    if idea.audio_sha256:
+        blob = audio_repo.get_blob(session, idea.audio_sha256)
+        return read_blob(blob) if blob else None
+    return idea.audio_blob or None
 
 
 def audio_exists(session: Session, idea_id: UUID) -> bool:
     """Check if audio exists for an idea."""
     idea = idea_repo.get_idea(session, idea_id)
-    return bool(idea and idea.audio_blob)
+    return bool(idea and (idea.audio_sha256 or idea.audio_blob))
 
 
 def delete_audio(session: Session, idea_id: UUID) -> bool:
     """Delete audio from database.
     
+    Shared audio is only removed once no other idea references it.
+    
     Returns:
         True if deleted
     """
     idea = idea_repo.get_idea(session, idea_id)
-    if not idea or not idea.audio_blob:
+    if not idea or not (idea.audio_sha256 or idea.audio_blob):
         return False
     
+    audio_repo.release(session, idea.audio_sha256)
+    idea.audio_sha256 = None
     idea.audio_blob = None
     idea.audio_size = None
     idea.audio_path = None
@@ -76,5 +178,5 @@ def delete_audio(session: Session, idea_id: UUID) -> bool:
     session.add(idea)
     session.commit()
     
-    logger.info(f"Deleted audio for idea {idea_id}")
+    logger.info("Deleted audio for idea %s", idea_id)
     return True
@@ -1,8 +1,16 @@
 """Cleaning Service - removes filler words and normalizes text."""
 import re
-from typing import List
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Sequence
 
-# Common filler words and phrases to remove
+from app.logger import get_logger
+from app.services import filler_dictionaries
+from app.tracing import traced
+
+logger = get_logger(__name__)
+
+# Common filler words and phrases to remove (built-in English list; the
+# fillers/en.txt dictionary mirrors it and is used by default)
 FILLER_WORDS = [
     r"\bum+\b",
     r"\buh+\b",
@@ -18,56 +26,267 @@ FILLER_WORDS = [
     r"\bwell\b(?=\s+well\b)",  # repeated "well well"
 ]
 
+_REPEAT_LOOKAHEAD = r"(?=\s+"
+_GUARD_PREFIX = r"\b(?=["
+
+# Normalization passes, compiled once
+_COLLAPSE_RE = re.compile(r",{2,}|\.{2,}| {2,}|\n{3,}")
+_WHITESPACE_RE = re.compile(r" {2,}|\n{3,}")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([.,!?;:])")
+_SPACE_AFTER_PUNCT_RE = re.compile(r"([.,!?;:])\s*([A-Z])")
+
+# Streaming cut points: punctuation, optional whitespace, then a capital
+_BOUNDARY_RE = re.compile(r"[.,!?;:]\s*(?=[A-Z])")
+_PUNCT_RE = re.compile(r"[.,!?;:]")
+
+
+def _collapse(match: re.Match) -> str:
+    run = match.group()
+    return "\n\n" if run[0] == "\n" else run[0]
+
+
+def build_filler_pattern(fillers: Sequence[str]) -> str:
+    """Combine an ordered filler list into one alternation.
+
+    Removing the fillers one pattern at a time means a "repeat" filler
+    such as ``\\blike\\b(?=\\s+like\\b)`` only sees the text after every
+    earlier pattern has been stripped ("like um like" loses its first
+    "like"). To match that in a single scan, each repeat lookahead is
+    widened to skip over whitespace-separated matches of the fillers
+    listed before it.
+
+    Args:
+        fillers: Regex patterns, applied in order by the sequential cleaner
+
+    Returns:
+        A single regex pattern with the same removal semantics
+    """
+    alternatives: List[str] = []
+    for pattern in fillers:
+        head, sep, tail = pattern.partition(_REPEAT_LOOKAHEAD)
+        if sep and tail.endswith(")") and alternatives:
+            earlier = "|".join(alternatives)
+            pattern = f"{head}(?=(?:\\s+(?:{earlier}))*\\s+{tail}"
+        alternatives.append(pattern)
+    combined = "|".join(f"(?:{alternative})" for alternative in alternatives)
+
+    # When every filler starts with "\b" + a literal letter (or an already
+    # guarded trie), guard the alternation with one character class so most
+    # positions are rejected up front.
+    first_letters = set()
+    for pattern in fillers:
+        if pattern.startswith(_GUARD_PREFIX):
+            first_letters.update(pattern[len(_GUARD_PREFIX):pattern.index("])")])
+        elif pattern.startswith(r"\b") and pattern[2:3].isalpha():
+            first_letters.add(pattern[2].lower())
+        else:
+            return combined
+    return rf"{_GUARD_PREFIX}{''.join(sorted(first_letters))}])(?:{combined})"
+
+
+class TranscriptCleaner:
+    """Filler removal and normalization with precompiled patterns.
+
+    All fillers are removed in one regex scan, and whitespace/punctuation
+    cleanup takes three more, instead of one scan per filler pattern.
+    """
+
+    def __init__(self, fillers: Sequence[str] = FILLER_WORDS, language: str = "en"):
+        """Compile the cleaner for a filler list.
+
+        Args:
+            fillers: Ordered filler regex patterns (see FILLER_WORDS)
+            language: Language code the fillers are for
+        """
+        self.language = language
+        self.fillers = list(fillers)
+        self._filler_re = re.compile(build_filler_pattern(self.fillers), re.IGNORECASE)
+
+    def remove_fillers(self, text: str) -> str:
+        """Strip fillers only (no punctuation or whitespace cleanup)."""
+        return self._filler_re.sub("", text)
+
+    def clean(self, text: str) -> str:
+        """Remove fillers, collapse punctuation and normalize whitespace."""
+        text = self._filler_re.sub("", text)
+        text = _COLLAPSE_RE.sub(_collapse, text)
+        text = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", text)
+        text = _SPACE_AFTER_PUNCT_RE.sub(r"\1 \2", text)
+        return text.strip()
+
+    def clean_many(self, texts: Iterable[str]) -> List[str]:
+        """Clean a batch of transcripts (e.g. when re-cleaning stored text)."""
+        strip_fillers = self._filler_re.sub
+        collapse = _COLLAPSE_RE.sub
+        before = _SPACE_BEFORE_PUNCT_RE.sub
+        after = _SPACE_AFTER_PUNCT_RE.sub
+
+        cleaned = []
+        for text in texts:
+            text = collapse(_collapse, strip_fillers("", text))
+            cleaned.append(after(r"\1 \2", before(r"\1", text)).strip())
+        return cleaned
+
+
+@lru_cache(maxsize=64)
+def get_cleaner(language: Optional[str] = None) -> TranscriptCleaner:
+    """Get the cached cleaner for a language.
+
+    Args:
+        language: Language or locale code (default language if omitted)
+
+    Returns:
+        Cleaner compiled from the language's filler dictionary. Falls back
+        to FILLER_WORDS for English and to the default language otherwise.
+    """
+    code = filler_dictionaries.normalize_language(language)
+    dictionary = filler_dictionaries.load_dictionary(code)
+    if dictionary:
+        return TranscriptCleaner(dictionary.patterns(), language=code)
+    if code == "en":
+        return TranscriptCleaner(FILLER_WORDS, language="en")
+
+    default = filler_dictionaries.normalize_language(None)
+    logger.warning("No filler dictionary for '%s', using '%s'", code, default)
+    return get_cleaner(default) if default != code else TranscriptCleaner(FILLER_WORDS)
+
+
+# Default English cleaner
+default_cleaner = get_cleaner("en")
+
+
+class StreamingCleaner:
+    """Incremental cleaner for transcripts that arrive in chunks.
+
+    Text is cut at "<punctuation><whitespace><Capital>" boundaries, where
+    cleaning the two halves separately and joining them with one space
+    gives exactly the batch result: fillers and their lookaheads never
+    cross punctuation, and normalization always turns such a boundary
+    into "<punctuation> <Capital>". A boundary is only used once the next
+    word is known not to be a filler, i.e. once more punctuation has
+    arrived after it. Everything after the last usable boundary stays in
+    the buffer, so ``"".join(pieces)`` equals ``clean_transcript(text)``.
+    """
+
+    def __init__(self, cleaner: Optional[TranscriptCleaner] = None):
+        """Start a stream.
+
+        Args:
+            cleaner: Cleaner to use (default English cleaner if omitted)
+        """
+        self.cleaner = cleaner or default_cleaner
+        self._buffer = ""
+        self._emitted = False
+
+    @property
+    def pending(self) -> str:
+        """Raw text received but not yet cleaned."""
+        return self._buffer
+
+    def _emit(self, raw: str) -> str:
+        cleaned = self.cleaner.clean(raw)
+        if self._emitted:
+            return " " + cleaned
+        self._emitted = bool(cleaned)
+        return cleaned
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk and return whatever cleaned text is now final.
+
+        Args:
+            chunk: Next piece of raw transcript
+
+        Returns:
+            Newly finalized cleaned text (may be empty)
+        """
+        self._buffer += chunk
+        buffer = self._buffer
+
+        for boundary in reversed(list(_BOUNDARY_RE.finditer(buffer))):
+            start = boundary.end()
+            if not _PUNCT_RE.search(buffer, start + 1):
+                continue  # next word could still turn out to be a filler
+            if self.cleaner._filler_re.match(buffer, start):
+                continue
+            self._buffer = buffer[start:]
+            return self._emit(buffer[:boundary.start() + 1])
+
+        return ""
+
+    def flush(self) -> str:
+        """Clean and return everything still buffered (end of stream)."""
+        buffer, self._buffer = self._buffer, ""
+        if not buffer:
+            return ""
+        return self._emit(buffer)
+
+
+def clean_stream(
+    chunks: Iterable[str],
+    cleaner: Optional[TranscriptCleaner] = None
+) -> Iterator[str]:
+    """Clean a chunked transcript incrementally.
+
+    Args:
+        chunks: Raw transcript pieces, in order
+        cleaner: Cleaner to use, e.g. get_cleaner("fr") (default English)
+
+    Yields:
+        Cleaned text pieces; joined, they equal clean_transcript of the
+        joined chunks
+    """
+    stream = StreamingCleaner(cleaner)
+    for chunk in chunks:
+        piece = stream.feed(chunk)
+        if piece:
+            yield piece
+    tail = stream.flush()
+    if tail:
+        yield tail
+
 
 def remove_fillers(text: str) -> str:
     """Remove filler words from transcript.
-    
+
     Args:
         text: Raw transcript text
-        
+
     Returns:
         Text with filler words removed
     """
-    cleaned = text
-    
-    for pattern in FILLER_WORDS:
-        cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
-    
-    # Remove excessive punctuation
-    cleaned = re.sub(r"[,]{2,}", ",", cleaned)
-    cleaned = re.sub(r"[.]{2,}", ".", cleaned)
-    
-    # Normalize whitespace
-    cleaned = normalize_whitespace(cleaned)
-    
-    return cleaned
+    return default_cleaner.clean(text)
 
 
 def normalize_whitespace(text: str) -> str:
     """Normalize whitespace in text.
-    
+
     - Collapses multiple spaces into single space
     - Removes leading/trailing whitespace
     - Normalizes newlines
     """
-    # Replace multiple spaces with single space
-    text = re.sub(r" +", " ", text)
-    
-    # Replace multiple newlines with double newline
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    
-    # Clean up space around punctuation
-    text = re.sub(r"\s+([.,!?;:])", r"\1", text)
-    text = re.sub(r"([.,!?;:])\s*([A-Z])", r"\1 \2", text)
-    
+    text = _WHITESPACE_RE.sub(_collapse, text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", text)
+    text = _SPACE_AFTER_PUNCT_RE.sub(r"\1 \2", text)
     return text.strip()
 
 
-def clean_transcript(text: str) -> str:
+@traced()
+def clean_transcript(text: str, language: Optional[str] = None) -> str:
     """Full transcript cleaning pipeline.
-    
-    Applies all cleaning operations.
+
+    Applies all cleaning operations with the language's filler dictionary.
+    """
+    return get_cleaner(language).clean(text)
+
+
+def clean_many(texts: Iterable[str], language: Optional[str] = None) -> List[str]:
+    """Clean many transcripts with one language's cleaner.
+
+    Args:
+        texts: Raw transcript texts
+        language: Language code (default language if omitted)
+
+    Returns:
+        Cleaned texts, in the same order
     """
-    cleaned = remove_fillers(text)
-    cleaned = normalize_whitespace(cleaned)
-    return cleaned
+    return get_cleaner(language).clean_many(texts)
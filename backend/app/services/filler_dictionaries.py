@@ -0,0 +1,236 @@
+"""Filler Dictionaries - per-language filler lists compiled into trie regexes.
+
+Dictionaries are plain-text files named ``<language>.txt`` (see
+``fillers/en.txt`` for the syntax). Plain entries are merged into a
+character trie and rendered as one prefix-factored regex, so the engine
+follows a single branch per text position and cleaning cost stays linear
+in the text length however many fillers a language defines.
+"""
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.config import get_settings
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+FILLER_DIR = Path(__file__).parent / "fillers"
+
+DEFAULT_LANGUAGE = "en"
+
+# Number of leading words inspected by detect_language
+DETECT_WORDS = 200
+
+# Language or locale codes accepted from clients ("en", "pt-BR", "zh_Hant")
+LANGUAGE_CODE_RE = re.compile(r"^[a-z]{2,3}([-_][A-Za-z]{2,4})?$")
+
+_END = ""
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class FillerEntry:
+    """One dictionary line: a word or phrase, optionally repeat-only."""
+
+    def __init__(self, text: str, repeat_only: bool = False):
+        self.text = text
+        self.repeat_only = repeat_only
+
+    def atoms(self) -> List[str]:
+        """Split into regex atoms: single characters, or "x+" for elongation."""
+        atoms: List[str] = []
+        for char in self.text:
+            if char == "+" and atoms:
+                atoms[-1] += "+"
+            else:
+                atoms.append(char)
+        return atoms
+
+    def pattern(self) -> str:
+        """Standalone regex for this entry (used for repeat-only entries)."""
+        body = "".join(_atom_regex(atom) for atom in self.atoms())
+        if not self.repeat_only:
+            return rf"\b{body}\b"
+        target = re.escape(self.text.replace("+", ""))
+        return rf"\b{body}\b(?=\s+{target}\b)"
+
+
+class FillerDictionary:
+    """Ordered filler entries and detection stopwords for one language."""
+
+    def __init__(self, language: str, entries: List[FillerEntry], stopwords: List[str]):
+        self.language = language
+        self.entries = entries
+        self.stopwords = frozenset(stopwords)
+
+    def patterns(self) -> List[str]:
+        """Ordered regex patterns for TranscriptCleaner.
+
+        Runs of plain entries become one trie pattern each; repeat-only
+        entries keep their own pattern and position, so their lookahead
+        can skip the fillers listed before them.
+        """
+        patterns: List[str] = []
+        run: List[FillerEntry] = []
+        for entry in self.entries:
+            if entry.repeat_only:
+                if run:
+                    patterns.append(trie_pattern(run))
+                    run = []
+                patterns.append(entry.pattern())
+            else:
+                run.append(entry)
+        if run:
+            patterns.append(trie_pattern(run))
+        return patterns
+
+
+def _atom_regex(atom: str) -> str:
+    if atom.endswith("+") and len(atom) > 1:
+        return re.escape(atom[:-1]) + "+"
+    return re.escape(atom)
+
+
+def trie_pattern(entries: List[FillerEntry]) -> str:
+    """Render plain entries as a single prefix-factored regex.
+
+    Args:
+        entries: Filler entries (repeat_only is ignored)
+
+    Returns:
+        Regex matching any entry as a whole word, longest entry first
+    """
+    root: Dict[str, dict] = {}
+    for entry in entries:
+        node = root
+        for atom in entry.atoms():
+            node = node.setdefault(atom.lower(), {})
+        node[_END] = {}
+
+    def render(node: Dict[str, dict]) -> str:
+        branches = [
+            _atom_regex(atom) + render(child)
+            for atom, child in node.items()
+            if atom != _END
+        ]
+        # Ending here is tried last so longer entries win
+        if _END in node:
+            branches.append(r"\b")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    first_chars = "".join(sorted(re.escape(atom[0]) for atom in root))
+    return rf"\b(?=[{first_chars}]){render(root)}"
+
+
+def parse_dictionary(language: str, source: str) -> FillerDictionary:
+    """Parse dictionary file contents.
+
+    Args:
+        language: Language code the dictionary is for
+        source: File contents
+
+    Returns:
+        Parsed dictionary
+
+    Raises:
+        ValueError: On an unknown section or a line outside any section
+    """
+    entries: List[FillerEntry] = []
+    stopwords: List[str] = []
+    section = None
+
+    for number, raw_line in enumerate(source.splitlines(), start=1):
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            section = line[1:-1].strip().lower()
+            if section not in ("fillers", "stopwords"):
+                raise ValueError(f"{language}: unknown section [{section}] on line {number}")
+            continue
+        if section == "fillers":
+            repeat_only = line.startswith("~")
+            text = " ".join(line.lstrip("~").lower().split())
+            entries.append(FillerEntry(text, repeat_only))
+        elif section == "stopwords":
+            stopwords.extend(word.lower() for word in line.split())
+        else:
+            raise ValueError(f"{language}: entry outside a section on line {number}")
+
+    return FillerDictionary(language, entries, stopwords)
+
+
+def _search_dirs() -> List[Path]:
+    """Dictionary directories, configured override directory first."""
+    extra = get_settings().filler_dictionary_dir
+    return ([Path(extra)] if extra else []) + [FILLER_DIR]
+
+
+def validate_language(language: Optional[str]) -> Optional[str]:
+    """Check a language code supplied by a client.
+
+    Raises:
+        ValueError: If the code isn't a plain language or locale code
+    """
+    if language is not None and not LANGUAGE_CODE_RE.match(language):
+        raise ValueError(f"Invalid language code '{language}' (expected e.g. 'en' or 'pt-BR')")
+    return language
+
+
+def normalize_language(language: Optional[str]) -> str:
+    """Reduce a locale such as "en-US" or "pt_BR" to its language code."""
+    if not language:
+        return get_settings().default_language
+    return re.split(r"[-_]", language.strip().lower(), maxsplit=1)[0]
+
+
+def available_languages() -> List[str]:
+    """List languages that have a dictionary file."""
+    return sorted({
+        path.stem
+        for directory in _search_dirs() if directory.is_dir()
+        for path in directory.glob("*.txt")
+    })
+
+
+@lru_cache(maxsize=64)
+def load_dictionary(language: str) -> Optional[FillerDictionary]:
+    """Load and cache the dictionary for a language.
+
+    Args:
+        language: Language code (already normalized)
+
+    Returns:
+        Dictionary, or None if no file exists for the language
+    """
+    # Only names found by listing the directories ever reach the filesystem
+    if language not in available_languages():
+        return None
+    for directory in _search_dirs():
+        path = directory / f"{language}.txt"
+        if path.is_file():
+            logger.info("Loading filler dictionary %s", path)
+            return parse_dictionary(language, path.read_text(encoding="utf-8"))
+    return None
+
+
+def detect_language(text: str) -> str:
+    """Guess a transcript's language from stopword hits.
+
+    Args:
+        text: Transcript text
+
+    Returns:
+        Best-matching language code, or the default language if none match
+    """
+    words = _WORD_RE.findall(text.lower())[:DETECT_WORDS]
+    best, best_hits = get_settings().default_language, 0
+    for language in available_languages():
+        dictionary = load_dictionary(language)
+        hits = sum(word in dictionary.stopwords for word in words) if dictionary else 0
+        if hits > best_hits:
+            best, best_hits = language, hits
+    return best
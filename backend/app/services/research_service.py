@@ -0,0 +1,69 @@
+"""Research Service - generates the sections of an idea's research report."""
+from typing import Dict, Literal, Mapping, Tuple
+
+from app.adapters.registry import create_adapter
+from app.logger import get_logger
+from app.tracing import traced
+
+logger = get_logger(__name__)
+
+AdapterType = Literal["gemini", "dummy", "replay"]
+
+# Report sections A-K: key -> (title, what the section covers)
+SECTIONS: Dict[str, Tuple[str, str]] = {
+    "A": ("Problem", "The problem being solved, who has it and how painful it is today."),
+    "B": ("Target Customers", "Primary customer segments, personas and early adopters."),
+    "C": ("Market Size", "Rough TAM/SAM/SOM estimates with stated assumptions."),
+    "D": ("Competitive Landscape", "Direct and indirect competitors and substitutes."),
+    "E": ("Value Proposition", "Differentiation and why customers would switch."),
+    "F": ("Business Model", "Revenue streams, pricing and unit economics."),
+    "G": ("Go-to-Market", "Acquisition channels and launch strategy."),
+    "H": ("Technical Feasibility", "Key technical components, build-vs-buy and hard parts."),
+    "I": ("Risks", "Market, execution, regulatory and technical risks with mitigations."),
+    "J": ("Validation Plan", "MVP scope and the cheapest experiments to test the riskiest assumptions."),
+    "K": ("Summary and Recommendation", "Overall assessment, verdict (pursue / refine / drop) and next steps."),
+}
+
+# Written last, from the other sections
+SYNTHESIS_SECTION = "K"
+
+
+def get_adapter(adapter_type: AdapterType = "dummy", api_key: str | None = None):
+    """Get the appropriate model adapter."""
+    return create_adapter(adapter_type, api_key)
+
+
+@traced()
+async def generate_section(
+    key: str,
+    text: str,
+    adapter_type: AdapterType = "dummy",
+    api_key: str | None = None,
+    completed: Mapping[str, str] | None = None
+) -> str:
+    """Generate one report section.
+
+    Args:
+        key: Section key ("A"-"K")
+        text: Idea transcript (or title)
+        adapter_type: Which adapter to use
+        api_key: Optional API key
+        completed: Finished sections (key -> content), given to the synthesis section
+
+    Returns:
+        Section text
+    """
+    title, brief = SECTIONS[key]
+    logger.info("Generating research section %s (%s) using %s adapter", key, title, adapter_type)
+
+    if key == SYNTHESIS_SECTION and completed:
+        findings = "\n\n".join(
+            f"{SECTIONS[other][0]}:\n{content}" for other, content in sorted(completed.items())
+        )
+        text = f"{text}\n\nResearch findings:\n{findings}"
+
+    adapter = get_adapter(adapter_type, api_key)
+    content = await adapter.research_section(title, brief, text)
+
+    logger.info("Generated research section %s: %s chars", key, len(content))
+    return content
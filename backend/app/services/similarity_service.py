@@ -0,0 +1,325 @@
+"""Similarity Service - near-duplicate detection over cleaned transcripts.
+
+Transcripts are embedded with signed feature hashing (word unigrams and
+bigrams hashed into a fixed number of dimensions, L2-normalized), so no
+model or network call is needed. Vectors live in a NumPy matrix that grows
+by appending rows and is persisted as an append-only file on disk.
+"""
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.config import get_settings
+from app.db import engine
+from app.logger import get_logger
+from app.models import Transcript
+from app.tracing import traced
+
+logger = get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+VECTORS_FILE = "vectors.f32"
+IDS_FILE = "ids.txt"
+
+
+def embed(text: str, dims: int) -> np.ndarray:
+    """Embed text as an L2-normalized hashed feature vector.
+
+    Args:
+        text: Input text
+        dims: Vector dimensionality
+
+    Returns:
+        float32 vector of length dims (all zeros for empty text)
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    if not features:
+        return np.zeros(dims, dtype=np.float32)
+
+    hashes = np.fromiter(
+        (zlib.crc32(feature.encode("utf-8")) for feature in features),
+        dtype=np.uint32,
+        count=len(features)
+    )
+    # Low bits pick the bucket, the top bit picks the sign (limits collision bias)
+    signs = np.where(hashes >> 31, -1.0, 1.0)
+    vector = np.bincount(hashes % dims, weights=signs, minlength=dims).astype(np.float32)
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SimilarityIndex:
+    """Append-only cosine similarity index keyed by idea UUID.
+
+    Updating an idea appends a new row and zeroes the old one; removing an
+    idea zeroes its row and appends a zero "tombstone" row to the log.
+    Stale rows are compacted away once they outnumber live ones.
+    """
+
+    def __init__(self, directory: Path, dims: int):
+        self.directory = directory
+        self.dims = dims
+        self._lock = threading.Lock()
+        self._matrix = np.zeros((64, dims), dtype=np.float32)
+        self._row_ids: List[Optional[UUID]] = []
+        self._rows: Dict[UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.directory / VECTORS_FILE
+
+    @property
+    def _ids_path(self) -> Path:
+        return self.directory / IDS_FILE
+
+    def _append_row(self, idea_id: UUID, vector: np.ndarray) -> int:
+        """Append a row in memory, doubling capacity when full."""
+        row = len(self._row_ids)
+        if row == self._matrix.shape[0]:
+            grown = np.zeros((self._matrix.shape[0] * 2, self.dims), dtype=np.float32)
+            grown[:row] = self._matrix[:row]
+            self._matrix = grown
+        self._matrix[row] = vector
+        self._row_ids.append(idea_id)
+        return row
+
+    def _drop_row(self, idea_id: UUID) -> None:
+        row = self._rows.pop(idea_id, None)
+        if row is not None:
+            self._matrix[row] = 0.0
+            self._row_ids[row] = None
+
+    def _persist(self, idea_id: UUID, vector: np.ndarray) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self._vectors_path, "ab") as f:
+            f.write(vector.astype(np.float32).tobytes())
+        with open(self._ids_path, "a", encoding="utf-8") as f:
+            f.write(f"{idea_id}\n")
+
+    def add(self, idea_id: UUID, text: str) -> None:
+        """Index (or re-index) an idea's transcript text."""
+        vector = embed(text, self.dims)
+        with self._lock:
+            self._drop_row(idea_id)
+            if vector.any():
+                self._rows[idea_id] = self._append_row(idea_id, vector)
+            self._persist(idea_id, vector)
+            self._maybe_compact()
+
+    def remove(self, idea_id: UUID) -> None:
+        """Remove an idea from the index."""
+        with self._lock:
+            if idea_id not in self._rows:
+                return
+            self._drop_row(idea_id)
+            self._persist(idea_id, np.zeros(self.dims, dtype=np.float32))
+            self._maybe_compact()
+
+    def vector(self, idea_id: UUID) -> Optional[np.ndarray]:
+        """Get the stored vector for an idea, if indexed."""
+        row = self._rows.get(idea_id)
+        return None if row is None else self._matrix[row].copy()
+
+    def query(
+        self,
+        vector: np.ndarray,
+        k: int = 5,
+        exclude: Optional[UUID] = None,
+        min_score: float = 0.0
+    ) -> List[Tuple[UUID, float]]:
+        """Find the k most similar indexed ideas.
+
+        Args:
+            vector: Normalized query vector
+            k: Max neighbors to return
+            exclude: Idea to leave out (usually the query idea itself)
+            min_score: Minimum cosine similarity
+
+        Returns:
+            List of (idea_id, similarity), most similar first
+        """
+        with self._lock:
+            count = len(self._row_ids)
+            if not count or not vector.any():
+                return []
+            scores = self._matrix[:count] @ vector
+            if exclude in self._rows:
+                scores[self._rows[exclude]] = -1.0
+
+            # Over-fetch by one so the excluded row can't crowd out a hit
+            top = min(count, k + 1)
+            candidates = np.argpartition(-scores, top - 1)[:top]
+            candidates = candidates[np.argsort(-scores[candidates])]
+            hits = [(self._row_ids[row], float(scores[row])) for row in candidates]
+
+        results = [
+            (idea_id, score) for idea_id, score in hits
+            if idea_id is not None and idea_id != exclude and score > min_score
+        ]
+        return results[:k]
+
+    def load(self) -> int:
+        """Replay the on-disk log into memory.
+
+        Returns:
+            Number of live ideas loaded
+        """
+        with self._lock:
+            self._matrix = np.zeros((64, self.dims), dtype=np.float32)
+            self._row_ids = []
+            self._rows = {}
+
+            if not self._vectors_path.exists() or not self._ids_path.exists():
+                return 0
+
+            vectors = np.fromfile(self._vectors_path, dtype=np.float32)
+            ids = self._ids_path.read_text(encoding="utf-8").split()
+            # A crash between the two appends can leave one file a row ahead
+            count = min(len(ids), vectors.size // self.dims)
+            vectors = vectors[:count * self.dims].reshape(count, self.dims)
+
+            latest: Dict[UUID, int] = {}
+            for row, raw_id in enumerate(ids[:count]):
+                latest[UUID(raw_id)] = row
+
+            for idea_id, row in latest.items():
+                if vectors[row].any():
+                    self._rows[idea_id] = self._append_row(idea_id, vectors[row])
+
+            if count > len(self._rows):
+                self._rewrite()
+            return len(self._rows)
+
+    def _maybe_compact(self) -> None:
+        if len(self._row_ids) > 2 * max(len(self._rows), 32):
+            self._rewrite()
+
+    def _rewrite(self) -> None:
+        """Rewrite memory and disk with live rows only (caller holds the lock)."""
+        live = [(idea_id, self._matrix[row].copy()) for idea_id, row in self._rows.items()]
+        self._matrix = np.zeros((max(64, len(live) * 2), self.dims), dtype=np.float32)
+        self._row_ids = []
+        self._rows = {}
+        for idea_id, vector in live:
+            self._rows[idea_id] = self._append_row(idea_id, vector)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_vectors = self._vectors_path.with_suffix(".tmp")
+        tmp_ids = self._ids_path.with_suffix(".tmp")
+        self._matrix[:len(live)].tofile(tmp_vectors)
+        tmp_ids.write_text("".join(f"{idea_id}\n" for idea_id, _ in live), encoding="utf-8")
+        tmp_vectors.replace(self._vectors_path)
+        tmp_ids.replace(self._ids_path)
+
+
+_index: Optional[SimilarityIndex] = None
+
+
+def get_index() -> SimilarityIndex:
+    """Get the process-wide similarity index (loaded from disk on first use)."""
+    global _index
+    if _index is None:
+        settings = get_settings()
+        _index = SimilarityIndex(Path(settings.similarity_index_dir), settings.similarity_dims)
+        loaded = _index.load()
+        logger.info("Loaded similarity index: %s ideas", loaded)
+    return _index
+
+
+def init_index() -> int:
+    """Load the index at startup, re-embedding transcripts if it is empty.
+
+    Returns:
+        Number of indexed ideas
+    """
+    index = get_index()
+    if not len(index):
+        with Session(engine) as session:
+            rebuild_index(session)
+    return len(index)
+
+
+def rebuild_index(session: Session) -> int:
+    """Re-embed every stored transcript.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Number of ideas indexed
+    """
+    index = get_index()
+    for transcript in session.exec(select(Transcript)).all():
+        index.add(transcript.idea_id, transcript.cleaned_text)
+    return len(index)
+
+
+@traced()
+def index_transcript(idea_id: UUID, text: str) -> None:
+    """Add or refresh an idea's cleaned transcript in the index."""
+    get_index().add(idea_id, text)
+
+
+def remove_idea(idea_id: UUID) -> None:
+    """Drop an idea from the index."""
+    get_index().remove(idea_id)
+
+
+def find_similar(idea_id: UUID, k: int = 5) -> List[Tuple[UUID, float]]:
+    """Find the top-k ideas most similar to an indexed idea.
+
+    Args:
+        idea_id: Idea UUID
+        k: Number of neighbors
+
+    Returns:
+        List of (idea_id, similarity), most similar first
+
+    Raises:
+        ValueError: If the idea has no indexed transcript
+    """
+    index = get_index()
+    vector = index.vector(idea_id)
+    if vector is None:
+        raise ValueError(f"No indexed transcript for idea: {idea_id}")
+    return index.query(vector, k=k, exclude=idea_id)
+
+
+@traced()
+def find_duplicates(
+    idea_id: UUID,
+    text: str,
+    threshold: Optional[float] = None,
+    k: int = 5
+) -> List[Tuple[UUID, float]]:
+    """Find ideas whose transcript is likely a duplicate of text.
+
+    Args:
+        idea_id: The idea being processed (excluded from results)
+        text: Cleaned transcript text
+        threshold: Min cosine similarity (defaults to settings)
+        k: Max duplicates to return
+
+    Returns:
+        List of (idea_id, similarity) at or above the threshold
+    """
+    if threshold is None:
+        threshold = get_settings().duplicate_threshold
+    vector = embed(text, get_index().dims)
+    return [
+        (other_id, score)
+        for other_id, score in get_index().query(vector, k=k, exclude=idea_id)
+        if score >= threshold
+    ]
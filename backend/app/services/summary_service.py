@@ -1,24 +1,27 @@
 """Summary Service - generates summaries and bullet points."""
 from typing import List, Literal
 
-from app.adapters.dummy_adapter import DummyAdapter
-from app.adapters.gemini_adapter import GeminiAdapter
-from app.logger import logger
+from app.adapters import ModelAdapter
+from app.adapters.registry import create_adapter
+from app.logger import get_logger
+from app.tracing import traced
 
-AdapterType = Literal["gemini", "dummy"]
+logger = get_logger(__name__)
+
+AdapterType = Literal["gemini", "dummy", "replay"]
 
 
 def get_adapter(adapter_type: AdapterType = "dummy", api_key: str | None = None):
     """Get the appropriate model adapter."""
-    if adapter_type == "gemini":
-        return GeminiAdapter(api_key=api_key)
-    return DummyAdapter()
+    return create_adapter(adapter_type, api_key)
 
 
+@traced()
 async def generate_bullets(
     text: str,
     adapter_type: AdapterType = "dummy",
-    api_key: str | None = None
+    api_key: str | None = None,
+    adapter: ModelAdapter | None = None
 ) -> List[str]:
     """Generate bullet point summary from text.
     
@@ -26,23 +29,26 @@ async def generate_bullets(
         text: Input text to summarize
         adapter_type: Which adapter to use
         api_key: Optional API key
+        adapter: Adapter instance to reuse (overrides adapter_type/api_key)
         
     Returns:
         List of 3-8 bullet points
     """
-    logger.info(f"Generating bullets using {adapter_type} adapter")
+    logger.info("Generating bullets using %s adapter", adapter_type)
     
-    adapter = get_adapter(adapter_type, api_key)
+    adapter = adapter or get_adapter(adapter_type, api_key)
     bullets = await adapter.generate_bullets(text)
     
-    logger.info(f"Generated {len(bullets)} bullet points")
+    logger.info("Generated %s bullet points", len(bullets))
     return bullets
 
 
+@traced()
 async def generate_long_summary(
     text: str,
     adapter_type: AdapterType = "dummy",
-    api_key: str | None = None
+    api_key: str | None = None,
+    adapter: ModelAdapter | None = None
 ) -> str:
     """Generate a longer summary paragraph.
     
@@ -50,14 +56,15 @@ async def generate_long_summary(
         text: Input text to summarize
         adapter_type: Which adapter to use
         api_key: Optional API key
+        adapter: Adapter instance to reuse (overrides adapter_type/api_key)
         
     Returns:
         Summary text (2-3 sentences)
     """
-    logger.info(f"Generating summary using {adapter_type} adapter")
+    logger.info("Generating summary using %s adapter", adapter_type)
     
-    adapter = get_adapter(adapter_type, api_key)
+    adapter = adapter or get_adapter(adapter_type, api_key)
     summary = await adapter.summarize_text(text)
     
-    logger.info(f"Generated summary: {len(summary)} chars")
+    logger.info("Generated summary: %s chars", len(summary))
     return summary
@@ -1,11 +1,14 @@
 """Tagging Service - suggests tags and categories for ideas."""
 from typing import List, Literal, Tuple
 
-from app.adapters.dummy_adapter import DummyAdapter
-from app.adapters.gemini_adapter import GeminiAdapter
-from app.logger import logger
+from app.adapters import ModelAdapter
+from app.adapters.registry import create_adapter
+from app.logger import get_logger
+from app.tracing import traced
 
-AdapterType = Literal["gemini", "dummy"]
+logger = get_logger(__name__)
+
+AdapterType = Literal["gemini", "dummy", "replay"]
 
 # Pre-defined categories
 PREDEFINED_CATEGORIES = [
@@ -29,15 +32,15 @@ PREDEFINED_CATEGORIES = [
 
 def get_adapter(adapter_type: AdapterType = "dummy", api_key: str | None = None):
     """Get the appropriate model adapter."""
-    if adapter_type == "gemini":
-        return GeminiAdapter(api_key=api_key)
-    return DummyAdapter()
+    return create_adapter(adapter_type, api_key)
 
 
+@traced()
 async def suggest_tags(
     text: str,
     adapter_type: AdapterType = "dummy",
-    api_key: str | None = None
+    api_key: str | None = None,
+    adapter: ModelAdapter | None = None
 ) -> List[Tuple[str, float]]:
     """Suggest tags for the given text.
     
@@ -45,19 +48,20 @@ async def suggest_tags(
         text: Input text to analyze
         adapter_type: Which adapter to use
         api_key: Optional API key
+        adapter: Adapter instance to reuse (overrides adapter_type/api_key)
         
     Returns:
         List of (tag, confidence) tuples, sorted by confidence
     """
-    logger.info(f"Suggesting tags using {adapter_type} adapter")
+    logger.info("Suggesting tags using %s adapter", adapter_type)
     
-    adapter = get_adapter(adapter_type, api_key)
+    adapter = adapter or get_adapter(adapter_type, api_key)
     tags = await adapter.suggest_tags(text)
     
     # Sort by confidence
     tags_sorted = sorted(tags, key=lambda x: x[1], reverse=True)
     
-    logger.info(f"Suggested {len(tags_sorted)} tags")
+    logger.info("Suggested %s tags", len(tags_sorted))
     return tags_sorted
 
 
@@ -2,13 +2,17 @@
 from pathlib import Path
 from typing import Literal
 
+from app import audio_formats
 from app.adapters import ModelAdapter
-from app.adapters.dummy_adapter import DummyAdapter
-from app.adapters.gemini_adapter import GeminiAdapter
+from app.adapters.registry import create_adapter
 from app.config import get_settings
-from app.logger import logger
+from app.logger import get_logger
+from app.services import audio_preprocessing
+from app.tracing import start_span, traced
 
-AdapterType = Literal["gemini", "dummy"]
+logger = get_logger(__name__)
+
+AdapterType = Literal["gemini", "dummy", "replay"]
 
 
 def get_adapter(adapter_type: AdapterType = "dummy", api_key: str | None = None) -> ModelAdapter:
@@ -21,16 +25,15 @@ def get_adapter(adapter_type: AdapterType = "dummy", api_key: str | None = None)
     Returns:
         Model adapter instance
     """
-    if adapter_type == "gemini":
-        return GeminiAdapter(api_key=api_key)
-    else:
-        return DummyAdapter()
+    return create_adapter(adapter_type, api_key)
 
 
+@traced()
 async def transcribe_audio(
     audio_path: Path | str,
     adapter_type: AdapterType = "dummy",
-    api_key: str | None = None
+    api_key: str | None = None,
+    adapter: ModelAdapter | None = None
 ) -> str:
     """Transcribe an audio file.
     
@@ -38,6 +41,7 @@ async def transcribe_audio(
         audio_path: Path to audio file
         adapter_type: Which adapter to use
         api_key: Optional API key for the adapter
+        adapter: Adapter instance to reuse (created from adapter_type if omitted)
         
     Returns:
         Raw transcription text
@@ -47,31 +51,36 @@ async def transcribe_audio(
     if not path.exists():
         raise FileNotFoundError(f"Audio file not found: {path}")
     
-    logger.info(f"Transcribing {path} using {adapter_type} adapter")
+    logger.info("Transcribing %s using %s adapter", path, adapter_type)
     
-    adapter = get_adapter(adapter_type, api_key)
+    adapter = adapter or get_adapter(adapter_type, api_key)
     raw_text = await adapter.transcribe_audio(path)
     
-    logger.info(f"Transcription complete: {len(raw_text)} chars")
+    logger.info("Transcription complete: %s chars", len(raw_text))
     return raw_text
 
 
 async def transcribe_audio_bytes(
     audio_bytes: bytes,
     adapter_type: AdapterType = "dummy",
-    api_key: str | None = None
+    api_key: str | None = None,
+    adapter: ModelAdapter | None = None
 ) -> str:
-    """Transcribe audio bytes (writes to temp file)."""
+    """Transcribe audio bytes (pre-processes, then writes to temp file)."""
     import tempfile
     import os
     
+    audio = await audio_preprocessing.preprocess(audio_bytes)
+    suffix = audio_formats.EXTENSIONS.get(audio.mime_type, ".bin")
+    
     # Create temp file
-    with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as tmp:
-        tmp.write(audio_bytes)
-        tmp_path = Path(tmp.name)
+    with start_span("tempfile.write", **{"audio.bytes": audio.bytes_out}):
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            tmp.write(audio.data)
+            tmp_path = Path(tmp.name)
     
     try:
-        return await transcribe_audio(tmp_path, adapter_type, api_key)
+        return await transcribe_audio(tmp_path, adapter_type, api_key, adapter)
     finally:
         # Cleanup
         if tmp_path.exists():
@@ -0,0 +1,175 @@
+"""Upload Service - resumable, chunked audio uploads.
+
+A client creates an upload session with the total size (and optionally
+the file's SHA-256), then sends the file in chunks, each tagged with the
+offset it starts at. Received bytes are appended to a staging file in
+``UPLOAD_DIR`` as they arrive, so a connection that drops mid-chunk keeps
+everything received up to that point. After a failure the client asks for
+the current offset and resends only what is missing. Completing the upload
+checks size and digest and moves the audio into the idea.
+
+Sessions without activity for ``UPLOAD_SESSION_TTL_S`` are deleted along
+with their staging files.
+"""
+import hashlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterable, Optional, Set
+from uuid import UUID
+
+from sqlmodel import Session
+
+from app.config import get_settings
+from app.logger import get_logger
+from app.models import AudioUpload
+from app.repos import upload_repo
+
+logger = get_logger(__name__)
+
+_active: Set[UUID] = set()
+
+
+def _staging_path(upload_id: UUID) -> Path:
+    return Path(get_settings().upload_dir) / f"{upload_id}.part"
+
+
+def current_offset(upload: AudioUpload) -> int:
+    """Bytes received so far (the offset the next chunk must start at)."""
+    path = _staging_path(upload.id)
+    return path.stat().st_size if path.exists() else 0
+
+
+def is_busy(upload_id: UUID) -> bool:
+    """Whether a chunk for the upload is being received right now."""
+    return upload_id in _active
+
+
+def create_upload(
+    session: Session,
+    idea_id: UUID,
+    size: int,
+    sha256: Optional[str] = None,
+    filename: Optional[str] = None
+) -> AudioUpload:
+    """Start an upload session.
+
+    Args:
+        session: DB session
+        idea_id: Idea the audio is for
+        size: Total bytes the client will send
+        sha256: Expected SHA-256 of the whole file (hex), checked on completion
+        filename: Original filename
+
+    Returns:
+        The upload session
+    """
+    settings = get_settings()
+    if size <= 0:
+        raise ValueError("Upload size must be positive")
+    if size > settings.upload_max_bytes:
+        raise ValueError(f"Upload too large: {size} bytes (limit {settings.upload_max_bytes})")
+
+    cleanup_expired(session)
+    upload = upload_repo.create_upload(session, idea_id, size, sha256.lower() if sha256 else None, filename)
+    path = _staging_path(upload.id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    logger.info("Upload %s started for idea %s: %s bytes", upload.id, idea_id, size)
+    return upload
+
+
+async def append_chunk(
+    session: Session,
+    upload: AudioUpload,
+    chunks: AsyncIterable[bytes],
+    chunk_sha256: Optional[str] = None
+) -> int:
+    """Append a chunk at the current offset.
+
+    Without ``chunk_sha256`` bytes are written as they arrive, so a broken
+    connection keeps what got through. With it the chunk is buffered,
+    verified and only then written, so a corrupted chunk is rejected on
+    its own instead of failing the whole upload at completion.
+
+    Args:
+        session: DB session
+        upload: Upload session
+        chunks: The request body
+        chunk_sha256: Expected SHA-256 of this chunk (hex), if given
+
+    Returns:
+        The new offset
+    """
+    _active.add(upload.id)
+    path = _staging_path(upload.id)
+    start = current_offset(upload)
+    try:
+        with open(path, "ab") as staging:
+            if chunk_sha256:
+                buffer = bytearray()
+                async for piece in chunks:
+                    # Stop reading as soon as the chunk is too big to fit
+                    if start + len(buffer) + len(piece) > upload.size:
+                        raise ValueError(f"Chunk exceeds upload size ({upload.size} bytes)")
+                    buffer += piece
+                data = bytes(buffer)
+                if hashlib.sha256(data).hexdigest() != chunk_sha256.lower():
+                    raise ValueError("Chunk checksum mismatch; resend it")
+                staging.write(data)
+            else:
+                async for piece in chunks:
+                    if staging.tell() + len(piece) > upload.size:
+                        staging.truncate(start)
+                        raise ValueError(f"Chunk exceeds upload size ({upload.size} bytes)")
+                    staging.write(piece)
+    finally:
+        _active.discard(upload.id)
+        upload_repo.touch_upload(session, upload)
+    return current_offset(upload)
+
+
+def complete_upload(session: Session, upload: AudioUpload) -> tuple[bytes, str]:
+    """Verify a fully received upload and end the session.
+
+    Returns:
+        The audio bytes and their SHA-256 (hex)
+
+    Raises:
+        ValueError: If bytes are missing (the session is kept, so the client
+            can send them) or the digest doesn't match (the session is
+            deleted; the upload has to start over)
+    """
+    received = current_offset(upload)
+    if received != upload.size:
+        raise ValueError(f"Upload incomplete: {received} of {upload.size} bytes received")
+
+    data = _staging_path(upload.id).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if upload.sha256 and digest != upload.sha256:
+        delete_upload(session, upload)
+        raise ValueError("Upload checksum mismatch; start a new upload")
+
+    delete_upload(session, upload)
+    logger.info("Upload %s complete: %s bytes", upload.id, len(data))
+    return data, digest
+
+
+def delete_upload(session: Session, upload: AudioUpload) -> None:
+    """Abort an upload session and remove its staged bytes."""
+    _staging_path(upload.id).unlink(missing_ok=True)
+    upload_repo.delete_upload(session, upload)
+
+
+def cleanup_expired(session: Session) -> int:
+    """Delete upload sessions idle for longer than UPLOAD_SESSION_TTL_S.
+
+    Returns:
+        Number of sessions deleted
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=get_settings().upload_session_ttl_s)
+    stale = [upload for upload in upload_repo.get_stale_uploads(session, cutoff) if not is_busy(upload.id)]
+    for upload in stale:
+        delete_upload(session, upload)
+    if stale:
+        logger.info("Deleted %s abandoned upload(s)", len(stale))
+    return len(stale)
@@ -0,0 +1,343 @@
+"""Request-scoped tracing.
+
+Spans follow the OpenTelemetry data model (trace/span/parent ids, start
+and end time in unix nanoseconds, attributes, status) and are propagated
+through a context variable, so nested service and adapter calls made while
+handling a request form one span tree - including work in asyncio tasks,
+which copy the context.
+
+``TracingMiddleware`` opens the root span, adds a ``Server-Timing`` header
+summarizing the tree, and hands requests slower than
+``trace_slow_threshold_ms`` to the configured exporter.
+"""
+import asyncio
+import functools
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Max entries in the Server-Timing header (largest total durations first)
+SERVER_TIMING_MAX_ENTRIES = 12
+
+# Max characters of SQL kept on db.query spans
+DB_STATEMENT_MAX_CHARS = 200
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "trace_id", "span_id", "parent_span_id", "name", "kind",
+        "start_time_unix_nano", "end_time_unix_nano", "attributes", "status", "_started",
+    )
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: Optional[str], kind: str = "internal"):
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.start_time_unix_nano = time.time_ns()
+        self.end_time_unix_nano: Optional[int] = None
+        self.attributes: Dict[str, object] = {}
+        self.status = "unset"
+        self._started = time.perf_counter_ns()
+
+    def end(self) -> None:
+        # perf_counter for the duration, anchored to the wall-clock start
+        self.end_time_unix_nano = self.start_time_unix_nano + (time.perf_counter_ns() - self._started)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_time_unix_nano or (
+            self.start_time_unix_nano + (time.perf_counter_ns() - self._started)
+        )
+        return (end - self.start_time_unix_nano) / 1e6
+
+    def set_attribute(self, key: str, value: object) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": self.start_time_unix_nano,
+            "endTimeUnixNano": self.end_time_unix_nano,
+            "attributes": self.attributes,
+            "status": self.status,
+        }
+
+
+class Trace:
+    """All spans recorded for one request."""
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def enabled() -> bool:
+    return get_settings().tracing_enabled
+
+
+def current_span() -> Optional[Span]:
+    """Get the active span, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def start_span(name: str, kind: str = "internal", **attributes: object) -> Iterator[Optional[Span]]:
+    """Open a child span of the active span for the duration of a block.
+
+    Outside a traced request (or with tracing off) this is a no-op that
+    yields None.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    span = Span(name, trace.trace_id, parent.span_id if parent else None, kind)
+    span.attributes.update(attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+        if span.status == "unset":
+            span.status = "ok"
+    except BaseException as e:
+        span.status = "error"
+        span.set_attribute("exception.type", type(e).__name__)
+        raise
+    finally:
+        span.end()
+        _current_span.reset(token)
+        trace.add(span)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator wrapping a sync or async function in a span.
+
+    Args:
+        name: Span name (defaults to "<module>.<function>")
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_trace.get() is None:
+                    return await func(*args, **kwargs)
+                with start_span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with start_span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# ---- Exporters ----
+
+def _render_tree(trace: Trace) -> str:
+    children: Dict[Optional[str], List[Span]] = {}
+    for span in trace.spans:
+        children.setdefault(span.parent_span_id, []).append(span)
+
+    lines = []
+
+    def walk(parent_id: Optional[str], depth: int) -> None:
+        for span in sorted(children.get(parent_id, []), key=lambda s: s.start_time_unix_nano):
+            marker = " !" if span.status == "error" else ""
+            lines.append(f"{'  ' * depth}{span.name} {span.duration_ms:.2f}ms{marker}")
+            walk(span.span_id, depth + 1)
+
+    walk(None, 0)
+    return "\n".join(lines)
+
+
+def _export_console(trace: Trace) -> None:
+    logger.warning("Slow request trace %s:\n%s", trace.trace_id, _render_tree(trace))
+
+
+_file_lock = threading.Lock()
+
+
+def _export_file(trace: Trace) -> None:
+    record = {
+        "traceId": trace.trace_id,
+        "spans": [span.to_dict() for span in trace.spans],
+    }
+    line = json.dumps(record, default=str)
+    with _file_lock, open(get_settings().trace_file, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+EXPORTERS: Dict[str, Callable[[Trace], None]] = {
+    "console": _export_console,
+    "file": _export_file,
+}
+
+
+def export(trace: Trace) -> None:
+    """Send a finished trace to the configured exporter."""
+    exporter = EXPORTERS.get(get_settings().trace_exporter)
+    if exporter is None:
+        return
+    try:
+        exporter(trace)
+    except Exception as e:  # exporting must never fail a request
+        logger.error("Trace export failed: %s", e)
+
+
+# ---- Server-Timing ----
+
+_TOKEN_RE = re.compile(r"[^!#$%&'*+\-.^_`|~0-9A-Za-z]")
+
+
+def server_timing(trace: Trace, root: Span) -> str:
+    """Summarize a trace as a Server-Timing header value.
+
+    Child spans are aggregated by name (e.g. every db.query) and the
+    largest totals are listed, followed by the whole request as "total".
+    """
+    totals: Dict[str, List[float]] = {}
+    for span in trace.spans:
+        if span is root:
+            continue
+        entry = totals.setdefault(span.name, [0.0, 0])
+        entry[0] += span.duration_ms
+        entry[1] += 1
+
+    ranked = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+    parts = []
+    for name, (duration, count) in ranked[:SERVER_TIMING_MAX_ENTRIES]:
+        token = _TOKEN_RE.sub("_", name)
+        desc = f';desc="x{count}"' if count > 1 else ""
+        parts.append(f"{token};dur={duration:.2f}{desc}")
+    parts.append(f"total;dur={root.duration_ms:.2f}")
+    return ", ".join(parts)
+
+
+# ---- Integrations ----
+
+def instrument_engine(engine: Engine) -> None:
+    """Record a db.query span for every SQL statement."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        trace = _current_trace.get()
+        if trace is None:
+            return
+        parent = _current_span.get()
+        span = Span("db.query", trace.trace_id, parent.span_id if parent else None, "client")
+        span.set_attribute("db.system", engine.dialect.name)
+        span.set_attribute("db.statement", statement[:DB_STATEMENT_MAX_CHARS])
+        if context is not None:
+            # Kept on the execution context, not the pooled connection, so a
+            # span can only ever be closed by its own statement
+            context._tracing_span = span
+
+    def _finish(context, status: str) -> Optional[Span]:
+        span = getattr(context, "_tracing_span", None)
+        if span is None:
+            return None
+        context._tracing_span = None
+        span.status = status
+        span.end()
+        trace = _current_trace.get()
+        if trace is not None and trace.trace_id == span.trace_id:
+            trace.add(span)
+        return span
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        _finish(context, "ok")
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        span = _finish(exception_context.execution_context, "error")
+        if span is not None:
+            span.set_attribute("exception.type", type(exception_context.original_exception).__name__)
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a root span per HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not enabled():
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace(os.urandom(16).hex())
+        root = Span(f"{scope['method']} {scope['path']}", trace.trace_id, None, "server")
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(root)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                root.set_attribute("http.status_code", message["status"])
+                headers = list(message.get("headers", []))
+                if any(k == b"content-type" and v.startswith(b"text/event-stream") for k, v in headers):
+                    root.set_attribute("http.streaming", True)
+                headers.append((b"server-timing", server_timing(trace, root).encode("latin-1")))
+                headers.append((b"x-trace-id", trace.trace_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+            root.status = "ok"
+        except BaseException:
+            root.status = "error"
+            raise
+        finally:
+            root.end()
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+
+            route = scope.get("route")
+            if route is not None:
+                root.name = f"{scope['method']} {route.path}"
+            trace.add(root)
+
+            # Event streams stay open by design; they aren't slow requests
+            streaming = root.attributes.get("http.streaming", False)
+            if not streaming and root.duration_ms >= get_settings().trace_slow_threshold_ms:
+                export(trace)
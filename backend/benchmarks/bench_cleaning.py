@@ -0,0 +1,149 @@
+"""Transcript cleaner benchmark and parity check.
+
+Compares the precompiled single-pass cleaner against the original
+one-`re.sub`-per-filler implementation (kept below as the reference) on
+realistic transcripts and on randomized filler-heavy text, checks that
+the streaming cleaner reproduces the batch output for randomly chunked
+input, and fails if any output differs.
+
+Usage (from backend/):
+    python -m benchmarks.bench_cleaning
+"""
+import argparse
+import random
+import re
+import sys
+import time
+
+from app.adapters.dummy_adapter import MOCK_TRANSCRIPTS
+from app.services import cleaning_service, filler_dictionaries
+from app.services.cleaning_service import FILLER_WORDS, TranscriptCleaner
+
+
+def reference_normalize_whitespace(text: str) -> str:
+    text = re.sub(r" +", " ", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = re.sub(r"\s+([.,!?;:])", r"\1", text)
+    text = re.sub(r"([.,!?;:])\s*([A-Z])", r"\1 \2", text)
+    return text.strip()
+
+
+def reference_clean_transcript(text: str) -> str:
+    """The cleaner as originally written: one pass per filler pattern."""
+    cleaned = text
+    for pattern in FILLER_WORDS:
+        cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(r"[,]{2,}", ",", cleaned)
+    cleaned = re.sub(r"[.]{2,}", ".", cleaned)
+    cleaned = reference_normalize_whitespace(cleaned)
+    return reference_normalize_whitespace(cleaned)
+
+
+FUZZ_TOKENS = [
+    "um", "Um", "umm", "Uh", "ah", "eh", "like", "Like", "you", "You", "know",
+    "i", "I", "mean", "basically", "actually", "Actually", "literally", "so",
+    "So", "soo", "well", "Well", "idea", "The", "A", "app", ",", ".", "!", "?",
+    ":", ";", "..", ",,", "'s", "-",
+]
+FUZZ_SEPARATORS = [" ", " ", " ", "", "  ", "\n", "\n\n\n", "\t"]
+
+
+def fuzz_corpus(count: int, rng: random.Random) -> list:
+    return [
+        "".join(
+            rng.choice(FUZZ_TOKENS) + rng.choice(FUZZ_SEPARATORS)
+            for _ in range(rng.randint(1, 16))
+        )
+        for _ in range(count)
+    ]
+
+
+def random_chunks(text: str, rng: random.Random, max_cuts: int = 8) -> list:
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, max_cuts))))
+    return [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+
+
+def speech_corpus(words: int, rng: random.Random) -> str:
+    """Long transcript stitched from the mock memos (~words words)."""
+    base = " ".join(MOCK_TRANSCRIPTS).split()
+    return " ".join(rng.choice(base) for _ in range(words))
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fuzz", type=int, default=100_000, help="random texts for parity")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions (best of)")
+    args = parser.parse_args()
+    rng = random.Random(1234)
+
+    # Parity
+    corpus = fuzz_corpus(args.fuzz, rng) + list(MOCK_TRANSCRIPTS)
+    corpus += [speech_corpus(n, rng) for n in (50, 500, 5000)]
+    mismatches = [
+        text for text in corpus
+        if cleaning_service.clean_transcript(text) != reference_clean_transcript(text)
+    ]
+    batch_ok = cleaning_service.clean_many(corpus) == [reference_clean_transcript(t) for t in corpus]
+    print(f"parity: {len(corpus) - len(mismatches)}/{len(corpus)} identical, clean_many ok={batch_ok}")
+    for text in mismatches[:5]:
+        print(f"  mismatch: {text!r}")
+
+    stream_mismatches = [
+        text for text in corpus
+        if "".join(cleaning_service.clean_stream(random_chunks(text, rng)))
+        != cleaning_service.clean_transcript(text)
+    ]
+    print(f"streaming parity: {len(corpus) - len(stream_mismatches)}/{len(corpus)} identical")
+    for text in stream_mismatches[:5]:
+        print(f"  mismatch: {text!r}")
+
+    # Speed
+    sizes = {"short memo": 60, "5 min": 750, "hour-long": 9000}
+    for label, words in sizes.items():
+        text = speech_corpus(words, rng)
+        old = best_of(lambda: reference_clean_transcript(text), args.repeat)
+        new = best_of(lambda: cleaning_service.clean_transcript(text), args.repeat)
+        print(f"{label:>10} ({words:>5} words): reference {old * 1e3:8.3f}ms  "
+              f"cleaner {new * 1e3:8.3f}ms  x{old / new:.1f}")
+
+    batch = [speech_corpus(60, rng) for _ in range(5000)]
+    old = best_of(lambda: [reference_clean_transcript(t) for t in batch], args.repeat)
+    new = best_of(lambda: cleaning_service.clean_many(batch), args.repeat)
+    print(f"clean_many (5000 memos): reference {old:.3f}s  cleaner {new:.3f}s  x{old / new:.1f}")
+
+    # Streaming an hour-long transcript in ~2s-of-speech chunks
+    text = speech_corpus(9000, rng)
+    chunks = [text[i:i + 40] for i in range(0, len(text), 40)]
+    streamed = best_of(lambda: list(cleaning_service.clean_stream(chunks)), args.repeat)
+    print(f"clean_stream ({len(chunks)} chunks, hour-long): {streamed * 1e3:.3f}ms")
+
+    # Dictionary size scaling: trie-compiled dictionary vs one re.sub per entry
+    text = speech_corpus(9000, rng)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    for size in (12, 100, 1000, 5000):
+        words = {"".join(rng.choice(letters) for _ in range(rng.randint(3, 9))) for _ in range(size)}
+        source = "[fillers]\n" + "\n".join(sorted(words))
+        dictionary = filler_dictionaries.parse_dictionary("bench", source)
+        cleaner = TranscriptCleaner(dictionary.patterns(), language="bench")
+        trie = best_of(lambda: cleaner.clean(text), args.repeat)
+        line = f"dictionary {len(words):>5} entries: trie cleaner {trie * 1e3:8.3f}ms"
+        if size <= 1000:
+            patterns = [re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE) for word in words]
+            naive = best_of(lambda: [p.sub("", text) for p in patterns], 1)
+            line += f"  per-entry re.sub {naive * 1e3:9.3f}ms"
+        print(line)
+
+    return 1 if mismatches or stream_mismatches or not batch_ok else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
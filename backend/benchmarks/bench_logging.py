@@ -0,0 +1,109 @@
+"""Logging overhead benchmark.
+
+Drives the app in-process (httpx ASGI transport, no sockets) with a mix
+of list, detail and dummy-adapter process requests, and compares request
+throughput with logging off against synchronous and queue-backed text and
+JSON logging at DEBUG level (app and SQL records on).
+
+Usage (from backend/):
+    python -m benchmarks.bench_logging --requests 2000 --concurrency 16
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+WORKDIR = Path(tempfile.mkdtemp(prefix="bench_logging_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{WORKDIR / 'bench.db'}"
+os.environ["SIMILARITY_INDEX_DIR"] = str(WORKDIR / "similarity")
+os.environ["DEBUG"] = "true"
+os.environ["TRACE_EXPORTER"] = "none"
+
+import httpx  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.db import init_db  # noqa: E402
+from app.logger import configure_logging, stop_logging  # noqa: E402
+from app.main import app  # noqa: E402
+
+# name -> (log_level, log_format, log_queue)
+MODES = {
+    "off": ("CRITICAL", "text", False),
+    "sync-text": ("DEBUG", "text", False),
+    "queue-text": ("DEBUG", "text", True),
+    "queue-json": ("DEBUG", "json", True),
+}
+
+
+async def run_load(idea_ids: list, requests: int, concurrency: int) -> float:
+    """Send the request mix; returns requests per second."""
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(n: int) -> None:
+            idea_id = idea_ids[n % len(idea_ids)]
+            async with semaphore:
+                if n % 10 == 0:
+                    response = await client.post(f"/ideas/{idea_id}/process")
+                elif n % 2:
+                    response = await client.get(f"/ideas/{idea_id}")
+                else:
+                    response = await client.get("/ideas")
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(n) for n in range(requests)))
+        return requests / (time.perf_counter() - started)
+
+
+async def seed(count: int) -> list:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        ids = []
+        for n in range(count):
+            idea = (await client.post("/ideas", json={"title": f"Idea {n}"})).json()
+            await client.post(
+                f"/ideas/{idea['id']}/audio",
+                files={"file": ("memo.webm", b"\0" * 4096, "audio/webm")}
+            )
+            ids.append(idea["id"])
+        return ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="requests per mode")
+    parser.add_argument("--concurrency", type=int, default=16, help="requests in flight")
+    parser.add_argument("--ideas", type=int, default=50, help="ideas to seed")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    settings.log_level, settings.log_queue = "CRITICAL", False
+    settings.log_levels = "sqlalchemy.engine=CRITICAL"
+    configure_logging()
+    init_db()
+    idea_ids = asyncio.run(seed(args.ideas))
+
+    print(f"{args.requests} requests per mode, concurrency {args.concurrency}")
+    print(f"{'mode':<12} {'req/s':>9} {'vs off':>8} {'log MB':>8}")
+    baseline = None
+    for name, (level, fmt, use_queue) in MODES.items():
+        log_path = WORKDIR / f"{name}.log"
+        settings.log_level, settings.log_format, settings.log_queue = level, fmt, use_queue
+        settings.log_levels = "" if level == "DEBUG" else "sqlalchemy.engine=CRITICAL"
+        with open(log_path, "w", encoding="utf-8") as stream:
+            configure_logging(stream)
+            asyncio.run(run_load(idea_ids, args.requests // 10, args.concurrency))  # warm-up
+            rate = asyncio.run(run_load(idea_ids, args.requests, args.concurrency))
+            stop_logging()  # drains the queue before the file closes
+
+        baseline = baseline or rate
+        size_mb = log_path.stat().st_size / 1e6
+        print(f"{name:<12} {rate:>9.0f} {rate / baseline:>7.0%} {size_mb:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
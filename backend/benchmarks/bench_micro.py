@@ -0,0 +1,197 @@
+"""Micro-benchmarks for CPU hot paths.
+
+Times the transcript cleaner (memo to hour-long transcripts), the Gemini
+response parsers, idea serialization for list endpoints (up to 10k ideas)
+and base64 encoding of audio (memo to hour-long recordings).
+
+Each case is calibrated with ``timeit`` autorange, repeated, and reported
+as median and fastest time per call, with the interquartile range as a
+noise measure. ``--save`` stores results as JSON; ``--compare`` checks a
+run against a saved baseline and exits non-zero if any case's fastest
+time (the least noisy statistic) regressed by more than ``--threshold``
+percent.
+
+Usage (from backend/):
+    python -m benchmarks.bench_micro --save baseline.json
+    python -m benchmarks.bench_micro --compare baseline.json --threshold 10
+"""
+import argparse
+import base64
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+WORKDIR = Path(tempfile.mkdtemp(prefix="bench_micro_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{WORKDIR / 'bench.db'}"
+os.environ["DEBUG"] = "false"
+
+from app.adapters.gemini_adapter import parse_bullets, parse_tags  # noqa: E402
+from app.models import Idea, IdeaStatus  # noqa: E402
+from app.routers.idea_router import _idea_to_response  # noqa: E402
+from app.services.cleaning_service import clean_transcript  # noqa: E402
+from benchmarks.fake_adapter import FILLERS, WORDS  # noqa: E402
+
+# ~150 spoken words per minute
+TRANSCRIPT_WORDS = {"memo-30s": 75, "memo-5min": 750, "meeting-1h": 9000}
+
+# ~32 KB/s (webm/opus at 256 kbps worst case)
+AUDIO_BYTES = {"memo-30s": 1_000_000, "memo-5min": 10_000_000, "meeting-1h": 115_000_000}
+
+IDEA_COUNTS = (100, 10_000)
+
+
+def make_transcript(words: int, rng: random.Random) -> str:
+    sentences = []
+    while words > 0:
+        length = min(words, rng.randint(6, 18))
+        parts = [rng.choice(WORDS) for _ in range(length)]
+        for _ in range(rng.randint(0, 2)):
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice(FILLERS))
+        sentences.append(" ".join(parts).capitalize() + rng.choice([".", ",", "?", "..."]))
+        words -= length
+    return "  ".join(sentences)
+
+
+def make_bullet_response(lines: int, rng: random.Random) -> str:
+    prefixes = ["- ", "• ", "", "# "]
+    return "\n".join(
+        rng.choice(prefixes) + " ".join(rng.choices(WORDS, k=12)) for _ in range(lines)
+    )
+
+
+def make_tag_response(lines: int, rng: random.Random) -> str:
+    tags = ["B2B", "SaaS", "Mobile App", "AI/ML", "Finance", "Productivity"]
+    return "\n".join(
+        f"- {rng.choice(tags)}: {rng.choice(['0.9', '0.75', 'high', '1.2'])}" for _ in range(lines)
+    )
+
+
+def make_ideas(count: int) -> List[Idea]:
+    now = datetime(2025, 1, 1)
+    statuses = list(IdeaStatus)
+    return [
+        Idea(
+            title=f"Idea {n}",
+            status=statuses[n % len(statuses)],
+            language="en",
+            created_at=now + timedelta(minutes=n),
+            updated_at=now + timedelta(minutes=n),
+        )
+        for n in range(count)
+    ]
+
+
+def build_cases(seed: int) -> Dict[str, Callable[[], object]]:
+    rng = random.Random(seed)
+    cases: Dict[str, Callable[[], object]] = {}
+
+    for name, words in TRANSCRIPT_WORDS.items():
+        text = make_transcript(words, rng)
+        cases[f"clean_transcript[{name}]"] = lambda text=text: clean_transcript(text)
+
+    for lines in (8, 500):
+        bullets = make_bullet_response(lines, rng)
+        tags = make_tag_response(lines, rng)
+        cases[f"parse_bullets[{lines} lines]"] = lambda bullets=bullets: parse_bullets(bullets)
+        cases[f"parse_tags[{lines} lines]"] = lambda tags=tags: parse_tags(tags)
+
+    for count in IDEA_COUNTS:
+        ideas = make_ideas(count)
+        cases[f"idea_to_response[{count} ideas]"] = lambda ideas=ideas: [_idea_to_response(i) for i in ideas]
+
+    for name, size in AUDIO_BYTES.items():
+        audio = rng.randbytes(size)
+        cases[f"base64_encode[{name}]"] = lambda audio=audio: base64.b64encode(audio).decode("utf-8")
+
+    return cases
+
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> Dict[str, float]:
+    """Time func: calibrate a loop count, then repeat it and summarize per-call times."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    runs = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    quartiles = statistics.quantiles(runs, n=4) if len(runs) > 1 else [runs[0]] * 3
+    return {
+        "median_s": statistics.median(runs),
+        "min_s": min(runs),
+        "iqr_s": quartiles[2] - quartiles[0],
+        "loops": number,
+    }
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[Tuple[str, float]]:
+    """Return (case, percent change) for cases slower than the threshold."""
+    regressions = []
+    print(f"\n{'case':<36} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<36} {'-':>10} {_format_time(current['min_s']):>10} {'new':>8}")
+            continue
+        change = (current["min_s"] / before["min_s"] - 1) * 100
+        # A slowdown inside the baseline's own noise band is not a regression
+        noise = before["iqr_s"] / before["median_s"] * 100
+        flag = ""
+        if change > max(threshold, noise):
+            flag = "  REGRESSION"
+            regressions.append((name, change))
+        elif change < -max(threshold, noise):
+            flag = "  improved"
+        print(f"{name:<36} {_format_time(before['min_s']):>10} "
+              f"{_format_time(current['min_s']):>10} {change:>+7.1f}%{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7, help="timed repetitions per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="min seconds per repetition")
+    parser.add_argument("--filter", default="", help="only run cases containing this text")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    args = parser.parse_args()
+
+    cases = {name: func for name, func in build_cases(args.seed).items() if args.filter in name}
+
+    results = {}
+    print(f"{'case':<36} {'median':>10} {'min':>10} {'iqr':>8} {'loops':>7}")
+    for name, func in cases.items():
+        stats = measure(func, args.repeat, args.min_time)
+        results[name] = stats
+        iqr_pct = stats["iqr_s"] / stats["median_s"] * 100
+        print(f"{name:<36} {_format_time(stats['median_s']):>10} "
+              f"{_format_time(stats['min_s']):>10} {iqr_pct:>7.1f}% {stats['loops']:>7}")
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nWrote {args.save}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0f}%")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""End-to-end pipeline benchmark.
+
+Drives the real FastAPI app in-process (httpx ASGI transport) through the
+user flow create idea -> upload audio -> process -> list, with the model
+replaced by benchmarks.fake_adapter (log-normal latency, throttling
+errors, configurable transcript size). Reports throughput and
+p50/p95/p99 per step at several concurrency levels, and optionally
+writes the results as JSON for tracking across commits.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pipeline --concurrency 1,4,16 --flows 40 --output pipeline.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+WORKDIR = Path(tempfile.mkdtemp(prefix="bench_pipeline_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{WORKDIR / 'bench.db'}"
+os.environ["SIMILARITY_INDEX_DIR"] = str(WORKDIR / "similarity")
+os.environ["DEBUG"] = "false"
+os.environ["LOG_LEVEL"] = "WARNING"
+os.environ["TRACE_EXPORTER"] = "none"
+
+import httpx  # noqa: E402
+
+from app.adapters.registry import register_adapter  # noqa: E402
+from app.db import init_db  # noqa: E402
+from app.main import app  # noqa: E402
+from benchmarks.fake_adapter import FakeAdapter, FakeProfile  # noqa: E402
+from benchmarks.stats import percentile  # noqa: E402
+
+STEPS = ("create", "upload", "process", "list", "flow")
+
+
+async def run_level(concurrency: int, flows: int, audio: bytes) -> dict:
+    """Run `flows` user flows with at most `concurrency` in flight."""
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def timed(step: str, request) -> httpx.Response | None:
+            started = time.perf_counter()
+            response = await request
+            latencies[step].append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors[step] += 1
+                return None
+            return response
+
+        async def flow(n: int) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                created = await timed("create", client.post("/ideas", json={"title": f"Idea {n}"}))
+                if created is None:
+                    return
+                idea_id = created.json()["id"]
+                files = {"file": ("memo.webm", audio, "audio/webm")}
+                if await timed("upload", client.post(f"/ideas/{idea_id}/audio", files=files)) is None:
+                    return
+                if await timed("process", client.post(f"/ideas/{idea_id}/process")) is None:
+                    return
+                if await timed("list", client.get("/ideas")) is None:
+                    return
+                latencies["flow"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(flow(n) for n in range(flows)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "flows": flows,
+        "completed": len(latencies["flow"]),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_flows_s": round(len(latencies["flow"]) / elapsed, 2),
+        "steps": {
+            step: {
+                "count": len(latencies[step]),
+                "errors": errors[step],
+                "p50_ms": round(percentile(latencies[step], 50) * 1000, 1),
+                "p95_ms": round(percentile(latencies[step], 95) * 1000, 1),
+                "p99_ms": round(percentile(latencies[step], 99) * 1000, 1),
+            }
+            for step in STEPS
+        },
+    }
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated levels")
+    parser.add_argument("--flows", type=int, default=40, help="user flows per level")
+    parser.add_argument("--audio-kb", type=int, default=256, help="uploaded audio size")
+    parser.add_argument("--transcript-words", type=int, default=600, help="fake transcript length")
+    parser.add_argument("--throttle-rate", type=float, default=0.02, help="fraction of model calls failing")
+    parser.add_argument("--latency-scale", type=float, default=0.1, help="multiplier on Gemini-like latencies")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    register_adapter("dummy", "benchmarks.fake_adapter:FakeAdapter")
+    FakeAdapter.profile = FakeProfile(
+        throttle_rate=args.throttle_rate,
+        transcript_words=args.transcript_words,
+        latency_scale=args.latency_scale,
+        seed=args.seed,
+    )
+    init_db()
+    audio = os.urandom(args.audio_kb * 1024)
+
+    levels = []
+    for concurrency in (int(level) for level in args.concurrency.split(",")):
+        result = asyncio.run(run_level(concurrency, args.flows, audio))
+        levels.append(result)
+
+        print(f"\nconcurrency {concurrency}: {result['throughput_flows_s']} flows/s "
+              f"({result['completed']}/{result['flows']} completed)")
+        print(f"  {'step':<8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+        for step, stats in result["steps"].items():
+            print(f"  {step:<8} {stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} "
+                  f"{stats['p99_ms']:>9.1f} {stats['errors']:>7}")
+
+    if args.output:
+        report = {
+            "benchmark": "pipeline",
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "config": vars(args),
+            "levels": levels,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Full-text search benchmark.
+
+Builds a throwaway SQLite database with N synthetic transcripts, indexes
+it with FTS5 and times ranked queries and incremental index updates.
+
+Usage (from backend/):
+    python -m benchmarks.bench_search --count 100000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+WORKDIR = Path(tempfile.mkdtemp(prefix="bench_search_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{WORKDIR / 'bench.db'}"
+os.environ["DEBUG"] = "false"
+
+from sqlmodel import Session, select  # noqa: E402
+
+from app.db import engine, init_db  # noqa: E402
+from app.models import Idea, Transcript  # noqa: E402
+from app.repos import search_repo  # noqa: E402
+
+VOCABULARY = (
+    "app platform marketplace habit tracker users freelancers plumbers "
+    "electricians booking subscription insights analytics fashion designer "
+    "authentication pricing mobile social education finance health wellness "
+    "productivity developer tools hardware sensor garden recipe travel "
+    "budget invoice schedule calendar reminder community local delivery"
+).split()
+
+QUERIES = ["habit", "marketplace plumbers", "subscription analytics", "garden sensor", "deli"]
+
+# Zipf-weighted background words so domain terms are selective, like real speech
+BACKGROUND = [f"w{n}" for n in range(5000)]
+WORDS = VOCABULARY + BACKGROUND
+WEIGHTS = [0.01] * len(VOCABULARY) + [1.0 / (rank + 1) for rank in range(len(BACKGROUND))]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, WEIGHTS, k=words)) + "."
+
+
+def populate(count: int, words: int, seed: int = 42) -> float:
+    """Insert synthetic ideas/transcripts and build the index. Returns seconds."""
+    rng = random.Random(seed)
+    batch = 5000
+    with Session(engine) as session:
+        for start in range(0, count, batch):
+            for _ in range(min(batch, count - start)):
+                idea = Idea(title=" ".join(rng.sample(VOCABULARY, 3)))
+                session.add(idea)
+                session.add(Transcript(
+                    idea_id=idea.id,
+                    cleaned_text=" ".join(_sentence(rng, 12) for _ in range(words // 12))
+                ))
+            session.commit()
+
+        started = time.perf_counter()
+        search_repo.rebuild_index(session)
+        return time.perf_counter() - started
+
+
+def time_queries(repeat: int, limit: int) -> dict:
+    results = {}
+    with Session(engine) as session:
+        for query in QUERIES:
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                total, _ = search_repo.search(session, query, limit=limit)
+                samples.append((time.perf_counter() - started) * 1000)
+            results[query] = (total, samples)
+    return results
+
+
+def time_updates(count: int) -> list:
+    samples = []
+    rng = random.Random(7)
+    with Session(engine) as session:
+        ideas = list(session.exec(select(Idea.id).limit(count)).all())
+        for idea_id in ideas:
+            started = time.perf_counter()
+            search_repo.index_idea(session, idea_id, transcript=_sentence(rng, 40))
+            session.commit()
+            samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000, help="number of transcripts")
+    parser.add_argument("--words", type=int, default=120, help="words per transcript")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per query")
+    parser.add_argument("--limit", type=int, default=20, help="page size")
+    args = parser.parse_args()
+
+    init_db()
+    print(f"Populating {args.count} transcripts in {WORKDIR} ...")
+    build_s = populate(args.count, args.words)
+    print(f"Index rebuild: {build_s:.2f}s")
+
+    for query, (total, samples) in time_queries(args.repeat, args.limit).items():
+        print(
+            f"query {query!r:24} hits={total:<6} p50={statistics.median(samples):7.2f}ms "
+            f"max={max(samples):7.2f}ms"
+        )
+
+    updates = time_updates(200)
+    print(f"incremental update p50={statistics.median(updates):.2f}ms max={max(updates):.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Idea listing serialization benchmark.
+
+Seeds a throwaway SQLite database with N ideas (optionally with audio
+blobs) and times building the ``GET /ideas`` body two ways:
+
+- legacy: load Idea objects, build an IdeaResponse per row, then validate
+  and serialize against ``response_model=List[IdeaResponse]`` the way
+  FastAPI does (model_dump, validate, dump to JSON-able, json.dumps)
+- fast: project the response columns straight to dicts and encode them
+  with orjson (app/responses.py), which is what the endpoint now does
+
+Both bodies are checked for identical content (exits non-zero on a
+mismatch), then the real endpoint is timed in-process end to end.
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization --count 10000 --audio-kb 64
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+WORKDIR = Path(tempfile.mkdtemp(prefix="bench_serialization_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{WORKDIR / 'bench.db'}"
+os.environ["SIMILARITY_INDEX_DIR"] = str(WORKDIR / "similarity")
+os.environ["DEBUG"] = "false"
+os.environ["LOG_LEVEL"] = "WARNING"
+os.environ["TRACE_EXPORTER"] = "none"
+
+import httpx  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from app.db import engine, init_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Idea, IdeaStatus  # noqa: E402
+from app.repos import idea_repo  # noqa: E402
+from app.responses import dumps  # noqa: E402
+from app.routers.idea_router import IdeaResponse, _idea_to_response  # noqa: E402
+
+RESPONSE_ADAPTER = TypeAdapter(List[IdeaResponse])
+
+
+def populate(count: int, audio_kb: int) -> None:
+    now = datetime(2025, 1, 1)
+    statuses = list(IdeaStatus)
+    audio = os.urandom(audio_kb * 1024) if audio_kb else None
+    with Session(engine) as session:
+        for n in range(count):
+            session.add(Idea(
+                title=f"Idea {n}",
+                status=statuses[n % len(statuses)],
+                language="en",
+                audio_blob=audio,
+                audio_size=len(audio) if audio else None,
+                created_at=now + timedelta(minutes=n, microseconds=n),
+                updated_at=now + timedelta(minutes=n),
+            ))
+        session.commit()
+
+
+def legacy_body() -> bytes:
+    with Session(engine) as session:
+        responses = [_idea_to_response(idea) for idea in idea_repo.get_all_ideas(session)]
+        validated = RESPONSE_ADAPTER.validate_python([r.model_dump() for r in responses])
+        content = RESPONSE_ADAPTER.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_body() -> bytes:
+    with Session(engine) as session:
+        return dumps(idea_repo.get_all_idea_rows(session))
+
+
+def time_calls(func: Callable[[], object], repeat: int) -> List[float]:
+    func()  # warm up
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def time_endpoint(repeat: int) -> List[float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await client.get("/ideas")
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            response = await client.get("/ideas")
+            samples.append(time.perf_counter() - started)
+            response.raise_for_status()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000, help="ideas in the listing")
+    parser.add_argument("--audio-kb", type=int, default=0, help="audio blob stored per idea")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    init_db()
+    populate(args.count, args.audio_kb)
+
+    legacy, fast = legacy_body(), fast_body()
+    if json.loads(legacy) != json.loads(fast):
+        sys.exit("Fast listing body differs from the legacy response_model body")
+    print(f"{args.count} ideas, {len(fast) / 1024:.0f} KB body (identical content)\n")
+
+    print(f"{'path':<10} {'median ms':>10} {'min ms':>10} {'ideas/s':>12}")
+    medians = {}
+    for name, func in (("legacy", legacy_body), ("fast", fast_body)):
+        samples = time_calls(func, args.repeat)
+        medians[name] = statistics.median(samples)
+        print(f"{name:<10} {medians[name] * 1000:>10.1f} {min(samples) * 1000:>10.1f} "
+              f"{args.count / medians[name]:>12,.0f}")
+    print(f"\nspeedup: {medians['legacy'] / medians['fast']:.1f}x")
+
+    samples = asyncio.run(time_endpoint(args.repeat))
+    print(f"GET /ideas end to end: median {statistics.median(samples) * 1000:.1f} ms, "
+          f"min {min(samples) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Near-duplicate index benchmark.
+
+Embeds N synthetic transcripts into a throwaway similarity index and times
+incremental appends, top-k queries and a cold reload from disk.
+
+Usage (from backend/):
+    python -m benchmarks.bench_similarity --count 100000
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from app.services.similarity_service import SimilarityIndex, embed
+
+WORDS = [f"w{n}" for n in range(5000)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000, help="number of transcripts")
+    parser.add_argument("--words", type=int, default=120, help="words per transcript")
+    parser.add_argument("--dims", type=int, default=512, help="vector dimensions")
+    parser.add_argument("--queries", type=int, default=200, help="number of top-k queries")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    directory = Path(tempfile.mkdtemp(prefix="bench_similarity_"))
+    index = SimilarityIndex(directory, args.dims)
+
+    texts = [" ".join(rng.choices(WORDS, k=args.words)) for _ in range(args.count)]
+    ids = [uuid4() for _ in texts]
+
+    started = time.perf_counter()
+    for idea_id, text in zip(ids, texts):
+        index.add(idea_id, text)
+    add_s = time.perf_counter() - started
+    print(f"append {args.count} transcripts: {add_s:.2f}s ({add_s / args.count * 1e6:.0f}us each)")
+
+    samples = []
+    for _ in range(args.queries):
+        position = rng.randrange(args.count)
+        vector = embed(texts[position], args.dims)
+        started = time.perf_counter()
+        hits = index.query(vector, k=10, exclude=ids[position])
+        samples.append((time.perf_counter() - started) * 1000)
+    print(f"top-10 query p50={statistics.median(samples):.2f}ms max={max(samples):.2f}ms")
+
+    # Near-duplicate recall: a lightly edited copy should rank its original first
+    position = rng.randrange(args.count)
+    words = texts[position].split()
+    words[::10] = ["um"] * len(words[::10])
+    hits = index.query(embed(" ".join(words), args.dims), k=1)
+    print(f"edited copy -> top hit is original: {hits[0][0] == ids[position]} (sim={hits[0][1]:.3f})")
+
+    started = time.perf_counter()
+    reloaded = SimilarityIndex(directory, args.dims).load()
+    print(f"reload {reloaded} vectors from disk: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Cold-start import benchmark.
+
+Imports ``app.main`` in fresh interpreters with ``python -X importtime``
+and reports the median total import time, the heaviest top-level
+packages, and whether any lazily loaded dependency (LangChain, the
+Gemini SDK) was pulled in at startup. Exits non-zero if a lazy module was
+imported or the median exceeds ``--budget-ms``.
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup --runs 5 --budget-ms 1500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# Packages that must only be imported when their adapter is first used
+LAZY_PACKAGES = ("langchain", "langchain_core", "langchain_google_genai", "google.genai")
+
+PROBE = (
+    "import sys, json; import app.main; "
+    "print(json.dumps(sorted(m for m in sys.modules if m.startswith({prefixes!r}))))"
+)
+
+
+def run_once() -> Tuple[float, Dict[str, float], List[str]]:
+    """Import app.main in a fresh interpreter.
+
+    Returns:
+        (total ms, cumulative ms per top-level package, lazy modules loaded)
+    """
+    env = dict(os.environ, DEBUG="false")
+    code = PROBE.format(prefixes=LAZY_PACKAGES)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, check=True
+    )
+
+    total_us = 0
+    packages: Dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        depth = len(name) - len(name.lstrip())
+        name = name.strip()
+        if depth == 1:  # imported directly by the probe (or app.main itself)
+            total_us += int(cumulative)
+        if name == "app.main":
+            continue
+        top = name.split(".")[0]
+        # Only count the outermost import of each package, not its submodules
+        if depth == 1 or name == top:
+            packages[top] = max(packages[top], int(cumulative) / 1000)
+
+    lazy = json.loads(result.stdout.strip().splitlines()[-1])
+    return total_us / 1000, packages, lazy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to launch")
+    parser.add_argument("--top", type=int, default=10, help="heaviest packages to list")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail above this median")
+    args = parser.parse_args()
+
+    totals = []
+    package_runs: Dict[str, List[float]] = defaultdict(list)
+    lazy_loaded: List[str] = []
+    for _ in range(args.runs):
+        total, packages, lazy = run_once()
+        totals.append(total)
+        for name, ms in packages.items():
+            package_runs[name].append(ms)
+        lazy_loaded = lazy_loaded or lazy
+
+    median = statistics.median(totals)
+    print(f"import app.main: median {median:.0f}ms (min {min(totals):.0f}ms, {args.runs} runs)")
+    print(f"\n{'package':<24} {'median ms':>10}")
+    ranked = sorted(package_runs.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for name, runs in ranked[:args.top]:
+        print(f"{name:<24} {statistics.median(runs):>10.0f}")
+
+    failed = False
+    if lazy_loaded:
+        print(f"\nFAIL: lazy modules imported at startup: {', '.join(lazy_loaded[:5])}")
+        failed = True
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"\nFAIL: median {median:.0f}ms exceeds budget {args.budget_ms:.0f}ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
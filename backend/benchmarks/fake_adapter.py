@@ -0,0 +1,113 @@
+"""Latency-injecting fake model adapter for benchmarks.
+
+Simulates a remote model: every call sleeps for a log-normally distributed
+time (configured by median and p99 per method), a fraction of calls fail
+the way a throttled API does, and transcripts have a configurable length
+with realistic filler words so the cleaner has real work to do.
+
+Benchmarks install it in place of an adapter name, e.g.::
+
+    register_adapter("dummy", "benchmarks.fake_adapter:FakeAdapter")
+    FakeAdapter.profile = FakeProfile(throttle_rate=0.05)
+"""
+import asyncio
+import math
+import random
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from app.adapters import ModelAdapter
+
+# z-score of the 99th percentile of a standard normal
+_Z99 = 2.326
+
+WORDS = (
+    "app platform users habit tracker marketplace subscription insights local "
+    "booking pricing community analytics mobile social budget invoice reminder "
+    "the a to and of we it is for that this with people they would could"
+).split()
+FILLERS = ["um", "uh", "you know", "basically", "like like", "I mean", "actually"]
+TAGS = ["B2C", "SaaS", "Marketplace", "Mobile App", "AI/ML", "Productivity", "Finance", "Social"]
+
+
+class ThrottledError(Exception):
+    """Stand-in for a provider's 429 / resource-exhausted error."""
+
+
+class FakeProfile:
+    """Latency, error and payload settings for FakeAdapter."""
+
+    def __init__(
+        self,
+        latency: Dict[str, Tuple[float, float]] | None = None,
+        throttle_rate: float = 0.0,
+        transcript_words: int = 600,
+        latency_scale: float = 1.0,
+        seed: int | None = None,
+    ):
+        """Configure the simulated model.
+
+        Args:
+            latency: Method name -> (median seconds, p99 seconds)
+            throttle_rate: Fraction of calls raising ThrottledError
+            transcript_words: Words per generated transcript
+            latency_scale: Multiplier applied to every sampled latency
+            seed: RNG seed for reproducible runs
+        """
+        self.latency = latency or {
+            "transcribe_audio": (2.0, 8.0),
+            "summarize_text": (1.2, 5.0),
+            "generate_bullets": (1.0, 4.0),
+            "suggest_tags": (0.8, 3.0),
+        }
+        self.throttle_rate = throttle_rate
+        self.transcript_words = transcript_words
+        self.latency_scale = latency_scale
+        self.rng = random.Random(seed)
+
+    def sample_latency(self, method: str) -> float:
+        median, p99 = self.latency[method]
+        sigma = math.log(p99 / median) / _Z99 if p99 > median else 0.0
+        return median * math.exp(sigma * self.rng.gauss(0.0, 1.0)) * self.latency_scale
+
+
+class FakeAdapter(ModelAdapter):
+    """Adapter that behaves like a slow, occasionally throttled model."""
+
+    profile = FakeProfile()
+
+    def __init__(self, api_key: str | None = None):
+        pass
+
+    async def _call(self, method: str) -> None:
+        profile = self.profile
+        await asyncio.sleep(profile.sample_latency(method))
+        if profile.rng.random() < profile.throttle_rate:
+            raise ThrottledError(f"429 Resource exhausted ({method})")
+
+    async def transcribe_audio(self, audio_path: Path) -> str:
+        await self._call("transcribe_audio")
+        rng = self.profile.rng
+        sentences = []
+        remaining = self.profile.transcript_words
+        while remaining > 0:
+            length = min(remaining, rng.randint(8, 20))
+            words = [rng.choice(WORDS) for _ in range(length)]
+            if rng.random() < 0.5:
+                words.insert(rng.randrange(len(words)), rng.choice(FILLERS))
+            sentences.append(" ".join(words).capitalize() + ".")
+            remaining -= length
+        return " ".join(sentences)
+
+    async def summarize_text(self, text: str) -> str:
+        await self._call("summarize_text")
+        return ". ".join(text.split(". ")[:3])
+
+    async def generate_bullets(self, text: str) -> List[str]:
+        await self._call("generate_bullets")
+        return [sentence[:80] for sentence in text.split(". ")[:5]]
+
+    async def suggest_tags(self, text: str) -> List[Tuple[str, float]]:
+        await self._call("suggest_tags")
+        rng = self.profile.rng
+        return [(tag, round(rng.uniform(0.5, 0.95), 2)) for tag in rng.sample(TAGS, 4)]
@@ -0,0 +1,206 @@
+"""Load generator following the Dashboard's call sequence.
+
+Each virtual user repeats the Dashboard flow: load ideas, create an idea,
+upload audio, transcribe, analyze (bullets and tags), approve and
+reload the list. Users are ramped through stages (e.g. 1, 2, 4 ... 64
+concurrent users). Each stage reports throughput, latency percentiles
+and errors, and the first stage where throughput stops scaling (or the
+error rate passes 1%) is reported as the saturation point.
+
+By default the app runs in-process with the ``replay`` adapter, which
+serves responses and latencies recorded from Gemini (see
+app/adapters/replay_adapter.py). To record a cassette, run the server with
+``REPLAY_MODE=record`` and send requests with adapter "replay". Use
+``--base-url`` to load a running server instead.
+
+Usage (from backend/):
+    python -m benchmarks.loadgen --cassette recordings/gemini.jsonl --stages 1,2,4,8,16,32
+    python -m benchmarks.loadgen --base-url http://localhost:8000 --adapter replay
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.stats import percentile
+
+# Stage is saturated when doubling users adds less than this throughput
+MIN_SCALING_GAIN = 0.10
+MAX_ERROR_RATE = 0.01
+
+
+class Stats:
+    """Latencies and errors per endpoint for one stage."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.requests = 0
+
+    async def call(self, client: httpx.AsyncClient, label: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(client.request(method, url, **kwargs), self.timeout)
+            ok = response.status_code < 400
+        except (httpx.HTTPError, asyncio.TimeoutError):
+            response, ok = None, False
+        self.latencies[label].append(time.perf_counter() - started)
+        self.requests += 1
+        if not ok:
+            self.errors[label] += 1
+            return None
+        return response.json()
+
+
+async def dashboard_flow(client: httpx.AsyncClient, stats: Stats, adapter: str, audio: bytes) -> bool:
+    """One pass through the Dashboard: returns True if every call succeeded."""
+    started = time.perf_counter()
+    if await stats.call(client, "GET /ideas", "GET", "/ideas") is None:
+        return False
+    idea = await stats.call(client, "POST /ideas", "POST", "/ideas", json={})
+    if idea is None:
+        return False
+    idea_id = idea["id"]
+    files = {"file": ("recording.webm", audio, "audio/webm")}
+    if await stats.call(client, "POST /audio", "POST", f"/ideas/{idea_id}/audio", files=files) is None:
+        return False
+    transcript = await stats.call(
+        client, "POST /transcribe", "POST", f"/ideas/{idea_id}/transcribe", json={"adapter": adapter}
+    )
+    if transcript is None:
+        return False
+    body = {"analyses": ["bullets", "tags"], "adapter": adapter}
+    if await stats.call(client, "POST /analyze", "POST", f"/ideas/{idea_id}/analyze", json=body) is None:
+        return False
+    if await stats.call(client, "POST /approve", "POST", f"/ideas/{idea_id}/approve") is None:
+        return False
+    if await stats.call(client, "GET /ideas", "GET", "/ideas") is None:
+        return False
+    stats.latencies["flow"].append(time.perf_counter() - started)
+    return True
+
+
+async def run_stage(
+    client: httpx.AsyncClient, users: int, seconds: float, adapter: str, audio: bytes, timeout: float
+) -> dict:
+    stats = Stats(timeout)
+    deadline = time.perf_counter() + seconds
+
+    async def user() -> None:
+        while time.perf_counter() < deadline:
+            await dashboard_flow(client, stats, adapter, audio)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(users)))
+    elapsed = time.perf_counter() - started
+
+    flows = len(stats.latencies["flow"])
+    errors = sum(stats.errors.values())
+    return {
+        "users": users,
+        "elapsed_s": round(elapsed, 2),
+        "flows": flows,
+        "flows_per_s": round(flows / elapsed, 2),
+        "requests_per_s": round(stats.requests / elapsed, 1),
+        "error_rate": round(errors / stats.requests, 4) if stats.requests else 0.0,
+        "latency_ms": {
+            label: {
+                "p50": round(percentile(values, 50) * 1000, 1),
+                "p95": round(percentile(values, 95) * 1000, 1),
+                "p99": round(percentile(values, 99) * 1000, 1),
+            }
+            for label, values in stats.latencies.items()
+        },
+        "errors": dict(stats.errors),
+    }
+
+
+def find_saturation(stages: List[dict]) -> dict | None:
+    """First stage where adding users stopped paying off."""
+    for previous, stage in zip(stages, stages[1:]):
+        if stage["error_rate"] > MAX_ERROR_RATE:
+            return {"users": stage["users"], "reason": f"error rate {stage['error_rate']:.1%}"}
+        if previous["flows_per_s"] and stage["users"] > previous["users"]:
+            gain = stage["flows_per_s"] / previous["flows_per_s"] - 1
+            if gain < MIN_SCALING_GAIN:
+                return {
+                    "users": previous["users"],
+                    "reason": f"throughput +{gain:.0%} going to {stage['users']} users",
+                }
+    return None
+
+
+def _client(base_url: str | None) -> httpx.AsyncClient:
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, timeout=None)
+    from app.db import init_db
+    from app.main import app
+
+    init_db()
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://loadgen", timeout=None)
+
+
+async def run(args) -> List[dict]:
+    audio = os.urandom(args.audio_kb * 1024)
+    stages = []
+    async with _client(args.base_url) as client:
+        for users in (int(n) for n in args.stages.split(",")):
+            stage = await run_stage(client, users, args.stage_seconds, args.adapter, audio, args.timeout)
+            stages.append(stage)
+            flow = stage["latency_ms"].get("flow", {"p50": 0, "p95": 0})
+            print(f"{users:>5} users  {stage['flows_per_s']:>7.2f} flows/s  {stage['requests_per_s']:>7.1f} req/s  "
+                  f"flow p50 {flow['p50']:>8.0f}ms  p95 {flow['p95']:>8.0f}ms  errors {stage['error_rate']:.1%}")
+    return stages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", help="load a running server instead of the in-process app")
+    parser.add_argument("--adapter", default="replay", help="adapter name sent with model calls")
+    parser.add_argument("--cassette", help="replay cassette (in-process runs)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="scale recorded latencies")
+    parser.add_argument("--stages", default="1,2,4,8,16,32", help="concurrent users per stage")
+    parser.add_argument("--stage-seconds", type=float, default=20.0)
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout (counts as an error)")
+    parser.add_argument("--audio-kb", type=int, default=64, help="uploaded audio size")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    if not args.base_url:
+        workdir = Path(tempfile.mkdtemp(prefix="loadgen_"))
+        os.environ["DATABASE_URL"] = f"sqlite:///{workdir / 'load.db'}"
+        os.environ["SIMILARITY_INDEX_DIR"] = str(workdir / "similarity")
+        os.environ.setdefault("LOG_LEVEL", "WARNING")
+        os.environ["DEBUG"] = "false"
+        os.environ["REPLAY_LATENCY_SCALE"] = str(args.latency_scale)
+        if args.cassette:
+            os.environ["REPLAY_CASSETTE"] = args.cassette
+        cassette = Path(os.environ.get("REPLAY_CASSETTE", "recordings/gemini.jsonl"))
+        if args.adapter == "replay" and not cassette.exists():
+            sys.exit(f"No cassette at {cassette}; record one (REPLAY_MODE=record) or pass --cassette")
+
+    stages = asyncio.run(run(args))
+    saturation = find_saturation(stages)
+    if saturation:
+        print(f"\nSaturation at ~{saturation['users']} users ({saturation['reason']})")
+    else:
+        print("\nNo saturation within the tested stages")
+
+    if args.output:
+        report = {"benchmark": "loadgen", "config": vars(args), "stages": stages, "saturation": saturation}
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
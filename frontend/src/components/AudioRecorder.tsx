@@ -1,9 +1,17 @@
 import { useState, useRef, useEffect, useCallback } from 'react'
 
+export interface LiveTranscript {
+    text: string
+    final: boolean
+    raw?: string
+    transcript_id?: string
+}
+
 interface AudioRecorderProps {
     ideaId?: string
     initialAudioUrl?: string | null
     onAudioUploaded?: (audioPath: string) => void
+    onLiveTranscript?: (transcript: LiveTranscript) => void
     onError?: (error: string) => void
 }
 
@@ -13,8 +21,10 @@ interface AudioRecorderProps {
  * - Shows visual waveform animation while recording
  * - Supports file upload as alternative
  * - Uploads to backend API
+ * - With onLiveTranscript, streams the recording to the server while
+ *   recording and receives the transcript as it is produced
  */
-function AudioRecorder({ ideaId, initialAudioUrl, onAudioUploaded, onError }: AudioRecorderProps) {
+function AudioRecorder({ ideaId, initialAudioUrl, onAudioUploaded, onLiveTranscript, onError }: AudioRecorderProps) {
     const [isRecording, setIsRecording] = useState(false)
     const [isUploading, setIsUploading] = useState(false)
     const [recordingTime, setRecordingTime] = useState(0)
@@ -84,10 +94,37 @@ function AudioRecorder({ ideaId, initialAudioUrl, onAudioUploaded, onError }: Au
         draw()
     }, [isRecording])
 
+    // Open a live transcription session; resolves once the server is ready
+    const openLiveSocket = (id: string) => new Promise<WebSocket>((resolve, reject) => {
+        const socket = new WebSocket(`ws://localhost:8000/ideas/${id}/live`)
+        socket.onopen = () => socket.send(JSON.stringify({ type: 'start', adapter: 'dummy' }))
+        socket.onerror = () => reject(new Error('Live transcription unavailable'))
+        socket.onmessage = (e) => {
+            const message = JSON.parse(e.data)
+            if (message.type === 'ready') {
+                resolve(socket)
+            } else if (message.type === 'partial') {
+                onLiveTranscript?.({ text: message.transcript, final: false })
+            } else if (message.type === 'final') {
+                onLiveTranscript?.({
+                    text: message.transcription_clean,
+                    final: true,
+                    raw: message.transcription_raw,
+                    transcript_id: message.transcript_id,
+                })
+                setUploadStatus('✅ Saved and transcribed while recording')
+            } else if (message.type === 'error') {
+                setUploadStatus(`❌ ${message.detail}`)
+                onError?.(message.detail)
+            }
+        }
+    })
+
     // Start recording
     const startRecording = async () => {
         try {
             const stream = await navigator.mediaDevices.getUserMedia({ audio: true })
+            const liveSocket = onLiveTranscript && ideaId ? await openLiveSocket(ideaId) : null
 
             // Setup audio analyzer for visualization
             const audioContext = new AudioContext()
@@ -104,6 +141,7 @@ function AudioRecorder({ ideaId, initialAudioUrl, onAudioUploaded, onError }: Au
             mediaRecorder.ondataavailable = (e) => {
                 if (e.data.size > 0) {
                     chunksRef.current.push(e.data)
+                    liveSocket?.send(e.data)
                 }
             }
 
@@ -112,6 +150,11 @@ function AudioRecorder({ ideaId, initialAudioUrl, onAudioUploaded, onError }: Au
                 setAudioBlob(blob)
                 setAudioUrl(URL.createObjectURL(blob))
                 stream.getTracks().forEach(track => track.stop())
+                if (liveSocket) {
+                    // The server answers with the final transcript, then closes
+                    liveSocket.send(JSON.stringify({ type: 'stop' }))
+                    setUploadStatus('Finishing transcript...')
+                }
             }
 
             mediaRecorder.start(100)
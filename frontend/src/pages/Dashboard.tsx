@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react'
-import AudioRecorder from '../components/AudioRecorder'
+import AudioRecorder, { LiveTranscript } from '../components/AudioRecorder'
 import TranscriptionEditor from '../components/TranscriptionEditor'
 
 interface Idea {
@@ -85,6 +85,19 @@ function Dashboard() {
         }
     }
 
+    // Transcript streamed while recording
+    const handleLiveTranscript = (live: LiveTranscript) => {
+        setTranscription({
+            transcript_id: live.transcript_id ?? '',
+            transcription_raw: live.raw ?? '',
+            transcription_clean: live.text,
+        })
+        if (live.final) {
+            setWorkflowStep(3)
+            setStatusMessage('✅ Transcription complete!')
+        }
+    }
+
     // Transcribe audio
     const handleTranscribe = async () => {
         if (!currentIdea) return
@@ -111,29 +124,21 @@ function Dashboard() {
 
     // Generate summary
     const handleSummarize = async () => {
-        if (!transcription) return
+        if (!transcription || !currentIdea) return
         setIsLoading(true)
         setStatusMessage('🔄 Generating summary...')
         try {
-            // Get bullets
-            const bulletsRes = await fetch('http://localhost:8000/summaries/bullets', {
+            // Bullets and tags in one call, from the transcript stored server-side
+            const res = await fetch(`http://localhost:8000/ideas/${currentIdea.id}/analyze`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ text: transcription.transcription_clean, adapter: 'dummy' })
+                body: JSON.stringify({ analyses: ['bullets', 'tags'], adapter: 'dummy' })
             })
 
-            // Get tags
-            const tagsRes = await fetch('http://localhost:8000/tags/suggest', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ text: transcription.transcription_clean, adapter: 'dummy' })
-            })
-
-            if (bulletsRes.ok && tagsRes.ok) {
-                const bulletsData = await bulletsRes.json()
-                const tagsData = await tagsRes.json()
-                setSummary({ bullets: bulletsData.bullets, summary: '' })
-                setTags(tagsData.tags)
+            if (res.ok) {
+                const data = await res.json()
+                setSummary({ bullets: data.bullets, summary: '' })
+                setTags(data.tags)
                 setWorkflowStep(4)
                 setStatusMessage('✅ Summary generated!')
             }
@@ -253,6 +258,7 @@ function Dashboard() {
                     ideaId={currentIdea?.id}
                     initialAudioUrl={currentIdea?.audio_path ? `http://localhost:8000/ideas/${currentIdea.id}/audio/download` : null}
                     onAudioUploaded={handleAudioUploaded}
+                    onLiveTranscript={handleLiveTranscript}
                     onError={(err) => setStatusMessage(`❌ ${err}`)}
                 />
             </section>
@@ -82,6 +82,54 @@ export async function uploadAudio(
     }).catch((err) => ({ error: err.message }))
 }
 
+/**
+ * Upload audio in chunks. A failed chunk is retried from the offset the
+ * server reports, so a dropped connection only resends the missing bytes.
+ */
+export async function uploadAudioResumable(
+    ideaId: string,
+    audioBlob: Blob,
+    chunkSize = 1024 * 1024,
+    maxRetries = 5
+): Promise<ApiResponse<unknown>> {
+    const base = `${API_BASE_URL}/ideas/${ideaId}/audio/uploads`
+    try {
+        const created = await fetch(base, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ size: audioBlob.size }),
+        })
+        if (!created.ok) return { error: `HTTP ${created.status}` }
+        const { upload_id: uploadId } = await created.json()
+
+        let offset = 0
+        let retries = 0
+        while (offset < audioBlob.size) {
+            try {
+                const res = await fetch(`${base}/${uploadId}`, {
+                    method: 'PATCH',
+                    headers: { 'Upload-Offset': String(offset) },
+                    body: audioBlob.slice(offset, offset + chunkSize),
+                })
+                if (!res.ok && res.status !== 409) throw new Error(`HTTP ${res.status}`)
+                offset = Number(res.headers.get('Upload-Offset') ?? offset)
+                retries = 0
+            } catch (err) {
+                if (++retries > maxRetries) throw err
+                await new Promise((resolve) => setTimeout(resolve, 500 * 2 ** retries))
+                const state = await fetch(`${base}/${uploadId}`).then((res) => res.json())
+                offset = state.offset
+            }
+        }
+
+        const done = await fetch(`${base}/${uploadId}/complete`, { method: 'POST' })
+        if (!done.ok) return { error: `HTTP ${done.status}` }
+        return { data: await done.json() }
+    } catch (err) {
+        return { error: err instanceof Error ? err.message : 'Upload failed' }
+    }
+}
+
 // ============ Transcription (stubs) ============
 
 export async function transcribeIdea(ideaId: string): Promise<ApiResponse<unknown>> {
@@ -111,3 +159,35 @@ export async function getResearchReport(ideaId: string): Promise<ApiResponse<unk
     // TODO: Implement when backend ready
     return request(`/research/${ideaId}`)
 }
+
+// ============ Live updates ============
+
+export interface IdeaEvent {
+    id: number
+    type: string
+    idea_id: string | null
+    data: Record<string, unknown>
+    timestamp: number
+}
+
+/**
+ * Subscribe to idea events (status changes, transcript updates, research
+ * progress) over Server-Sent Events instead of polling. EventSource
+ * reconnects on its own and resumes from the last event it saw.
+ * Returns a function that closes the subscription.
+ */
+export function subscribeToEvents(
+    onEvent: (event: IdeaEvent) => void,
+    ideaId?: string
+): () => void {
+    const query = ideaId ? `?idea_id=${ideaId}` : ''
+    const source = new EventSource(`${API_BASE_URL}/events${query}`)
+    const handle = (message: MessageEvent) => onEvent(JSON.parse(message.data) as IdeaEvent)
+    const types = [
+        'idea.created', 'idea.status', 'idea.deleted', 'audio.updated', 'transcript.updated',
+        'research.section', 'research.completed', 'eager.started', 'eager.ready', 'eager.failed',
+        'stream.lagged',
+    ]
+    types.forEach((type) => source.addEventListener(type, handle as EventListener))
+    return () => source.close()
+}